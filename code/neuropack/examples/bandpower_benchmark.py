@@ -0,0 +1,49 @@
+"""Compare band power extraction using per-channel masks against the precomputed averaging matrix of PowerBands.
+
+Usage: python bandpower_benchmark.py [num_epochs]
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+
+sys.path.append("../")
+
+from neuropack.benchmarking import generate_synthetic_dataset
+from neuropack.container import EpochArray
+from neuropack.feature_extraction import BandpowerModel
+
+
+def masked_band_powers(power: np.ndarray, freqs: np.ndarray) -> np.ndarray:
+    # Previous implementation: boolean masks for each channel and band
+    features = []
+    for ch_ps in power:
+        alpha = np.mean(np.sort(ch_ps[(freqs > 10) & (freqs <= 13)]))
+        beta = np.mean(np.sort(ch_ps[(freqs > 13) & (freqs <= 30)]))
+        features.append([alpha, beta])
+    return np.concatenate(features)
+
+
+def benchmark(num_epochs: int, repeats: int = 5) -> None:
+    events = generate_synthetic_dataset(1, 2 * num_epochs)[0].template_epochs
+    power, freqs = EpochArray.from_events(events).power_spectrum()
+    model = BandpowerModel()
+
+    start = perf_counter()
+    for _ in range(repeats):
+        expected = np.stack([masked_band_powers(x, freqs) for x in power])
+    masked = (perf_counter() - start) / repeats
+
+    start = perf_counter()
+    for _ in range(repeats):
+        result = model.bands.band_powers(power, freqs).reshape(len(power), -1)
+    kernel = (perf_counter() - start) / repeats
+
+    if not np.allclose(result, expected):
+        raise Exception("Band powers differ")
+    print(f"Masks: {num_epochs / masked:.0f} epochs/s")
+    print(f"Kernel: {num_epochs / kernel:.0f} epochs/s ({masked / kernel:.2f}x)")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,37 @@
+"""Compare serial and parallel throughput of PreprocessingPipeline.apply on a synthetic 50-participant dataset.
+
+Usage: python preprocessing_benchmark.py [max_workers]
+"""
+import sys
+from time import perf_counter
+
+sys.path.append("../")
+
+from neuropack.benchmarking import generate_synthetic_dataset
+from neuropack.preprocessing import (BandpassFilter, DetrendFilter,
+                                     ExecutionMode, NotchFilter,
+                                     PreprocessingPipeline)
+
+
+def benchmark(mode: ExecutionMode, max_workers: int = None) -> float:
+    participants = generate_synthetic_dataset(50, 40)
+    epochs = [ev for p in participants for ev in p.template_epochs +
+              p.authentication_epochs]
+    pipeline = PreprocessingPipeline(
+        DetrendFilter(),
+        NotchFilter(50, 256),
+        BandpassFilter(1, 30, 256))
+
+    start = perf_counter()
+    pipeline.apply(epochs, mode=mode, max_workers=max_workers)
+    return len(epochs) / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    serial = benchmark(ExecutionMode.Serial)
+    print(f"{ExecutionMode.Serial.name}: {serial:.0f} epochs/s")
+    for mode in (ExecutionMode.Thread, ExecutionMode.Process):
+        throughput = benchmark(mode, max_workers)
+        print(
+            f"{mode.name}: {throughput:.0f} epochs/s ({throughput / serial:.2f}x)")
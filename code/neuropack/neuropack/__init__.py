@@ -6,12 +6,11 @@ from typing import Callable, List, Optional, Tuple, Union
 import numpy as np
 from numpy.typing import NDArray
 
-from .container import EEGContainer, EventContainer
+from .container import EEGContainer, EpochArray, EventContainer
 from .devices.base import DeviceBase
 from .feature_extraction import *
-from .preprocessing import PreprocessingPipeline
+from .preprocessing import PreprocessingPipeline, StreamingPipeline
 from .tasks.base import PersistentTaskBase
-from .utils import osum
 from .utils.logging import AuthLogger
 
 
@@ -169,7 +168,8 @@ class KeyWave():
                  before_event_time_ms: int = 200,
                  after_event_time_ms: int = 800,
                  template_mode: TemplateMode = TemplateMode.AverageTemplate,
-                 similarity_mode: SimilarityMode = SimilarityMode.AverageSimilarity) -> None:
+                 similarity_mode: SimilarityMode = SimilarityMode.AverageSimilarity,
+                 streaming_pipeline: Optional[StreamingPipeline] = None) -> None:
         """Constructor for KeyWave verification system. A prototype brainwave-based verification system based on ERPs.
         KeyWave supports a continuous authentication mode, in which a person is first authenticated or identified using their brainwaves.
         Following this, the person's BCI is effectively transformed into a hardware token that continuously proves the user's identity.
@@ -199,6 +199,8 @@ class KeyWave():
         :type template_mode: TemplateMode, optional
         :param similarity_mode: Similarity mode for multiple samples defaults to SimilarityMode.AverageSimilarity
         :type similarity_mode: SimilarityMode, optional
+        :param streaming_pipeline: Causal pipeline applied to data while it is recorded, e.g., a highpass filter. Recorded epochs are then already filtered when the task ends, and preprocessing_pipeline only has to contain the remaining steps, defaults to None
+        :type streaming_pipeline: Optional[StreamingPipeline], optional
         """
         assert isinstance(device, DeviceBase)
         assert isinstance(preprocessing_pipeline, PreprocessingPipeline)
@@ -219,6 +221,7 @@ class KeyWave():
         self.after_event_time_ms = after_event_time_ms
         self.template_mode = template_mode
         self.similarity_mode = similarity_mode
+        self.streaming_pipeline = streaming_pipeline
 
     def reset(self):
         """Resets system to initial state. Should be done if continuous authentication is being used.
@@ -226,20 +229,26 @@ class KeyWave():
         self.last_id = None
         self.last_auth = 0
 
-    def configure_logging(self, event_logging: bool, file_logging: bool):
+    def configure_logging(
+            self,
+            event_logging: bool,
+            file_logging: bool,
+            binary_recordings: bool = False):
         """Configure logging behavior for authentication system.
 
         :param event_logging: If set to true, system performs logging. Else not.
         :type event_logging: bool
         :param file_logging: If true, system logs recorded data to file. Else not.
         :type file_logging: bool
+        :param binary_recordings: If true, recorded data is logged in binary instead of csv format. defaults to False
+        :type binary_recordings: bool, optional
         """
         if event_logging:
             self.logger.start_logging()
         else:
             self.logger.stop_logging()
 
-        self.logger.configure_file_logging(file_logging)
+        self.logger.configure_file_logging(file_logging, binary_recordings)
 
     def authenticate(
             self,
@@ -536,14 +545,14 @@ class KeyWave():
         if mode in [
                 TemplateMode.AverageAndSingleTemplates,
                 TemplateMode.AverageTemplate]:
-            avg = osum(events) / len(events)
+            avg = EpochArray.from_events(events).mean()
             templates.append(self.feature_extraction.extract_features(avg))
 
         if mode in [
                 TemplateMode.SingleTemplates,
                 TemplateMode.AverageAndSingleTemplates]:
-            for e in events:
-                templates.append(self.feature_extraction.extract_features(e))
+            templates += list(
+                self.feature_extraction.extract_features_batch(events))
 
         return templates
 
@@ -562,6 +571,8 @@ class KeyWave():
             self.device.channel_names,
             self.device.sample_rate)
         stimuli_times = []
+        if self.streaming_pipeline is not None:
+            self.streaming_pipeline.reset()
 
         start = time()
         self.device.start_stream()
@@ -580,8 +591,16 @@ class KeyWave():
                 raise Exception("Task was stopped early")
 
             # Fetch data from device
-            if self.device.has_data():
-                eeg_container.add_data(self.device.fetch_data())
+            if self.streaming_pipeline is None:
+                if self.device.has_data():
+                    eeg_container.add_data(self.device.fetch_data())
+            else:
+                # Filter all available samples as one chunk
+                samples = []
+                while self.device.has_data():
+                    samples.append(self.device.fetch_data())
+                for sample in self.streaming_pipeline.process_samples(samples):
+                    eeg_container.add_data(sample)
 
         # We are done getting data for given time frame
         self.device.stop_stream()
@@ -598,13 +617,10 @@ class KeyWave():
 
         # Fetch all recorded events. Remove events until all events are of same
         # length.
-        events = []
-        for time_stamp in stimuli_times:
-            event = eeg_container.add_event(
-                time_stamp,
-                self.before_event_time_ms,
-                self.after_event_time_ms)
-            events.append(event)
+        events = eeg_container.add_events(
+            stimuli_times,
+            self.before_event_time_ms,
+            self.after_event_time_ms)
 
         # Events can possibly be shorter than needed. Remove events which do not have
         # enough data points.
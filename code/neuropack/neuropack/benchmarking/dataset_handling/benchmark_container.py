@@ -3,7 +3,7 @@ from typing import List, Tuple
 
 import numpy as np
 
-from ...container import EEGContainer, EventContainer
+from ...container import EEGContainer, EventContainer, batch_avg_snr
 
 
 @dataclass
@@ -19,16 +19,17 @@ class BenchmarkContainer():
         return len(self.authentication_epochs)
 
     def avg_snr(self, channel_names: List[str] = None):
-        return np.mean([x.avg_snr(channel_names=channel_names) for x in self.authentication_epochs] +
-                       [x.avg_snr(channel_names=channel_names) for x in self.template_epochs])
+        return np.mean(batch_avg_snr(self.authentication_epochs + self.template_epochs,
+                                     channel_names=channel_names))
 
     def avg_snr_template(self, channel_names: List[str] = None):
-        return np.mean([x.avg_snr(channel_names=channel_names) for x in self.template_epochs]), np.std(
-            [x.avg_snr(channel_names=channel_names) for x in self.template_epochs])
+        snr = batch_avg_snr(self.template_epochs, channel_names=channel_names)
+        return np.mean(snr), np.std(snr)
 
     def avg_snr_auth(self, channel_names: List[str] = None):
-        return np.mean([x.avg_snr(channel_names=channel_names) for x in self.authentication_epochs]), np.std(
-            [x.avg_snr(channel_names=channel_names) for x in self.authentication_epochs])
+        snr = batch_avg_snr(self.authentication_epochs,
+                            channel_names=channel_names)
+        return np.mean(snr), np.std(snr)
 
     def __str__(self):
         return f"Ident: {self.ident}, Template Epochs: {self.num_template_epochs()}, Authentication Epochs: {self.num_authentication_epochs()}"
@@ -1,10 +1,11 @@
 from itertools import combinations
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
 
-from ...container import EEGContainer, EventContainer
-from ...preprocessing import PreprocessingPipeline
+from ...container import EEGContainer, EpochArray, EventContainer
+from ...preprocessing import (ArtifactRejector, ExecutionMode,
+                              PreprocessingPipeline)
 from ...utils import oavg
 from .benchmark_container import BenchmarkContainer
 
@@ -18,7 +19,8 @@ def load_dataset(id: str,
                                      int] = (100,
                                              500),
                  preprossessing: PreprocessingPipeline = None,
-                 artifact_removal=False):
+                 artifact_removal: Union[bool, ArtifactRejector] = False,
+                 execution_mode: ExecutionMode = ExecutionMode.Serial):
     """ Function to load a dataset into a BenchmarkContainer.
 
     :param id: ID of the participant
@@ -35,31 +37,43 @@ def load_dataset(id: str,
     :type epoch_length: Tuple[int, int]
     :param preprossessing: Preprocessing pipeline to apply to the data
     :type preprossessing: PreprocessingPipeline
-    :param artifact_removal: If true, artifacts will be removed
-    :type artifact_removal: bool
+    :param artifact_removal: If true, epochs containing blinks will be removed. An ArtifactRejector can be passed to use other rejection criteria.
+    :type artifact_removal: Union[bool, ArtifactRejector]
+    :param execution_mode: Execution mode of the preprocessing pipeline. Records are processed one at a time with ExecutionMode.Serial, otherwise all records are loaded and preprocessed at once in parallel
+    :type execution_mode: ExecutionMode
     :return: BenchmarkContainer
     """
     # Create lists to store epochs
     template_epochs = []
     authentication_epochs = []
 
-    # Get template epochs
     enroll_cont = EEGContainer.from_file(
         channel_names, sample_rate, enrollment_record)
 
-    if preprossessing:
-        preprossessing.apply(enroll_cont)
+    if execution_mode == ExecutionMode.Serial:
+        # Load and preprocess one record at a time, so only a single record is
+        # kept in memory
+        if preprossessing:
+            preprossessing.apply(enroll_cont)
+        auth_conts = (EEGContainer.from_file(channel_names, sample_rate, set)
+                      for set in authentication_records)
+    else:
+        # Load all records, and preprocess them at once in parallel
+        auth_conts = [EEGContainer.from_file(channel_names, sample_rate, set)
+                      for set in authentication_records]
+        if preprossessing:
+            preprossessing.apply(
+                [enroll_cont] + auth_conts, mode=execution_mode)
 
+    # Get template epochs
     template_epochs = enroll_cont.get_all_events(
         epoch_length[0], epoch_length[1])[:-1]
     while len(template_epochs[-1]) != len(template_epochs[-2]):
         template_epochs = template_epochs[:-1]
 
     # Get authentication epochs
-    for set in authentication_records:
-        auth_cont = EEGContainer.from_file(channel_names, sample_rate, set)
-
-        if preprossessing:
+    for auth_cont in auth_conts:
+        if preprossessing and execution_mode == ExecutionMode.Serial:
             preprossessing.apply(auth_cont)
 
         # Get all events
@@ -70,11 +84,11 @@ def load_dataset(id: str,
         authentication_epochs += events
 
     if artifact_removal:
-        # Artifcat removal
-        template_epochs = [
-            x for x in template_epochs if not x.contains_blink()]
-        authentication_epochs = [
-            x for x in authentication_epochs if not x.contains_blink()]
+        # Artifact removal, blinks are detected by an absolute threshold of 100
+        rejector = artifact_removal if isinstance(
+            artifact_removal, ArtifactRejector) else ArtifactRejector(absolute=100)
+        template_epochs = rejector.reject(template_epochs)
+        authentication_epochs = rejector.reject(authentication_epochs)
 
     # Return collected epochs
     return BenchmarkContainer(
@@ -83,10 +97,57 @@ def load_dataset(id: str,
         authentication_epochs)
 
 
+def generate_synthetic_dataset(num_participants: int = 50,
+                               num_epochs: int = 100,
+                               channel_names: List[str] = [
+                                   "TP9", "AF7", "AF8", "TP10"],
+                               sample_rate: int = 256,
+                               epoch_length: Tuple[int, int] = (100, 500),
+                               seed: int = 0) -> List[BenchmarkContainer]:
+    """Function to generate a synthetic dataset, e.g., for benchmarking throughput of preprocessing and feature extraction.
+    Epochs contain gaussian noise and a participant specific P300 like deflection. Half of the epochs of each participant are
+    template epochs, the other half authentication epochs.
+
+    :param num_participants: Number of participants
+    :type num_participants: int
+    :param num_epochs: Number of epochs per participant
+    :type num_epochs: int
+    :param channel_names: List of channel names
+    :type channel_names: List[str]
+    :param sample_rate: Sample rate of the EEG data
+    :type sample_rate: int
+    :param epoch_length: Length of the epochs in ms
+    :type epoch_length: Tuple[int, int]
+    :param seed: Seed of the random number generator
+    :type seed: int
+    :return: List of BenchmarkContainer
+    :rtype: List[BenchmarkContainer]
+    """
+    rng = np.random.default_rng(seed)
+    before = (epoch_length[0] * sample_rate) // 1000
+    after = (epoch_length[1] * sample_rate) // 1000 + 1
+    timestamps = (np.arange(before + after) - before) / sample_rate
+
+    participants = []
+    for i in range(num_participants):
+        # Participant specific amplitude and latency of the deflection
+        amplitude = rng.uniform(2, 10, size=(len(channel_names), 1))
+        latency = rng.uniform(0.25, 0.4)
+        erp = amplitude * np.exp(-((timestamps - latency) / 0.05) ** 2)
+
+        signals = erp + rng.normal(scale=5, size=(num_epochs, len(channel_names), len(timestamps)))
+        epochs = [EventContainer(channel_names, sample_rate, x, timestamps.copy())
+                  for x in signals]
+        participants.append(BenchmarkContainer(
+            str(i), epochs[:num_epochs // 2], epochs[num_epochs // 2:]))
+    return participants
+
+
 def extract_features(
         participant_data: List[BenchmarkContainer],
         model,
-        tuple_size=2):
+        tuple_size=2,
+        block_size=1024):
     """ Function to extract features from a list of BenchmarkContainer objects using a given model.
     The features are extracted from tuples of authentication epochs. Paired authentication epochs are
     averaged and then the features are extracted from the averaged epoch.
@@ -97,12 +158,30 @@ def extract_features(
     :type model: Model
     :param tuple_size: Size of the tuples to extract features from
     :type tuple_size: int
+    :param block_size: Number of averaged tuples passed to the model at once
+    :type block_size: int
     :return: List of extracted features
     :rtype: List[np.ndarray]"""
     samples = []
     for i in participant_data:
         epochs = [x for x in i.authentication_epochs]
-        comb = combinations(epochs, tuple_size)
-        for j in comb:
-            samples.append(model.extract_features(oavg(j)))
+        # Participants without a single tuple of epochs don't yield features
+        if len(epochs) == 0 or len(epochs) < tuple_size:
+            continue
+        if len(set(len(x) for x in epochs)) > 1:
+            comb = combinations(epochs, tuple_size)
+            for j in comb:
+                samples.append(model.extract_features(oavg(j)))
+            continue
+
+        # Average all tuples by indexing the stacked epochs, and extract features
+        # of a block of averaged tuples at once
+        stacked = EpochArray.from_events(epochs)
+        comb = np.array(list(combinations(range(len(epochs)), tuple_size)),
+                        dtype=np.intp).reshape(-1, tuple_size)
+        for start in range(0, len(comb), block_size):
+            block = comb[start:start + block_size]
+            averaged = EpochArray(stacked.channel_names, stacked.sample_rate,
+                                  stacked.signals[block].mean(axis=1), stacked.timestamps[0])
+            samples += list(model.extract_features_batch(averaged))
     return samples
@@ -1,19 +1,164 @@
-import copy
-import csv
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy.typing import NDArray
-from scipy.fft import fft, fftfreq
+from scipy.fft import rfft, rfftfreq
 
 from .devices.base import BCISignal
 from .utils import osum
+from .utils.binary_format import read_recording, write_recording
+from .utils.buffer import SignalBuffer
+from .utils.recording_writer import RecordingWriter
+
+
+@lru_cache(maxsize=64)
+def frequency_axis(num_samples: int, sample_rate: int) -> NDArray:
+    """Frequencies of the power spectrum of a signal. Results are cached for each combination of
+    signal length and sample rate and returned read-only.
+
+    :param num_samples: Number of samples of the signal.
+    :type num_samples: int
+    :param sample_rate: Sample rate of the signal.
+    :type sample_rate: int
+    :return: Frequency of each entry of the power spectrum.
+    :rtype: NDArray
+    """
+    xf = rfftfreq(num_samples, 1 / sample_rate)[:num_samples // 2]
+    xf.flags.writeable = False
+    return xf
+
+
+def compute_power_spectrum(signals: NDArray,
+                           sample_rate: int) -> Tuple[NDArray, NDArray]:
+    """Calculates the power spectrum of signals along the last axis with a single real valued Fast Fourier Transformation.
+    Signals can have any number of leading dimensions, e.g., channels x samples or events x channels x samples.
+
+    :param signals: Signals to transform.
+    :type signals: NDArray
+    :param sample_rate: Sample rate of the signals.
+    :type sample_rate: int
+    :return: Tuple of power spectrum, with the last axis containing frequencies instead of samples, and frequencies.
+    :rtype: Tuple[NDArray, NDArray]
+    """
+    signals = np.asarray(signals, dtype=np.float64)
+    N = signals.shape[-1]
+    yf = rfft(signals, axis=-1)[..., :N // 2]
+    return 2.0 / N * np.abs(yf), frequency_axis(N, sample_rate)
+
+
+def compute_snr(signals: NDArray,
+                timestamps: NDArray,
+                signal_range: Tuple[int, int] = (250, 400),
+                use_absolutes: bool = False) -> NDArray:
+    """Estimates the signal-to-noise ratio along the last axis by dividing the peak amplitude in the signal range by the
+    standard deviation of the full epoch. Signals can have any number of leading dimensions, e.g., channels x samples or
+    events x channels x samples. Bounds of the signal range are resolved once for each row of timestamps and all
+    channels and events are processed in one array operation.
+
+    :param signals: Signals of shape [events x] channels x samples.
+    :type signals: NDArray
+    :param timestamps: Timestamps of shape samples or events x samples.
+    :type timestamps: NDArray
+    :param signal_range: Time range in which signal should appear. E.g. for P300 250-400ms -> (250, 400)
+    :type signal_range: Tuple[int, int]
+    :param use_absolutes: If true, the absolute value of the signal is used to calculate the peak amplitude, defaults to False
+    :type use_absolutes: bool, optional
+    :return: Array of shape [events x] channels containing the snr.
+    :rtype: NDArray
+    """
+    signals = np.asarray(signals, dtype=np.float64)
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+
+    # Index of nearest timestamp for both bounds, one pair per row of timestamps
+    bounds = np.array(signal_range, dtype=np.float64) / 1000
+    nearest = np.abs(timestamps[..., None] - bounds).argmin(axis=-2)
+    starts, stops = nearest[..., 0], nearest[..., 1]
+
+    window = np.abs(signals) if use_absolutes else signals
+    if np.all(starts == starts.flat[0]) and np.all(stops == stops.flat[0]):
+        peak = window[..., int(starts.flat[0]):int(stops.flat[0])].max(axis=-1)
+    else:
+        # Bounds differ between events, mask samples outside of each signal range
+        index = np.arange(signals.shape[-1])
+        mask = (index >= starts[..., None]) & (index < stops[..., None])
+        if mask.ndim < window.ndim:
+            mask = mask[..., None, :]
+        peak = np.max(window, axis=-1, where=mask, initial=-np.inf)
+
+    return peak / signals.std(axis=-1)
+
+
+def batch_avg_snr(events: List["EventContainer"],
+                  channel_names: List[str] = None,
+                  signal_range: Tuple[int, int] = (250, 400),
+                  use_absolutes: bool = False) -> NDArray:
+    """Calculates the average snr of many EventContainers at once, see EventContainer.avg_snr. Events of equal
+    length are stacked and processed together.
+
+    :param events: EventContainers to calculate the snr for. All must have the same channels.
+    :type events: List[EventContainer]
+    :param channel_names: List of channel names for which the snr should be calculated. If None, all channels are used.
+    :type channel_names: List[str], defaults to None
+    :param signal_range: Time range in which signal should appear. E.g. for P300 250-400ms -> (250, 400)
+    :type signal_range: Tuple[int, int]
+    :param use_absolutes: If true, the absolute value of the signal is used to calculate the peak amplitude, defaults to False
+    :type use_absolutes: bool, optional
+    :return: Average snr of each event, in the order of the given events.
+    :rtype: NDArray
+    """
+    result = np.empty(len(events), dtype=np.float64)
+    groups = {}
+    for i, ev in enumerate(events):
+        groups.setdefault(len(ev), []).append(i)
+
+    for indices in groups.values():
+        epochs = EpochArray.from_events([events[i] for i in indices])
+        result[indices] = epochs.avg_snr(
+            channel_names, signal_range, use_absolutes)
+    return result
+
+
+class ChannelLookup():
+    __slots__ = "_channel_names", "_channel_map"
+
+    @property
+    def channel_names(self) -> List[str]:
+        return self._channel_names
+
+    @channel_names.setter
+    def channel_names(self, value: List[str]):
+        """Set channel names. Invalidates the cached mapping from channel names to indices.
+        """
+        self._channel_names = value
+        self._channel_map = None
+
+    def channel_index(self, *channel_names: str) -> List[int]:
+        """Get indices of channels. Indices are looked up in a mapping from channel names to indices, which
+        is built on first use and rebuilt whenever channel_names is assigned.
+
+        :param channel_names: Channel names to look up.
+        :type channel_names: str
+        :raises Exception: Unknown channel name.
+        :return: Index of each channel.
+        :rtype: List[int]
+        """
+        if self._channel_map is None:
+            self._channel_map = {}
+            for i, ch in enumerate(self._channel_names):
+                self._channel_map.setdefault(ch, i)
+
+        try:
+            return [self._channel_map[ch] for ch in channel_names]
+        except (KeyError, TypeError):
+            raise Exception("No channel with that name")
 
 
-class AbstractContainer(ABC):
-    __slots__ = "channel_names", "signals", "sample_rate", "timestamps"
+class AbstractContainer(ChannelLookup, ABC):
+    __slots__ = "signals", "sample_rate", "timestamps", "_spectrum"
 
     def __init__(
             self,
@@ -32,6 +177,7 @@ class AbstractContainer(ABC):
         :param timestamps: List of timestamps. Each timestamp is a float.
         :type timestamps: Union[List[float], NDArray]
         """
+        self._spectrum = None
         self.channel_names = channel_names
         self.sample_rate = sample_rate
         self.signals = signals
@@ -59,21 +205,33 @@ class AbstractContainer(ABC):
         """
         pass
 
-    def power_spectrum(self) -> List[NDArray]:
+    def power_spectrum(self, memoize: bool = False) -> List[NDArray]:
         """Calculates the power spectrum over all channels using
-        Fast Fourier Transformation.
+        Fast Fourier Transformation. All channels are transformed at once.
 
+        :param memoize: If true, the spectrum is kept in the container and returned by later calls with memoize set. The kept spectrum is dropped as soon as signals are changed through the container, e.g., by assigning a channel or applying a filter. Changes made directly to signal arrays are not detected, call invalidate_spectrum in that case. Defaults to False
+        :type memoize: bool, optional
         :return: List containing real parts of frequency domain for each signal. The last entry in the returned list is a list containing the frequencies.
         :rtype: List[NDArray]
         """
-        fin = []
-        N = len(self)
-        xf = fftfreq(N, 1 / self.sample_rate)[:N // 2]
-        for ch in self.channel_names:
-            yf = fft(self[ch])
-            fin.append(2.0 / N * np.abs(yf[0:N // 2]))
-        fin.append(xf)
-        return fin
+        if memoize and self._spectrum is not None:
+            return list(self._spectrum)
+
+        signals = np.asarray(self.signals, dtype=np.float64).reshape(
+            len(self.channel_names), len(self))
+        power, freqs = compute_power_spectrum(signals, self.sample_rate)
+        if memoize:
+            power.flags.writeable = False
+        fin = list(power) + [freqs]
+
+        if memoize:
+            self._spectrum = fin
+        return list(fin)
+
+    def invalidate_spectrum(self):
+        """Drop the power spectrum kept by power_spectrum(memoize=True).
+        """
+        self._spectrum = None
 
     def plot_ch(self, *channel_names: List[str]):
         """Plot stored channel data using matplotlib.
@@ -145,37 +303,39 @@ class AbstractContainer(ABC):
         plt.close()
 
     def __getitem__(self, key):
-        if type(key) not in [str, int]:
-            raise Exception("Unsupported index type")
+        if isinstance(key, (list, tuple)):
+            rows = [self.__channel_row(k) for k in key]
+            if isinstance(self.signals, np.ndarray):
+                return self.signals[rows]
+            return np.array([self.signals[i] for i in rows])
 
-        if isinstance(key, int):
-            if key >= len(self.channel_names) or key < 0:
-                raise Exception("Index out of bound")
-            key = self.channel_names[key]
+        return self.signals[self.__channel_row(key)]
 
-        if key not in self.channel_names:
-            raise Exception("No channel with that name")
+    def __setitem__(self, key, value):
+        self.signals[self.__channel_row(key)] = value
+        self._spectrum = None
 
-        i = self.channel_names.index(key)
-        return self.signals[i]
+    def __channel_row(self, key) -> int:
+        """Resolve a channel name or numerical index to the index of the channel in signals.
 
-    def __setitem__(self, key, value):
+        :param key: Channel name or numerical index.
+        :type key: Union[str, int]
+        :raises Exception: Unsupported index type, index out of bound, or unknown channel name.
+        :return: Index of channel.
+        :rtype: int
+        """
         if type(key) not in [str, int]:
             raise Exception("Unsupported index type")
 
         if isinstance(key, int):
             if key >= len(self.channel_names) or key < 0:
                 raise Exception("Index out of bound")
-            key = self.channel_names[key]
-
-        if key not in self.channel_names:
-            raise Exception("No channel with that name")
+            return key
 
-        i = self.channel_names.index(key)
-        self.signals[i] = value
+        return self.channel_index(key)[0]
 
     def __len__(self):
-        if self.signals and len(self.signals) > 0:
+        if self.signals is not None and len(self.signals) > 0:
             return len(self.signals[0])
         return 0
 
@@ -186,7 +346,8 @@ class EventContainer(AbstractContainer):
             channel_names: List[str],
             sample_rate: int,
             signals: Union[List[List[float]], List[NDArray]],
-            timestamps: Union[List[float], NDArray]) -> None:
+            timestamps: Union[List[float], NDArray],
+            shared: bool = False) -> None:
         """Container for event data.
 
         :param channel_names: List of channel names.
@@ -197,6 +358,8 @@ class EventContainer(AbstractContainer):
         :type signals: Union[List[List[float]], List[NDArray]]
         :param timestamps: List of timestamps. Each timestamp is a float.
         :type timestamps: Union[List[float], NDArray]
+        :param shared: If true, signals are a view on data owned by another container, e.g., a buffered EEGContainer. Shared signals are read-only and are copied on the first write through the container, so the owner is never modified. Defaults to False.
+        :type shared: bool, optional
         """
         if isinstance(signals[0], list):
             signals = [np.array(x) for x in signals]
@@ -204,6 +367,33 @@ class EventContainer(AbstractContainer):
             timestamps = np.array(timestamps)
         super().__init__(channel_names, sample_rate, signals, timestamps)
 
+        if shared:
+            self._signals = np.asarray(signals).view()
+            self._signals.flags.writeable = False
+            self._shared = True
+
+    @property
+    def signals(self) -> Union[List[NDArray], NDArray]:
+        return self._signals
+
+    @signals.setter
+    def signals(self, value: Union[List[NDArray], NDArray]):
+        self._signals = value
+        self._shared = False
+        self._spectrum = None
+
+    @property
+    def shared(self) -> bool:
+        """True, if signals are a read-only view on data owned by another container."""
+        return self._shared
+
+    def __setitem__(self, key, value):
+        # Copy shared signals before first write
+        if self._shared:
+            self._signals = np.array(self._signals)
+            self._shared = False
+        super().__setitem__(key, value)
+
     def average_ch(self, *channel_selection: Optional[List[str]]):
         """Create EventContainer with an averaged channel.
 
@@ -257,23 +447,22 @@ class EventContainer(AbstractContainer):
             np.copy(
                 self.timestamps))
 
-    def contains_blink(self, *channel_names) -> bool:
+    def contains_blink(self, *channel_names, threshold: float = 100) -> bool:
         """Checks if EventContainer contains a blink. This is done by
-        checking if a threshold of 100 is reached. If True, signals
-        in EventContainer include a blink.
+        checking if a threshold is reached. If True, signals
+        in EventContainer include a blink. For other rejection criteria and many epochs at once see preprocessing.ArtifactRejector.
 
         :param channel_names: Name of the channel for which the snr should be calculated.
         :type channel_names: *list, optional
+        :param threshold: Threshold for blink detection, defaults to 100
+        :type threshold: float, optional
         :return: True if blink is contained, False otherwise.
         :rtype: bool
         """
         if not channel_names:
             channel_names = self.channel_names
 
-        for ch in self.channel_names:
-            if np.abs(self[ch]).max() > 100:
-                return True
-        return False
+        return bool(np.abs(self[list(channel_names)]).max() > threshold)
 
     def snr(self, signal_range: Tuple[int, int] = (
             250, 400), use_absolutes: bool = False) -> dict:
@@ -288,22 +477,9 @@ class EventContainer(AbstractContainer):
         :return: Dictionary with channel names as keys and snr as values.
         :rtype: dict
         """
-        def find_nearest(array, value):
-            return int((np.abs(array - value)).argmin())
-
-        def peak_amplitude(signal, start, stop):
-            return np.max(np.abs(signal[start:stop])
-                          if use_absolutes else signal[start:stop])
-
-        start = find_nearest(self.timestamps, signal_range[0] / 1000)
-        stop = find_nearest(self.timestamps, signal_range[1] / 1000)
-        return {
-            ch: peak_amplitude(
-                self[ch],
-                start,
-                stop) /
-            np.std(
-                self[ch]) for ch in self.channel_names}
+        snr = compute_snr(self.signals, self.timestamps,
+                          signal_range, use_absolutes)
+        return dict(zip(self.channel_names, snr.tolist()))
 
     def avg_snr(self, channel_names: list = None, signal_range: Tuple[int, int] = (
             250, 400), use_absolutes: bool = False) -> float:
@@ -318,11 +494,12 @@ class EventContainer(AbstractContainer):
         :return: Average snr over all channels.
         :rtype: float
         """
-        snr = self.snr(signal_range, use_absolutes)
         if not channel_names:
             channel_names = self.channel_names
 
-        return np.mean([snr[ch] for ch in channel_names])
+        signals = self[list(channel_names)]
+        return np.mean(compute_snr(signals, self.timestamps,
+                                   signal_range, use_absolutes))
 
     def __add__(self, other):
         assert set(self.channel_names) == set(other.channel_names)
@@ -337,6 +514,35 @@ class EventContainer(AbstractContainer):
             new_signals,
             self.timestamps)
 
+    def __iadd__(self, other):
+        assert set(self.channel_names) == set(other.channel_names)
+        assert len(self.signals[0]) == len(other.signals[0])
+        assert self.sample_rate == other.sample_rate
+
+        # Accumulate into one owned float array, channel by channel
+        if self._shared or not isinstance(
+                self._signals, np.ndarray) or self._signals.dtype != np.float64:
+            self._signals = np.array(self._signals, dtype=np.float64)
+            self._shared = False
+
+        for i, c in enumerate(self.channel_names):
+            self._signals[i] += other[c]
+        self._spectrum = None
+        return self
+
+    def __sub__(self, other):
+        assert set(self.channel_names) == set(other.channel_names)
+        assert len(self.signals[0]) == len(other.signals[0])
+        assert self.sample_rate == other.sample_rate
+
+        new_signals = [self[c] - other[c] for c in self.channel_names]
+
+        return EventContainer(
+            self.channel_names,
+            self.sample_rate,
+            new_signals,
+            self.timestamps)
+
     def __truediv__(self, scalar: float):
         if scalar == 0:
             raise Exception("Can't divide by zero.")
@@ -379,8 +585,233 @@ class EventContainer(AbstractContainer):
         return True
 
 
+class EpochArray(ChannelLookup):
+    __slots__ = "sample_rate", "signals", "timestamps"
+
+    @classmethod
+    def from_events(cls, events: List[EventContainer]):
+        """Stack a list of EventContainers into one EpochArray. All EventContainers must have the same channels,
+        sample rate, and length.
+
+        :param events: EventContainers to stack.
+        :type events: List[EventContainer]
+        :raises Exception: EventContainers differ in channels, sample rate, or length.
+        :return: EpochArray containing all events in the given order.
+        :rtype: EpochArray
+        """
+        if len(events) == 0:
+            raise Exception("Can't create EpochArray without events.")
+
+        first = events[0]
+        for ev in events[1:]:
+            if ev.channel_names != first.channel_names or ev.sample_rate != first.sample_rate:
+                raise Exception(
+                    "Events differ in channel names or sample rate.")
+            if len(ev) != len(first):
+                raise Exception("Events differ in length.")
+
+        signals = np.stack([np.asarray(ev.signals, dtype=np.float64)
+                           for ev in events])
+        timestamps = np.stack([np.asarray(ev.timestamps) for ev in events])
+        return cls(first.channel_names, first.sample_rate, signals, timestamps)
+
+    def __init__(
+            self,
+            channel_names: List[str],
+            sample_rate: int,
+            signals: NDArray,
+            timestamps: NDArray) -> None:
+        """Container for many epochs of equal length, stored in one array of shape events x channels x samples.
+        Operations over epochs, e.g., averaging, are performed as single numpy operations. Epochs are expected to
+        be aligned, i.e., centered around their event.
+
+        :param channel_names: List of channel names.
+        :type channel_names: List[str]
+        :param sample_rate: Sample rate of the data.
+        :type sample_rate: int
+        :param signals: Signals of shape events x channels x samples.
+        :type signals: NDArray
+        :param timestamps: Timestamps relative to the event, either of shape samples or events x samples.
+        :type timestamps: NDArray
+        """
+        signals = np.asarray(signals)
+        if signals.ndim != 3 or signals.shape[1] != len(channel_names):
+            raise Exception(
+                "Signals must be of shape events x channels x samples.")
+
+        timestamps = np.asarray(timestamps)
+        if timestamps.ndim == 1:
+            timestamps = np.broadcast_to(
+                timestamps, (signals.shape[0], signals.shape[2]))
+        if timestamps.shape != (signals.shape[0], signals.shape[2]):
+            raise Exception("Timestamps do not match signals.")
+
+        self.channel_names = channel_names
+        self.sample_rate = sample_rate
+        self.signals = signals
+        self.timestamps = timestamps
+
+    def to_events(self) -> List[EventContainer]:
+        """Split EpochArray into EventContainers. Signals of the EventContainers are views on the EpochArray.
+
+        :return: One EventContainer per epoch.
+        :rtype: List[EventContainer]
+        """
+        return [self[i] for i in range(len(self))]
+
+    def select_channels(self, *channel_names: str):
+        """Create EpochArray containing only the selected channels, in the given order.
+
+        :param channel_names: Channels to select.
+        :type channel_names: str
+        :return: EpochArray with selected channels.
+        :rtype: EpochArray
+        """
+        index = self.channel_index(*channel_names)
+        return EpochArray(list(channel_names), self.sample_rate,
+                          self.signals[:, index], self.timestamps)
+
+    def sum(self) -> EventContainer:
+        """Sum over all epochs.
+
+        :return: EventContainer containing the sum of all epochs.
+        :rtype: EventContainer
+        """
+        return EventContainer(self.channel_names, self.sample_rate,
+                              self.signals.sum(axis=0), np.array(self.timestamps[0]))
+
+    def mean(self) -> EventContainer:
+        """Average over all epochs.
+
+        :return: EventContainer containing the average of all epochs.
+        :rtype: EventContainer
+        """
+        return EventContainer(self.channel_names, self.sample_rate,
+                              self.signals.mean(axis=0), np.array(self.timestamps[0]))
+
+    def power_spectrum(self) -> Tuple[NDArray, NDArray]:
+        """Calculates the power spectrum of all epochs and channels with a single Fast Fourier Transformation.
+
+        :return: Tuple of power spectrum of shape epochs x channels x frequencies, and frequencies.
+        :rtype: Tuple[NDArray, NDArray]
+        """
+        return compute_power_spectrum(self.signals, self.sample_rate)
+
+    def average_ch(self, *channel_selection: Optional[List[str]]):
+        """Create EpochArray with an averaged channel. Operation is not performed in place.
+
+        :param channel_selection: Specify channels to average. If None, returns EpochArray with a signal channel, which is the average of all channels. Defaults to None
+        :type channel_selection: Optional[List[str]], optional
+        """
+        if not channel_selection:
+            channel_selection = self.channel_names
+        return self.average_sub_ch(tuple(channel_selection))
+
+    def average_sub_ch(
+            self, *channel_selection: Optional[List[Union[Tuple[str], str]]]):
+        """Create EpochArray containing several averaged channels. Channels in the new EpochArray are
+        made up of specified channels. Each tuple results in one new averaged channel.
+        E.g., the input ("TP9", "TP10"), ("AF9", "AF10") results in EpochArray with two new channels. The first
+        channel is the average of "TP9" and "TP10". If no channels are selected, averages all channels into one.
+
+        :param channel_selection: Specify channels to average.
+        :type channel_selection: Optional[List[Union[Tuple[str], str]]], optional.
+        """
+        if not len(channel_selection):
+            return self.average_ch()
+
+        new_channel_names = []
+        new_signals = []
+        for t in channel_selection:
+            selection = t if isinstance(t, tuple) else [t]
+            index = self.channel_index(*selection)
+            new_channel_names.append("".join(selection))
+            new_signals.append(self.signals[:, index].mean(axis=1))
+
+        return EpochArray(new_channel_names, self.sample_rate,
+                          np.stack(new_signals, axis=1), self.timestamps)
+
+    def snr(self, signal_range: Tuple[int, int] = (
+            250, 400), use_absolutes: bool = False) -> NDArray:
+        """Estimates the signal-to-noise ratio of every channel of every epoch, see EventContainer.snr. The signal range is
+        resolved from the timestamps of each epoch.
+
+        :param signal_range: Time range in which signal should appear. E.g. for for P300 250-400ms -> (250, 400)
+        :type signal_range: Tuple[int, int]
+        :param use_absolutes: If true, the absolute value of the signal is used to calculate the peak amplitude, defaults to False
+        :type use_absolutes: bool, optional
+        :return: Array of shape events x channels containing the snr.
+        :rtype: NDArray
+        """
+        return compute_snr(self.signals, self.timestamps,
+                           signal_range, use_absolutes)
+
+    def avg_snr(self, channel_names: list = None, signal_range: Tuple[int, int] = (
+            250, 400), use_absolutes: bool = False) -> NDArray:
+        """Calculates the average snr over the selected channels for every epoch.
+
+        :param channel_names: List of channel names for which the snr should be calculated. If None, all channels are used.
+        :type channel_names: list, defaults to None
+        :param signal_range: Time range in which signal should appear. E.g. for P300 250-400ms -> (250, 400)
+        :type signal_range: Tuple[int, int]
+        :param use_absolutes: If true, the absolute value of the signal is used to calculate the peak amplitude, defaults to False
+        :type use_absolutes: bool, optional
+        :return: Average snr of each epoch.
+        :rtype: NDArray
+        """
+        signals = self.signals
+        if channel_names:
+            signals = signals[:, self.channel_index(*channel_names)]
+        return compute_snr(signals, self.timestamps,
+                           signal_range, use_absolutes).mean(axis=1)
+
+    def contains_blink(self, *channel_names, threshold: float = 100) -> NDArray:
+        """Checks which epochs contain a blink. An epoch contains a blink, if the absolute value of any
+        selected channel exceeds the threshold.
+
+        :param channel_names: Channels to check. If None, all channels are checked.
+        :type channel_names: *list, optional
+        :param threshold: Threshold for blink detection, defaults to 100
+        :type threshold: float, optional
+        :return: Boolean array, True for each epoch containing a blink.
+        :rtype: NDArray
+        """
+        signals = self.signals
+        if channel_names:
+            signals = signals[:, self.channel_index(*channel_names)]
+        return np.abs(signals).max(axis=(1, 2)) > threshold
+
+    def __getitem__(self, key):
+        """Access epochs or channels. An integer returns the epoch as EventContainer, a channel name returns
+        the channel for all epochs as array of shape events x samples. Slices, integer arrays, and boolean masks
+        return a new EpochArray containing the selected epochs.
+        """
+        if isinstance(key, str):
+            return self.signals[:, self.channel_index(key)[0]]
+
+        if isinstance(key, (int, np.integer)):
+            return EventContainer(self.channel_names, self.sample_rate,
+                                  self.signals[key], self.timestamps[key])
+
+        return EpochArray(self.channel_names, self.sample_rate,
+                          self.signals[key], self.timestamps[key])
+
+    def __len__(self):
+        return self.signals.shape[0]
+
+    def __eq__(self, other):
+        if self.channel_names != other.channel_names:
+            return False
+
+        if self.sample_rate != other.sample_rate:
+            return False
+
+        return np.array_equal(self.timestamps, other.timestamps) and np.array_equal(
+            self.signals, other.signals)
+
+
 class EEGContainer(AbstractContainer):
-    __slots__ = "events"
+    __slots__ = "events", "_buffer", "_signals", "_timestamps", "_writer", "_written", "_block_size", "_retention", "_evicted_events"
 
     @classmethod
     def from_file(
@@ -388,7 +819,8 @@ class EEGContainer(AbstractContainer):
             channel_names: List[str],
             sample_rate: int,
             file: str,
-            event_marker: str = "1"):
+            event_marker: str = "1",
+            buffered: bool = False):
         """Create EEGContainer from data. Data is expected to be in the following format: <timestamp>, <channels>*n, <target marker?>
 
         :param channel_names: List of channel names.
@@ -399,24 +831,123 @@ class EEGContainer(AbstractContainer):
         :type file: str
         :param event_marker: Marker indicating the start of a new event. Defaults to "1".
         :type event_marker: str, optional
+        :param buffered: If true, data is stored in a numpy backed SignalBuffer. Defaults to False.
+        :type buffered: bool, optional
         """
-        t = cls(channel_names, sample_rate)
+        t = cls(channel_names, sample_rate, buffered=buffered)
         t.load_signals(file, event_marker=event_marker)
         return t
 
-    def __init__(self, channel_names: List[str], sample_rate: int) -> None:
+    @classmethod
+    def from_binary(cls, file: str, mmap: bool = True):
+        """Create EEGContainer from a binary recording, see save_binary. Channel names and sample rate are read from the file.
+        Data is stored in a SignalBuffer. If mmap is set, the recording is memory mapped, so opening it is instant and only
+        accessed parts, e.g., epochs, are read from disk.
+
+        :param file: File containing data.
+        :type file: str
+        :param mmap: Map data instead of reading it into memory, defaults to True
+        :type mmap: bool, optional
+        """
+        t = cls([], 0, buffered=True)
+        t.load_binary(file, mmap=mmap)
+        return t
+
+    def __init__(
+            self,
+            channel_names: List[str],
+            sample_rate: int,
+            buffered: bool = False,
+            capacity: int = 1024,
+            retention: Optional[float] = None) -> None:
         """Create EEGContainer containing several channels. Channels are expected to be in the same order as signals added to the container.
 
+        By default, signals are stored as one Python list per channel. If buffered is set, signals and timestamps are stored in a
+        preallocated SignalBuffer instead. In that case signals are exposed as a 2D numpy array of shape channels x samples,
+        timestamps as a 1D numpy array, and channel access returns views on the buffer instead of copies.
+
+        If retention is set, only the last retention seconds of data are kept, e.g., for continuous authentication over hours.
+        The container is buffered in that case and memory stays bounded. Older samples and events before the retained window
+        are evicted as new data is added, see evicted_samples and evicted_events. Events can only be added inside the retained window.
+
         :param channel_names: List of channel names.
         :type channel_names: List[str]
         :param sample_rate: Sample rate in Hz.
         :type sample_rate: int
+        :param buffered: If true, data is stored in a numpy backed SignalBuffer. Defaults to False.
+        :type buffered: bool, optional
+        :param capacity: Number of samples to preallocate if buffered is set. The buffer grows as needed. Defaults to 1024.
+        :type capacity: int, optional
+        :param retention: Duration in seconds of data to keep. If None, all data is kept. Defaults to None.
+        :type retention: Optional[float], optional
         """
+        self._retention = retention
+        self._evicted_events = 0
+        self._buffer = None
         super().__init__(
             channel_names, sample_rate, [
                 list() for _ in range(
                     len(channel_names))], [])
+
+        # Buffer is created after the empty lists were assigned, as assigning
+        # them through the buffer would replace its preallocated storage
+        if retention is not None:
+            self._buffer = SignalBuffer(len(channel_names), max_size=max(
+                int(np.ceil(retention * sample_rate)), 1))
+        elif buffered:
+            self._buffer = SignalBuffer(len(channel_names), capacity)
         self.events = []
+        self._writer = None
+        self._written = 0
+        self._block_size = 0
+
+    @property
+    def buffered(self) -> bool:
+        """True, if data is stored in a SignalBuffer."""
+        return self._buffer is not None
+
+    @property
+    def retention(self) -> Optional[float]:
+        """Duration in seconds of retained data, None if all data is kept."""
+        return self._retention
+
+    @property
+    def evicted_samples(self) -> int:
+        """Number of samples evicted from the retained window so far."""
+        return self._buffer.evicted if self._buffer is not None else 0
+
+    @property
+    def evicted_events(self) -> int:
+        """Number of events evicted from the retained window so far."""
+        return self._evicted_events
+
+    @property
+    def signals(self) -> Union[List[List[float]], NDArray]:
+        if self._buffer is not None:
+            return self._buffer.signals
+        return self._signals
+
+    @signals.setter
+    def signals(self, value: Union[List[List[float]], NDArray]):
+        if self._buffer is not None:
+            self._buffer.signals = value
+        else:
+            self._signals = value
+        self._spectrum = None
+
+    @property
+    def timestamps(self) -> Union[List[float], NDArray]:
+        if self._buffer is not None:
+            return self._buffer.timestamps
+        return self._timestamps
+
+    @timestamps.setter
+    def timestamps(self, value: Union[List[float], NDArray]):
+        if self._buffer is not None:
+            self._buffer.timestamps = value
+        else:
+            self._timestamps = value
+        self._spectrum = None
 
     def add_data(self, rec: BCISignal):
         """Add new measured data point to the container. Data points consist of combinations of
@@ -430,15 +961,31 @@ class EEGContainer(AbstractContainer):
             raise Exception(
                 "Number of signals does not match number of channels provided")
 
-        self.timestamps.append(rec.timestamp)
-        for i in range(len(rec.signals)):
-            self.signals[i].append(rec.signals[i])
+        if self._buffer is not None:
+            evicted = self._buffer.evicted
+            # Write oldest samples before they are evicted
+            if self._writer is not None and self._written == 0 and len(
+                    self._buffer) == self._buffer.max_size:
+                self.__write_pending()
+            self._buffer.append(rec.timestamp, rec.signals)
+            if self._buffer.evicted != evicted:
+                self.__evict(self._buffer.evicted - evicted)
+        else:
+            self.timestamps.append(rec.timestamp)
+            for i in range(len(rec.signals)):
+                self.signals[i].append(rec.signals[i])
+
+        self._spectrum = None
+        if self._writer is not None and len(
+                self.timestamps) - self._written >= self._block_size:
+            self.__write_pending()
 
     def add_event(
             self,
             event_time: int,
             before: int = 50,
-            after: int = 100) -> EventContainer:
+            after: int = 100,
+            view: bool = False) -> EventContainer:
         """Adds an event to the recording. Returns EventContainer containing all data for added event.
 
         :param event_time: Time of event data in the container will be centered around.
@@ -447,9 +994,12 @@ class EEGContainer(AbstractContainer):
         :type before: int
         :param after: Duration in milliseconds after the event to include in EventContainer, defaults to 100
         :type after: int
+        :param view: If true and the container is buffered, signals of the returned EventContainer are a copy-on-write view on the buffer instead of a copy, defaults to False
+        :type view: bool, optional
         :return: EventContainer containing all channels centered around event_time.
         :rtype: EventContainer
         """
+        self.__check_retained([event_time])
         event = self.__find_closest_timestamp(event_time)
         event_time = self.timestamps[event]
         if event_time not in self.events:
@@ -465,55 +1015,31 @@ class EEGContainer(AbstractContainer):
         new_timestamps = np.array(
             self.timestamps[before_samples: after_samples])
         new_timestamps -= event_time
-        new_signals = [np.array(x[before_samples: after_samples])
-                       for x in self.signals]
+        shared = view and self._buffer is not None
+        if shared:
+            new_signals = self._buffer.signals[:, before_samples: after_samples]
+        else:
+            new_signals = [np.array(x[before_samples: after_samples])
+                           for x in self.signals]
 
         # Create new EventContainer
         return EventContainer(
             self.channel_names,
             self.sample_rate,
             new_signals,
-            new_timestamps)
+            new_timestamps,
+            shared=shared)
 
     def average_ch(self, *channel_selection: Optional[List[str]]):
-        """Create EEGContainer with an averaged channel.
+        """Create EEGContainer with an averaged channel. The returned EEGContainer is buffered.
 
         :param channel_selection: Specify channels to average. If None, returns EEGContainer with a signal channel, which is the average of all channels. Defaults to None
         :type channel_selection: Optional[List[str]], optional
         """
-        def s_osum(x):
-            if len(x) == 0:
-                return None
-            if len(x) == 1:
-                if isinstance(x[0], list):
-                    return np.array(x[0])
-                return x
-            s = copy.deepcopy(x[0])
-            for o in x[1:]:
-                s = np.add(s, o)
-            return s
-
         # If no channels are specified, average all channels
         if not channel_selection:
-            # Average all channels
-            new_channel_name = ["".join(self.channel_names)]
-            new_signal = [s_osum(self.signals) / len(self.signals)]
-        else:
-            # Average specified channels
-            new_channel_name = ["".join(channel_selection)]
-            selected_signals = [self[ch] for ch in channel_selection]
-            # Average signals
-            new_signal = [s_osum(selected_signals) / len(selected_signals)]
-
-        # Convert to list
-        new_signal = [x.tolist() for x in new_signal]
-
-        # Create new EEGContainer
-        _t = EEGContainer(new_channel_name, self.sample_rate)
-        _t.timestamps = copy.deepcopy(self.timestamps)
-        _t.signals = new_signal
-
-        return _t
+            channel_selection = self.channel_names
+        return self.average_sub_ch(tuple(channel_selection))
 
     def average_sub_ch(
             self, *channel_selection: Optional[List[Union[Tuple[str], str]]]):
@@ -521,62 +1047,192 @@ class EEGContainer(AbstractContainer):
         made up of specified channels. Each tuple results in one new averaged channel.
         E.g., the input ("TP9", "TP10"), ("AF9", "AF10") results in EEGContainer with two new channels. The first
         channel is the average of "TP9" and "TP10". If no channels are selected, averages all channels into one.
+        The returned EEGContainer is buffered.
 
         :param channel_selection: Specify channels to average.
         :type channel_selection: Optional[List[Union[Tuple[str], str]]], optional.
         """
-        def s_osum(x):
-            if len(x) == 0:
-                return None
-            if len(x) == 1:
-                if isinstance(x[0], list):
-                    return np.array(x[0])
-                return x
-            s = copy.deepcopy(x[0])
-            for o in x[1:]:
-                s = np.add(s, o)
-            return s
-
         if not len(channel_selection):
             return self.average_ch()
 
-        new_channel_names = []
-        new_signals = []
+        timestamps = np.array(self.timestamps, dtype=np.float64)
+        signals = np.asarray(self.signals, dtype=np.float64).reshape(
+            len(self.channel_names), len(timestamps))
 
-        for t in channel_selection:
+        new_channel_names = []
+        new_signals = np.empty((len(channel_selection), len(timestamps)))
+        for i, t in enumerate(channel_selection):
             selection = t
             if not isinstance(t, tuple):
                 selection = [t]
-            selected_signals = [self[ch] for ch in selection]
 
             new_channel_names.append("".join(selection))
-            new_signals.append(
-                s_osum(selected_signals) /
-                len(selected_signals))
-
-        # Convert to list
-        new_signals = [x.tolist() for x in new_signals]
+            np.mean(signals[self.channel_index(*selection)],
+                    axis=0, out=new_signals[i])
 
         # Create new EEGContainer
-        _t = EEGContainer(new_channel_names, self.sample_rate)
-        _t.timestamps = copy.deepcopy(self.timestamps)
-        _t.signals = new_signals
+        _t = EEGContainer(new_channel_names, self.sample_rate,
+                          buffered=True, capacity=1)
+        _t._buffer = SignalBuffer.from_arrays(timestamps, new_signals)
 
         return _t
 
-    def get_all_events(self, before: int, after: int) -> List[EventContainer]:
+    def get_all_events(
+            self,
+            before: int,
+            after: int,
+            view: bool = False) -> List[EventContainer]:
         """Get EventContainer representation for all events stored in the container.
 
         :param before: Before duration.
         :type before: int
         :param after: After duration.
         :type after: int
+        :param view: If true and the container is buffered, EventContainers are copy-on-write views on the buffer, defaults to False
+        :type view: bool, optional
         :return: List containing EventContainers for all stored events.
         :rtype: List[EventContainer]
         """
-        return [self.add_event(x, before, after) for x in self.events]
+        return self.add_events(self.events, before, after, view=view)
+
+    def add_events(
+            self,
+            event_times: List[float],
+            before: int = 50,
+            after: int = 100,
+            view: bool = False) -> List[EventContainer]:
+        """Adds several events to the recording at once. Returns one EventContainer per event time, in the same
+        order as given. Results are equal to calling add_event for each event time. However, timestamps are converted
+        only once and all epochs are cut out of the recording with a single indexing operation. EventContainers of
+        epochs which lie completely inside the recording share one array of shape events x channels x samples.
+        If view is set and the container is buffered, no epoch data is copied at all. Instead, each EventContainer
+        is a copy-on-write view on the buffer.
+
+        :param event_times: Times of events data in the containers will be centered around.
+        :type event_times: List[float]
+        :param before: Duration in milliseconds before the event to include in EventContainer, defaults to 50
+        :type before: int
+        :param after: Duration in milliseconds after the event to include in EventContainer, defaults to 100
+        :type after: int
+        :param view: If true and the container is buffered, EventContainers are copy-on-write views on the buffer, defaults to False
+        :type view: bool, optional
+        :return: EventContainers containing all channels centered around the event times.
+        :rtype: List[EventContainer]
+        """
+        if len(event_times) == 0:
+            return []
+
+        self.__check_retained(event_times)
+        timestamps = np.asarray(self.timestamps, dtype=np.float64)
+        signals = np.asarray(self.signals, dtype=np.float64)
+        num_samples = len(timestamps)
+
+        # Locate all events at once and register them
+        centers = self.__find_closest_timestamps(timestamps, event_times)
+        center_times = timestamps[centers]
+        known_events = set(self.events)
+        for event_time in center_times.tolist():
+            if event_time not in known_events:
+                self.events.append(event_time)
+                known_events.add(event_time)
+
+        # Cut out all complete epochs at once. Result is of shape events x
+        # channels x samples.
+        starts, stops, complete, index = self.__epoch_index(
+            centers, num_samples, before, after)
+        epoch_timestamps = timestamps[index] - center_times[complete, None]
+        shared = view and self._buffer is not None
+        if not shared:
+            epoch_signals = signals[:, index].swapaxes(0, 1)
+
+        events = []
+        complete_i = 0
+        for i in range(len(centers)):
+            start = max(starts[i], 0)
+            stop = min(stops[i], num_samples)
+            if shared:
+                new_signals = signals[:, start:stop]
+            elif complete[i]:
+                new_signals = epoch_signals[complete_i]
+            else:
+                # Epochs at the borders of the recording are shorter
+                new_signals = signals[:, start:stop].copy()
+
+            if complete[i]:
+                new_timestamps = epoch_timestamps[complete_i]
+                complete_i += 1
+            else:
+                new_timestamps = timestamps[start:stop] - center_times[i]
+
+            events.append(EventContainer(
+                self.channel_names,
+                self.sample_rate,
+                new_signals,
+                new_timestamps,
+                shared=shared))
+
+        return events
+
+    def get_epochs(self, before: int, after: int) -> EpochArray:
+        """Get EpochArray containing all events stored in the container. All epochs are cut out of the recording with a
+        single indexing operation. Events too close to the start or end of the recording to cover the full duration
+        are left out.
+
+        :param before: Duration in milliseconds before the event.
+        :type before: int
+        :param after: Duration in milliseconds after the event.
+        :type after: int
+        :return: EpochArray containing all complete events.
+        :rtype: EpochArray
+        """
+        timestamps = np.asarray(self.timestamps, dtype=np.float64)
+        signals = np.asarray(self.signals, dtype=np.float64).reshape(
+            len(self.channel_names), len(timestamps))
+        centers = self.__find_closest_timestamps(timestamps, self.events)
+        _, _, complete, index = self.__epoch_index(
+            centers, len(timestamps), before, after)
+
+        return EpochArray(
+            self.channel_names,
+            self.sample_rate,
+            signals[:, index].swapaxes(0, 1),
+            timestamps[index] - timestamps[centers[complete], None])
 
-    def load_signals(self, file_name: str, event_marker: str = "1"):
+    def __epoch_index(
+            self,
+            centers: NDArray,
+            num_samples: int,
+            before: int,
+            after: int) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Calculates sample ranges of epochs around the given event indices.
+
+        :param centers: Indices of events.
+        :type centers: NDArray
+        :param num_samples: Number of samples in the recording.
+        :type num_samples: int
+        :param before: Duration in milliseconds before the event.
+        :type before: int
+        :param after: Duration in milliseconds after the event.
+        :type after: int
+        :return: Tuple of start indices, stop indices, mask of epochs which lie completely inside the recording, and
+        sample indices of shape complete epochs x samples.
+        :rtype: Tuple[NDArray, NDArray, NDArray, NDArray]
+        """
+        # Calculate number of samples before and after event
+        before_samples = (before * self.sample_rate) // 1000
+        after_samples = (after * self.sample_rate) // 1000 + 1
+        starts = centers - before_samples
+        stops = centers + after_samples
+        complete = (starts >= 0) & (stops <= num_samples)
+        index = centers[complete, None] + \
+            np.arange(-before_samples, after_samples)
+        return starts, stops, complete, index
+
+    def load_signals(
+            self,
+            file_name: str,
+            event_marker: str = "1",
+            chunk_size: int = 65536):
         """Load data from a csv file.
         The first col has to be the column with timestamps. Following this,
         the different channels must follow. The last column must contain either a 0, no
@@ -586,45 +1242,169 @@ class EEGContainer(AbstractContainer):
         are present than in the container.
         <timestamp>, <channels>*n, <target marker?>
 
+        The file is parsed in chunks of rows. Each chunk is converted into numpy columns at once, so memory used for
+        parsing stays bounded for long recordings.
+
         :param file_name: File name to read from.
         :type file_name: str
+        :param event_marker: Marker indicating the start of a new event. Defaults to "1".
+        :type event_marker: str, optional
+        :param chunk_size: Number of rows parsed at once, defaults to 65536
+        :type chunk_size: int, optional
         """
 
         # Reset object before loading new signals
-        self.timestamps = []
-        self.signals = [list() for _ in range(len(self.channel_names))]
+        self._spectrum = None
+        if self._buffer is not None:
+            self._buffer = SignalBuffer(
+                len(self.channel_names), max_size=self._buffer.max_size)
+        else:
+            self.timestamps = []
+            self.signals = [list() for _ in range(len(self.channel_names))]
 
+        num_channels = len(self.channel_names)
         with open(file_name) as f:
-            reader = csv.reader(f, delimiter=",")
-            next(reader)
-            for line in reader:
-                timestamp = float(line[0])
-                signals = [float(x)
-                           for x in line[1: len(self.channel_names) + 1]]
-
-                if line[-1] == event_marker:
-                    self.events.append(timestamp)
-                self.add_data(BCISignal(timestamp, signals))
+            next(f)
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    break
+
+                # Parse timestamps, channels, and markers in one pass. Markers
+                # are converted to 1 for events and 0 otherwise
+                block = np.loadtxt(
+                    lines,
+                    delimiter=",",
+                    usecols=list(range(num_channels + 1)) + [-1],
+                    converters={-1: lambda x: x.strip() == event_marker},
+                    ndmin=2)
+
+                timestamps = block[:, 0]
+                signals = block[:, 1:-1].T
+                self.events.extend(
+                    timestamps[block[:, -1] == 1].tolist())
+
+                if self._buffer is not None:
+                    evicted = self._buffer.evicted
+                    self._buffer.extend(timestamps, signals)
+                    if self._buffer.evicted != evicted:
+                        self.__evict(self._buffer.evicted - evicted)
+                else:
+                    self.timestamps.extend(timestamps.tolist())
+                    for i in range(num_channels):
+                        self.signals[i].extend(signals[i].tolist())
+
+    def save_signals(
+            self,
+            file_name: str,
+            event_marker: str = "1",
+            block_size: int = 4096):
+        """Store data in csv format. Samples are written in blocks. Events are marked using a
+        precomputed mask instead of searching the event list for each sample.
 
-    def save_signals(self, file_name: str, event_marker: str = "1"):
-        """Store data in csv format.
+        :param file_name: File name to write to.
+        :type file_name: str
+        :param event_marker: Character to signify an event in saved data. Non-events always get marked with a 0.
+        :type file_name: str
+        :param block_size: Number of samples written at once, defaults to 4096
+        :type block_size: int, optional
+        """
+        timestamps = np.asarray(self.timestamps, dtype=np.float64)
+        signals = np.asarray(self.signals, dtype=np.float64).reshape(
+            len(self.channel_names), len(timestamps))
+        events = np.isin(timestamps, self.events)
+
+        with RecordingWriter(file_name, self.channel_names, event_marker) as writer:
+            for start in range(0, len(timestamps), block_size):
+                stop = start + block_size
+                writer.write_block(
+                    timestamps[start:stop],
+                    signals[:, start:stop],
+                    events[start:stop])
+
+    def start_streaming(
+            self,
+            file_name: str,
+            event_marker: str = "1",
+            block_size: int = 256):
+        """Start writing data to a csv file while recording is still in progress. All data already stored is written
+        immediately. Afterwards, new data is appended to the file in blocks of block_size samples as it is added. Call
+        stop_streaming to write remaining samples and close the file. The resulting file is equal to one written by
+        save_signals, if events are added before the blocks containing them are written.
 
         :param file_name: File name to write to.
         :type file_name: str
         :param event_marker: Character to signify an event in saved data. Non-events always get marked with a 0.
+        :type event_marker: str, optional
+        :param block_size: Number of new samples to collect before writing them, defaults to 256
+        :type block_size: int, optional
+        """
+        self.stop_streaming()
+        self._writer = RecordingWriter(
+            file_name, self.channel_names, event_marker)
+        self._written = 0
+        self._block_size = block_size
+        self.__write_pending()
+
+    def stop_streaming(self):
+        """Write all remaining samples to the file opened by start_streaming and close it.
+        """
+        if self._writer is None:
+            return
+        self.__write_pending()
+        self._writer.close()
+        self._writer = None
+
+    def __write_pending(self):
+        """Write all samples not yet written to the streaming file.
+        """
+        timestamps = np.asarray(
+            self.timestamps[self._written:], dtype=np.float64)
+        if len(timestamps) == 0:
+            return
+
+        signals = np.array([x[self._written:] for x in self.signals],
+                           dtype=np.float64).reshape(len(self.channel_names), len(timestamps))
+        self._writer.write_block(
+            timestamps, signals, np.isin(timestamps, self.events))
+        self._writer.flush()
+        self._written += len(timestamps)
+
+    def save_binary(self, file_name: str):
+        """Store data in binary format. The file contains a header with channel names, sample rate, and event indices
+        followed by timestamps and signals as contiguous float64 arrays. Files are a fraction of the size of csv files
+        and can be memory mapped by load_binary.
+
+        :param file_name: File name to write to.
         :type file_name: str
         """
-        assert event_marker != "0"
+        timestamps = np.asarray(self.timestamps, dtype=np.float64)
+        event_indices = self.__find_closest_timestamps(timestamps, self.events)
+        write_recording(
+            file_name,
+            self.channel_names,
+            self.sample_rate,
+            timestamps,
+            self.signals,
+            event_indices)
 
-        with open(file_name, "w", newline='') as f:
-            writer = csv.writer(f, delimiter=",")
-            writer.writerow(["timestamps"] + self.channel_names + ["Marker"])
+    def load_binary(self, file_name: str, mmap: bool = True):
+        """Load data from a binary file, see save_binary. Channel names, sample rate, and events of the container are
+        replaced by the ones stored in the file. Data is always stored in a SignalBuffer afterwards. If mmap is set,
+        the buffer is backed by a copy-on-write memory map of the file. Changes, e.g., applied filters, are never
+        written back to the file.
 
-            for i in range(len(self.timestamps)):
-                timestamp = self.timestamps[i]
-                marker = 1 if timestamp in self.events else 0
-                writer.writerow([timestamp] + [ch[i]
-                                for ch in self.signals] + [marker])
+        :param file_name: File name to read from.
+        :type file_name: str
+        :param mmap: Map data instead of reading it into memory, defaults to True
+        :type mmap: bool, optional
+        """
+        header, timestamps, signals = read_recording(file_name, mmap=mmap)
+        self.channel_names = header["channel_names"]
+        self.sample_rate = header["sample_rate"]
+        self._buffer = SignalBuffer.from_arrays(timestamps, signals)
+        self._spectrum = None
+        self.events = timestamps[header["event_indices"]].tolist()
 
     def shift_timestamps(self):
         """Shifts all timestamps to start at 0. This is useful if the EEGContainer is created
@@ -635,9 +1415,39 @@ class EEGContainer(AbstractContainer):
             return
 
         first_timestamp = self.timestamps[0]
-        self.timestamps = [x - first_timestamp for x in self.timestamps]
+        if self._buffer is not None:
+            self._buffer.timestamps[:] -= first_timestamp
+        else:
+            self.timestamps = [x - first_timestamp for x in self.timestamps]
         self.events = [x - first_timestamp for x in self.events]
 
+    def __evict(self, num_samples: int):
+        """Update streaming position and events after samples were evicted from the retained window.
+
+        :param num_samples: Number of evicted samples.
+        :type num_samples: int
+        """
+        self._written = max(self._written - num_samples, 0)
+
+        # Events are not necessarily added in chronological order, so all events
+        # are checked
+        oldest = self.timestamps[0]
+        retained = [x for x in self.events if x >= oldest]
+        if len(retained) != len(self.events):
+            self._evicted_events += len(self.events) - len(retained)
+            self.events = retained
+
+    def __check_retained(self, event_times: List[float]):
+        """Ensure events lie inside the retained window.
+
+        :param event_times: Times of events to check.
+        :type event_times: List[float]
+        :raises Exception: Event lies before the retained window.
+        """
+        if self.evicted_samples and len(self.timestamps) and np.min(
+                event_times) < self.timestamps[0]:
+            raise Exception("Event is outside of the retained window")
+
     def __find_closest_timestamp(self, timestamp: float) -> float:
         """Finds the index of the closest stored timestamp to provided time stamp.
         Ensures the event is always centered at 0.
@@ -647,8 +1457,34 @@ class EEGContainer(AbstractContainer):
         :return: Index of closest stored time stamp.
         :rtype: float
         """
-        timestamp_arr = np.array(self.timestamps)
-        return (np.abs(timestamp_arr - timestamp)).argmin()
+        timestamp_arr = np.asarray(self.timestamps, dtype=np.float64)
+        return self.__find_closest_timestamps(timestamp_arr, [timestamp])[0]
+
+    def __find_closest_timestamps(
+            self,
+            timestamps: NDArray,
+            event_times: List[float]) -> NDArray:
+        """Finds the indices of the closest stored timestamps to several provided time stamps using
+        a single binary search. Stored timestamps are expected to be in ascending order. On ties,
+        the earlier time stamp is chosen.
+
+        :param timestamps: Stored time stamps as numpy array.
+        :type timestamps: NDArray
+        :param event_times: External time stamps to search for.
+        :type event_times: List[float]
+        :return: Indices of closest stored time stamps.
+        :rtype: NDArray
+        """
+        event_times = np.asarray(event_times, dtype=np.float64)
+        if len(timestamps) < 2:
+            return np.zeros(len(event_times), dtype=np.intp)
+
+        right = np.clip(np.searchsorted(timestamps, event_times),
+                        1, len(timestamps) - 1)
+        left = right - 1
+        closer_left = (event_times - timestamps[left]
+                       ) <= (timestamps[right] - event_times)
+        return np.where(closer_left, left, right)
 
     def __eq__(self, other):
         if self.channel_names != other.channel_names:
@@ -657,7 +1493,7 @@ class EEGContainer(AbstractContainer):
         if self.sample_rate != other.sample_rate:
             return False
 
-        if self.timestamps != other.timestamps:
+        if not np.array_equal(self.timestamps, other.timestamps):
             return False
 
         if self.events != other.events:
@@ -667,7 +1503,51 @@ class EEGContainer(AbstractContainer):
             return False
 
         for i in range(len(self.signals)):
-            if self.signals[i] != other.signals[i]:
+            if not np.array_equal(self.signals[i], other.signals[i]):
                 return False
 
         return True
+
+
+def csv_to_binary(
+        csv_file: str,
+        binary_file: str,
+        channel_names: List[str],
+        sample_rate: int,
+        event_marker: str = "1"):
+    """Convert a recording in csv format, see EEGContainer.load_signals, to binary format, see EEGContainer.save_binary.
+
+    :param csv_file: File name of csv recording.
+    :type csv_file: str
+    :param binary_file: File name of binary recording to write.
+    :type binary_file: str
+    :param channel_names: List of channel names.
+    :type channel_names: List[str]
+    :param sample_rate: Sample rate in Hz.
+    :type sample_rate: int
+    :param event_marker: Marker indicating the start of a new event. Defaults to "1".
+    :type event_marker: str, optional
+    """
+    EEGContainer.from_file(
+        channel_names,
+        sample_rate,
+        csv_file,
+        event_marker=event_marker,
+        buffered=True).save_binary(binary_file)
+
+
+def binary_to_csv(
+        binary_file: str,
+        csv_file: str,
+        event_marker: str = "1"):
+    """Convert a recording in binary format, see EEGContainer.save_binary, to csv format, see EEGContainer.save_signals.
+
+    :param binary_file: File name of binary recording.
+    :type binary_file: str
+    :param csv_file: File name of csv recording to write.
+    :type csv_file: str
+    :param event_marker: Character to signify an event in saved data. Defaults to "1".
+    :type event_marker: str, optional
+    """
+    EEGContainer.from_binary(binary_file).save_signals(
+        csv_file, event_marker=event_marker)
@@ -1,12 +1,87 @@
+import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Dict, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 from numpy.typing import NDArray
-from statsmodels.regression import yule_walker
+from scipy.fft import rfftfreq
 
-from .container import EventContainer
+from .container import EpochArray, EventContainer
+from .devices.base import BCISignal
 from .utils import normalize_npy
+from .utils.autoregression import yule_walker
+from .utils.spectral import segment_periodograms, welch, welch_step
+
+
+class PowerBands():
+    __slots__ = "bands", "include_lowest", "_kernels"
+
+    def __init__(self, bands: List[Tuple[str, float, float]], include_lowest: bool = False) -> None:
+        """Definition of power bands, e.g., [("alpha", 10, 13), ("beta", 13, 30)]. A band contains all frequencies above its lower
+        and up to its upper frequency. For each signal length and sample rate, bands are compiled once into an averaging matrix
+        of shape frequencies x bands. Thereby, band powers of all channels and epochs are calculated by one matrix multiplication.
+
+        :param bands: List of bands, each given as name, lower frequency, and upper frequency.
+        :type bands: List[Tuple[str, float, float]]
+        :param include_lowest: If true, the first band also contains its lower frequency, defaults to False
+        :type include_lowest: bool, optional
+        """
+        self.bands = [(name, float(low), float(high)) for name, low, high in bands]
+        self.include_lowest = include_lowest
+        self._kernels = {}
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all bands."""
+        return [name for name, _, _ in self.bands]
+
+    def kernel(self, freqs: NDArray) -> NDArray:
+        """Averaging matrix for the given frequencies. Column i contains 1 / n for the n frequencies in band i and 0 otherwise.
+        Columns of bands without any frequency contain nan. Matrices are cached by number of frequencies and frequency resolution.
+
+        :param freqs: Frequency of each entry of the power spectrum, see container.frequency_axis.
+        :type freqs: NDArray
+        :return: Averaging matrix of shape frequencies x bands.
+        :rtype: NDArray
+        """
+        key = (len(freqs), float(freqs[1] - freqs[0]) if len(freqs) > 1 else 0.0)
+        kernel = self._kernels.get(key)
+        if kernel is not None:
+            return kernel
+
+        kernel = np.zeros((len(freqs), len(self.bands)))
+        for i, (_, low, high) in enumerate(self.bands):
+            lower = freqs >= low if self.include_lowest and i == 0 else freqs > low
+            mask = lower & (freqs <= high)
+            kernel[:, i] = mask / mask.sum() if mask.any() else np.nan
+        kernel.flags.writeable = False
+        self._kernels[key] = kernel
+        return kernel
+
+    def band_powers(self, power: NDArray, freqs: NDArray) -> NDArray:
+        """Mean power in each band.
+
+        :param power: Power spectrum of shape [events x channels x] frequencies.
+        :type power: NDArray
+        :param freqs: Frequency of each entry of the power spectrum.
+        :type freqs: NDArray
+        :return: Band powers of shape [events x channels x] bands.
+        :rtype: NDArray
+        """
+        return np.asarray(power) @ self.kernel(freqs)
+
+    def __str__(self) -> str:
+        return str(self.bands)
+
+
+# Default bands of BandpowerModel
+ALPHA_BETA_BANDS = [("alpha", 10, 13), ("beta", 13, 30)]
+
+# Default bands of PACModel and AdaptedPACModel
+PAC_BANDS = [("low", 0, 10), ("alpha", 10, 13),
+             ("beta", 13, 30), ("gamma", 30, 50)]
 
 
 class FeatureExtractionModelBase(ABC):
@@ -24,6 +99,35 @@ class FeatureExtractionModelBase(ABC):
         :rtype: NDArray"""
         pass
 
+    def extract_features_batch(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        """Extract features from many epochs at once. Rows of the result are equal to calling extract_features for each epoch.
+        Models override this function with a vectorized implementation. By default, epochs are processed one by one.
+
+        :param epochs: Epochs to extract features from.
+        :type epochs: Union[EpochArray, List[EventContainer]]
+        :return: Features as a numpy array of shape events x features.
+        :rtype: NDArray
+        """
+        if isinstance(epochs, EpochArray):
+            epochs = epochs.to_events()
+        if len(epochs) == 0:
+            return np.empty((0, 0))
+        return np.stack([self.extract_features(ev) for ev in epochs])
+
+    def _stack(self, epochs: Union[EpochArray, List[EventContainer]]) -> Optional[EpochArray]:
+        """Stack epochs into an EpochArray for vectorized feature extraction.
+
+        :param epochs: Epochs to stack.
+        :type epochs: Union[EpochArray, List[EventContainer]]
+        :return: EpochArray, or None if epochs differ in length and can't be stacked.
+        :rtype: Optional[EpochArray]
+        """
+        if isinstance(epochs, EpochArray):
+            return epochs
+        if len(epochs) == 0 or len(set(len(ev) for ev in epochs)) > 1:
+            return None
+        return EpochArray.from_events(epochs)
+
 
 class AverageModel(FeatureExtractionModelBase):
     __slots__ = "channels"
@@ -48,18 +152,34 @@ class AverageModel(FeatureExtractionModelBase):
         t = ev.average_ch(*self.channels)
         return t[0]
 
+    def extract_features_batch(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        stacked = self._stack(epochs)
+        if stacked is None:
+            return super().extract_features_batch(epochs)
+
+        signals = stacked.signals
+        if self.channels:
+            signals = signals[:, stacked.channel_index(*self.channels)]
+        return signals.mean(axis=1)
+
     def __str__(self) -> str:
         return f"AverageModel()"
 
 
 class BandpowerModel(FeatureExtractionModelBase):
-    def __init__(self) -> None:
-        """Model that extracts features from an EventContainer. Features are: power spectrum in the form of mean values for alpha and beta powerbands.
+    __slots__ = "bands"
+
+    def __init__(self, bands: Optional[List[Tuple[str, float, float]]] = None) -> None:
+        """Model that extracts features from an EventContainer. Features are: power spectrum in the form of mean values for each power band.
+
+        :param bands: Power bands given as name, lower frequency, and upper frequency, see PowerBands. Defaults to alpha [10-13Hz] and beta [13-30Hz].
+        :type bands: Optional[List[Tuple[str, float, float]]], optional
         """
+        self.bands = PowerBands(bands if bands else ALPHA_BETA_BANDS)
         super().__init__()
 
     def aggregate_ps(self, power: NDArray, freqs: NDArray) -> List[float]:
-        """Returns median for alpha and beta powerbands
+        """Returns mean for each power band, by default
         alpha [10-13Hz]
         beta [13-30Hz]
 
@@ -67,14 +187,11 @@ class BandpowerModel(FeatureExtractionModelBase):
         :type power: NDArray
         :param freqs: Frequency labels.
         :type freqs: NDArray
-        :return: List of length 2, with the mean value for each power bands.
-        Ordered as [<alpha>, <beta>]
+        :return: List with the mean value for each power band.
+        Ordered as configured, by default [<alpha>, <beta>]
         :rtype: List[int]
         """
-        alpha = np.mean(np.sort(power[(freqs > 10) & (freqs <= 13)]))
-        beta = np.mean(np.sort(power[(freqs > 13) & (freqs <= 30)]))
-
-        return [alpha, beta]
+        return self.bands.band_powers(power, freqs).tolist()
 
     def extract_features(self, ev: EventContainer) -> NDArray:
         """Extract features from an EventContainer. Features are: power spectrum.
@@ -84,25 +201,38 @@ class BandpowerModel(FeatureExtractionModelBase):
         :return: Features as a numpy array.
         :rtype: NDArray
         """
-        features = []
-        power_spectrum = ev.power_spectrum()
-        for ch_ps in power_spectrum[:-1]:
-            features.append(self.aggregate_ps(ch_ps, power_spectrum[-1]))
+        power_spectrum = ev.power_spectrum(memoize=True)
+        return self.bands.band_powers(power_spectrum[:-1], power_spectrum[-1]).reshape(-1)
 
-        return np.concatenate(features)
+    def extract_features_batch(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        stacked = self._stack(epochs)
+        if stacked is None:
+            return super().extract_features_batch(epochs)
+
+        power, freqs = stacked.power_spectrum()
+        return self.bands.band_powers(power, freqs).reshape(len(stacked), -1)
 
     def __str__(self) -> str:
-        return f"BandpowerModel()"
+        if self.bands.bands == PowerBands(ALPHA_BETA_BANDS).bands:
+            return f"BandpowerModel()"
+        return f"BandpowerModel(bands={self.bands})"
 
 
 class PACModel(FeatureExtractionModelBase):
-    def __init__(self) -> None:
+    __slots__ = "bands"
+
+    def __init__(self, bands: Optional[List[Tuple[str, float, float]]] = None) -> None:
         """Model that extracts features from an EventContainer. Features are: power spectrum and AR coefficients. The AR coefficients are calculated for each channel. The power spectrum is calculated for each channel and aggregated to a single value for each power band. This model takes huge inspiration from the model described in "Performance and Usability Evaluation of Brainwave Authentication Techniques with Consumer Devices" by Arias-Cabarcos et al released in 2023.
+
+        :param bands: Power bands given as name, lower frequency, and upper frequency, see PowerBands. The first band includes its lower frequency. Defaults to low [0-10Hz], alpha [10-13Hz], beta [13-30Hz], and gamma [30-50Hz].
+        :type bands: Optional[List[Tuple[str, float, float]]], optional
         """
+        self.bands = PowerBands(
+            bands if bands else PAC_BANDS, include_lowest=True)
         super().__init__()
 
     def aggregate_ps(self, power: NDArray, freqs: NDArray) -> List[int]:
-        """Returns median for detla, theta, alpha, and beta powerbands
+        """Returns mean for each power band, by default
         low [0-10Hz]
         alpha [10-13Hz]
         beta [13-30Hz]
@@ -112,16 +242,11 @@ class PACModel(FeatureExtractionModelBase):
         :type power: NDArray
         :param freqs: Frequency labels.
         :type freqs: NDArray
-        :return: List of length 4, with the mean value for each power bands.
-        Ordered as [<alpha>, <beta>]
+        :return: List with the mean value for each power band.
+        Ordered as configured, by default [<low>, <alpha>, <beta>, <gamma>]
         :rtype: List[int]
         """
-        low = np.average(power[(freqs >= 0) & (freqs <= 10)])
-        alpha = np.average(power[(freqs > 10) & (freqs <= 13)])
-        beta = np.average(power[(freqs > 13) & (freqs <= 30)])
-        gamma = np.average(power[(freqs > 30) & (freqs <= 50)])
-
-        return [low, alpha, beta, gamma]
+        return self.bands.band_powers(power, freqs).tolist()
 
     def extract_features(self, ev: EventContainer) -> NDArray:
         """Extract features from an EventContainer. Features are: power spectrum and AR coefficients. The AR coefficients are calculated for each channel. The power spectrum is calculated for each channel and aggregated to a single value for each power band.
@@ -131,41 +256,51 @@ class PACModel(FeatureExtractionModelBase):
         :return: Features as a numpy array.
         :rtype: NDArray
         """
-        features = []
-        power_spectrum = ev.power_spectrum()
+        power_spectrum = ev.power_spectrum(memoize=True)
+        bands = self.bands.band_powers(power_spectrum[:-1], power_spectrum[-1])
 
-        # Calculate features for each channel
-        for i in range(len(ev.signals)):
-            # Extract power spectrum for channel
-            features.append(self.aggregate_ps(
-                power_spectrum[i], power_spectrum[-1]))
+        # Calculate AR coefficients of all channels at once
+        rho, sigma = yule_walker(np.asarray(ev.signals), order=10)
 
-            # Calculate AR coefficients
-            rho, sigma = yule_walker(
-                ev[i], order=10, method="mle")
-            features.append(rho)
+        # Features of each channel are band powers followed by AR coefficients
+        return np.concatenate([bands, rho], axis=-1).reshape(-1)
 
-        # Concatenate features, and return normalized features
-        return np.concatenate(features)
+    def extract_features_batch(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        stacked = self._stack(epochs)
+        if stacked is None:
+            return super().extract_features_batch(epochs)
+
+        # Features of each channel are band powers followed by AR coefficients
+        power, freqs = stacked.power_spectrum()
+        bands = self.bands.band_powers(power, freqs)
+        rho, _ = yule_walker(stacked.signals, order=10)
+        return np.concatenate([bands, rho], axis=-1).reshape(len(stacked), -1)
 
     def __str__(self) -> str:
-        return f"PACModel()"
+        if self.bands.bands == PowerBands(PAC_BANDS).bands:
+            return f"PACModel()"
+        return f"PACModel(bands={self.bands})"
 
 
 class AdaptedPACModel(FeatureExtractionModelBase):
-    __slots__ = "num_coefficients"
+    __slots__ = "num_coefficients", "bands"
 
-    def __init__(self, num_coefficients: int = 10) -> None:
+    def __init__(self, num_coefficients: int = 10,
+                 bands: Optional[List[Tuple[str, float, float]]] = None) -> None:
         """Model that extracts features from an EventContainer. Features are: power spectrum and AR coefficients. The AR coefficients are calculated for each channel. The power spectrum is calculated for each channel and aggregated to a single value for each power band. Further, it is normalized and contains frequencies in the ranges of [0-10Hz], [10-13Hz], [13-30Hz], and [30-50Hz]. Model is adaption from PACModel, which does not normalize the power spectrum, thereby introducing values which are too large for usefull similarity calculation using classic distance metrics.
 
         :param num_coefficients: _description_, defaults to 10
         :type num_coefficients: int, optional
+        :param bands: Power bands given as name, lower frequency, and upper frequency, see PowerBands. The first band includes its lower frequency. Defaults to the bands of PACModel.
+        :type bands: Optional[List[Tuple[str, float, float]]], optional
         """
         self.num_coefficients = num_coefficients
+        self.bands = PowerBands(
+            bands if bands else PAC_BANDS, include_lowest=True)
         super().__init__()
 
     def aggregate_ps(self, power: NDArray, freqs: NDArray) -> List[int]:
-        """Returns aggregated value for each power band.
+        """Returns aggregated value for each power band, by default
         low [0-10Hz]
         alpha [10-13Hz]
         beta [13-30Hz]
@@ -175,18 +310,11 @@ class AdaptedPACModel(FeatureExtractionModelBase):
         :type power: NDArray
         :param y: Frequency labels.
         :type y: NDArray
-        :return: Normalized list of length 4, with aggregated value for each power bands.
-        Ordered as [<delta>, <theta>, <alpha>, <beta>]
+        :return: Normalized list with aggregated value for each power band.
+        Ordered as configured, by default [<low>, <alpha>, <beta>, <gamma>]
         :rtype: List[int]
         """
-        low = np.average(power[(freqs >= 0) & (freqs <= 10)])
-        alpha = np.average(power[(freqs > 10) & (freqs <= 13)])
-        beta = np.average(power[(freqs > 13) & (freqs <= 30)])
-        gamma = np.average(power[(freqs > 30) & (freqs <= 50)])
-
-        concat = np.array([low, alpha, beta, gamma])
-
-        return normalize_npy(concat)
+        return normalize_npy(self.bands.band_powers(power, freqs))
 
     def extract_features(self, ev: EventContainer) -> NDArray:
         """Extract features from an EventContainer. Features are: AR coefficients, power spectrum.
@@ -197,19 +325,321 @@ class AdaptedPACModel(FeatureExtractionModelBase):
         :rtype: NDArray
         """
         # Extract AR coefficients
-        features = []
-        for sig in ev.signals:
-            rho, sigma = yule_walker(
-                sig, order=self.num_coefficients, method="mle")
-            features.append(rho)
+        rho, sigma = yule_walker(np.asarray(
+            ev.signals), order=self.num_coefficients)
+        features = list(rho)
 
         # Extract power spectrum
-        power_spectrum = ev.power_spectrum()
-        for ch_ps in power_spectrum[:-1]:
-            features.append(self.aggregate_ps(ch_ps, power_spectrum[-1]))
+        power_spectrum = ev.power_spectrum(memoize=True)
+        bands = self.bands.band_powers(power_spectrum[:-1], power_spectrum[-1])
+        bands /= np.sqrt((bands ** 2).sum(axis=-1, keepdims=True))
+        features += list(bands)
 
         # Concatenate features
         return np.concatenate(features)
 
+    def extract_features_batch(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        stacked = self._stack(epochs)
+        if stacked is None:
+            return super().extract_features_batch(epochs)
+
+        # AR coefficients of all channels followed by normalized band powers of
+        # all channels
+        rho, _ = yule_walker(stacked.signals, order=self.num_coefficients)
+        power, freqs = stacked.power_spectrum()
+        bands = self.bands.band_powers(power, freqs)
+        bands /= np.sqrt((bands ** 2).sum(axis=-1, keepdims=True))
+        return np.concatenate([rho.reshape(len(stacked), -1),
+                               bands.reshape(len(stacked), -1)], axis=-1)
+
+    def __str__(self) -> str:
+        if self.bands.bands == PowerBands(PAC_BANDS).bands:
+            return f"AdaptedPACModel(num_coefficients={self.num_coefficients})"
+        return f"AdaptedPACModel(num_coefficients={self.num_coefficients}, bands={self.bands})"
+
+
+class WelchBandpowerModel(FeatureExtractionModelBase):
+    __slots__ = "bands", "segment_length", "overlap", "window"
+
+    def __init__(self, bands: Optional[List[Tuple[str, float, float]]] = None, segment_length: int = 128,
+                 overlap: float = 0.5, window: str = "hann") -> None:
+        """Model that extracts features from an EventContainer. Features are: mean power spectral density for each power band.
+        In contrast to BandpowerModel, which uses the raw spectrum of the whole epoch, the spectral density is estimated using
+        Welch's method, i.e., averaged over overlapping windowed segments, which reduces its variance. Features have the same
+        layout as those of BandpowerModel, i.e., bands of the first channel, followed by bands of the second channel, and so on.
+        Segments can also be accumulated while data is recorded, see accumulator.
+
+        :param bands: Power bands given as name, lower frequency, and upper frequency, see PowerBands. Defaults to alpha [10-13Hz] and beta [13-30Hz].
+        :type bands: Optional[List[Tuple[str, float, float]]], optional
+        :param segment_length: Number of samples of each segment. Epochs with less samples are transformed as one segment, defaults to 128
+        :type segment_length: int, optional
+        :param overlap: Overlap of consecutive segments as share of segment_length, defaults to 0.5
+        :type overlap: float, optional
+        :param window: Window applied to each segment, see scipy.signal.get_window, defaults to "hann"
+        :type window: str, optional
+        """
+        welch_step(segment_length, overlap)
+        self.bands = PowerBands(bands if bands else ALPHA_BETA_BANDS)
+        self.segment_length = segment_length
+        self.overlap = overlap
+        self.window = window
+        super().__init__()
+
+    def extract_features(self, ev: EventContainer) -> NDArray:
+        """Extract features from an EventContainer. Features are: band powers of the power spectral density.
+
+        :param ev: EventContainer to extract features from.
+        :type ev: EventContainer
+        :return: Features as a numpy array.
+        :rtype: NDArray
+        """
+        power, freqs = welch(ev.signals, ev.sample_rate,
+                             self.segment_length, self.overlap, self.window)
+        return self.bands.band_powers(power, freqs).reshape(-1)
+
+    def extract_features_batch(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        stacked = self._stack(epochs)
+        if stacked is None:
+            return super().extract_features_batch(epochs)
+
+        power, freqs = welch(stacked.signals, stacked.sample_rate,
+                             self.segment_length, self.overlap, self.window)
+        return self.bands.band_powers(power, freqs).reshape(len(stacked), -1)
+
+    def accumulator(self, num_channels: int, sample_rate: int):
+        """Create an accumulator, which estimates features incrementally from a stream.
+
+        :param num_channels: Number of channels of the stream.
+        :type num_channels: int
+        :param sample_rate: Sample rate of the stream.
+        :type sample_rate: int
+        :return: Accumulator using the configuration of this model.
+        :rtype: WelchAccumulator
+        """
+        return WelchAccumulator(self, num_channels, sample_rate)
+
+    def __str__(self) -> str:
+        _bands = "" if self.bands.bands == PowerBands(
+            ALPHA_BETA_BANDS).bands else f"bands={self.bands}, "
+        return f"WelchBandpowerModel({_bands}segment_length={self.segment_length}, overlap={self.overlap}, window={self.window})"
+
+
+class WelchAccumulator():
+    __slots__ = "model", "sample_rate", "_pending", "_sum", "_count"
+
+    def __init__(self, model: WelchBandpowerModel, num_channels: int, sample_rate: int) -> None:
+        """Incremental counterpart of WelchBandpowerModel. Samples are added as they arrive from a device. Each time a segment
+        is complete, its periodogram is added to a running sum, and only samples needed by following segments are kept.
+        Thereby, features are available as soon as the last sample of the window was added. Features of all added samples are
+        equal to WelchBandpowerModel.extract_features for an epoch containing the same samples, if it has at least
+        segment_length samples.
+
+        :param model: Model providing bands and segment configuration.
+        :type model: WelchBandpowerModel
+        :param num_channels: Number of channels of the stream.
+        :type num_channels: int
+        :param sample_rate: Sample rate of the stream.
+        :type sample_rate: int
+        """
+        self.model = model
+        self.sample_rate = sample_rate
+        self._pending = np.empty((num_channels, 0))
+        self._sum = np.zeros((num_channels, model.segment_length // 2 + 1))
+        self._count = 0
+
+    @property
+    def num_segments(self) -> int:
+        """Number of complete segments accumulated so far."""
+        return self._count
+
+    def add(self, signals: NDArray) -> None:
+        """Add the next chunk of a stream. Chunks must be passed in order.
+
+        :param signals: Chunk of shape channels x samples.
+        :type signals: NDArray
+        """
+        self._pending = np.hstack(
+            [self._pending, np.asarray(signals, dtype=np.float64)])
+
+        step = welch_step(self.model.segment_length, self.model.overlap)
+        power = segment_periodograms(self._pending, self.sample_rate,
+                                     self.model.segment_length, step, self.model.window)
+        num_segments = power.shape[-2]
+        if num_segments:
+            self._sum += power.sum(axis=-2)
+            self._count += num_segments
+            self._pending = self._pending[:, num_segments * step:]
+
+    def add_samples(self, samples: List[BCISignal]) -> None:
+        """Add samples as fetched from a device.
+
+        :param samples: Samples in order of recording.
+        :type samples: List[BCISignal]
+        """
+        if samples:
+            self.add(np.array([x.signals for x in samples],
+                     dtype=np.float64).T)
+
+    def features(self) -> NDArray:
+        """Features of all samples added so far.
+
+        :raises Exception: Not a single segment is complete.
+        :return: Features as a numpy array, see WelchBandpowerModel.extract_features.
+        :rtype: NDArray
+        """
+        if self._count == 0:
+            raise Exception("Not enough samples for a single segment")
+
+        freqs = rfftfreq(self.model.segment_length, 1 / self.sample_rate)
+        return self.model.bands.band_powers(self._sum / self._count, freqs).reshape(-1)
+
+    def reset(self) -> None:
+        """Remove all samples, e.g., before a new window starts."""
+        self._pending = self._pending[:, :0]
+        self._sum[:] = 0
+        self._count = 0
+
+
+class CachedFeatureModel(FeatureExtractionModelBase):
+    __slots__ = "model", "max_size", "directory", "hits", "disk_hits", "misses", "_model_key", "_features"
+
+    def __init__(self, model: FeatureExtractionModelBase, max_size: int = 4096, directory: Optional[str] = None) -> None:
+        """Opt-in cache wrapping any feature extraction model. Features are stored by a hash of the epoch's content, i.e., channel
+        names, sample rate, timestamps, and signals, together with the configuration of the model. Thereby, epochs which are
+        featurized repeatedly, e.g., when sweeping thresholds or similarity metrics, are computed only once.
+        Features are kept in memory and evicted in least recently used order. Optionally, they are also stored as .npy files,
+        so repeated experiments skip recomputation entirely.
+
+        :param model: Model to extract features with.
+        :type model: FeatureExtractionModelBase
+        :param max_size: Maximum number of features kept in memory, defaults to 4096
+        :type max_size: int, optional
+        :param directory: Directory to store features in, defaults to None, i.e., memory only
+        :type directory: Optional[str], optional
+        """
+        if max_size < 1:
+            raise Exception("Cache size must be at least 1")
+
+        self.model = model
+        self.max_size = max_size
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._model_key = self.__hash_model(model)
+        self._features = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        super().__init__()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requested features, which were loaded from memory or disk."""
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total else 0.0
+
+    def extract_features(self, ev: EventContainer) -> NDArray:
+        key = self.__hash_epoch(ev.channel_names, ev.sample_rate,
+                                ev.signals, ev.timestamps)
+        features = self.__get(key)
+        if features is None:
+            self.misses += 1
+            features = self.__put(key, self.model.extract_features(ev))
+        return features.copy()
+
+    def extract_features_batch(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        if len(epochs) == 0:
+            return np.empty((0, 0))
+
+        if isinstance(epochs, EpochArray):
+            keys = [self.__hash_epoch(epochs.channel_names, epochs.sample_rate, s, t)
+                    for s, t in zip(epochs.signals, epochs.timestamps)]
+        else:
+            keys = [self.__hash_epoch(ev.channel_names, ev.sample_rate, ev.signals, ev.timestamps)
+                    for ev in epochs]
+
+        features = [self.__get(key) for key in keys]
+        missing = [i for i, x in enumerate(features) if x is None]
+        if missing:
+            # Compute all missing features with one batched call of the model
+            self.misses += len(missing)
+            if isinstance(epochs, EpochArray):
+                subset = epochs[np.array(missing, dtype=np.intp)]
+            else:
+                subset = [epochs[i] for i in missing]
+            for i, x in zip(missing, self.model.extract_features_batch(subset)):
+                features[i] = self.__put(keys[i], x)
+        return np.stack(features)
+
+    def info(self) -> Dict[str, Union[int, float]]:
+        """Statistics of the cache.
+
+        :return: Dictionary containing number of hits in memory and on disk, misses, hit rate, and features kept in memory.
+        :rtype: Dict[str, Union[int, float]]
+        """
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "hit_rate": self.hit_rate, "size": len(self._features)}
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove all features from memory and reset statistics.
+
+        :param disk: If true, features stored on disk by this model are removed as well, defaults to False
+        :type disk: bool, optional
+        """
+        self._features.clear()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if disk and self.directory is not None:
+            for file in os.listdir(self.directory):
+                if file.startswith(self._model_key) and file.endswith(".npy"):
+                    os.remove(os.path.join(self.directory, file))
+
+    def __get(self, key: str) -> Optional[NDArray]:
+        features = self._features.get(key)
+        if features is not None:
+            self._features.move_to_end(key)
+            self.hits += 1
+            return features
+
+        if self.directory is not None:
+            path = os.path.join(self.directory, f"{key}.npy")
+            if os.path.exists(path):
+                self.disk_hits += 1
+                return self.__put(key, np.load(path), store=False)
+        return None
+
+    def __put(self, key: str, features: NDArray, store: bool = True) -> NDArray:
+        features = np.array(features)
+        features.flags.writeable = False
+        if store and self.directory is not None:
+            np.save(os.path.join(self.directory, f"{key}.npy"), features)
+
+        self._features[key] = features
+        if len(self._features) > self.max_size:
+            self._features.popitem(last=False)
+        return features
+
+    def __hash_epoch(self, channel_names: List[str], sample_rate: int,
+                     signals: NDArray, timestamps: NDArray) -> str:
+        content = blake2b(digest_size=16)
+        content.update(repr((list(channel_names), sample_rate)).encode())
+        content.update(np.ascontiguousarray(timestamps, dtype=np.float64))
+        content.update(np.ascontiguousarray(signals, dtype=np.float64))
+        return f"{self._model_key}_{content.hexdigest()}"
+
+    @staticmethod
+    def __hash_model(model: FeatureExtractionModelBase) -> str:
+        # __str__ doesn't contain all parameters of every model, e.g.,
+        # channels of AverageModel, so public attributes are hashed as well
+        attributes = []
+        for cls in type(model).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in [slots] if isinstance(slots, str) else slots:
+                if not slot.startswith("_"):
+                    attributes.append((slot, str(getattr(model, slot, None))))
+        config = repr((type(model).__qualname__, str(model), sorted(attributes)))
+        return blake2b(config.encode(), digest_size=8).hexdigest()
+
     def __str__(self) -> str:
-        return f"AdaptedPACModel(num_coefficients={self.num_coefficients})"
+        return f"CachedFeatureModel({str(self.model)})"
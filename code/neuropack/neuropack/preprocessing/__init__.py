@@ -1,8 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
-from typing import List, Union
+from os import cpu_count
+from typing import List, Optional, Union
 
 from ..container import EEGContainer, EventContainer
+from .artifacts import ArtifactRejector, RejectionCriterion, detect_artifacts
+from .design import FilterDesignCache, design_cache
 from .filters import *
+from .streaming import (StreamingFilterBase, StreamingPipeline,
+                        StreamingSOSFilter)
 
 
 class ComponentType(Enum):
@@ -10,6 +16,12 @@ class ComponentType(Enum):
     Undesired = 2
 
 
+class ExecutionMode(Enum):
+    Serial = 1
+    Thread = 2
+    Process = 3
+
+
 class PreprocessingPipeline():
     def __init__(self, *filters: List[FilterBase]) -> None:
         """Preprocessing pipeline for containers. Applies a list of filters to the containers.
@@ -27,22 +39,113 @@ class PreprocessingPipeline():
         """
         self.filters.append(filter)
 
+    def compile(self):
+        """Create a pipeline, in which adjacent linear IIR filters, e.g., HighpassFilter, LowpassFilter, BandpassFilter, and NotchFilter,
+        are grouped into one SOSCascadeFilter. Each filter of a group still runs its own zero-phase pass, so results equal the original pipeline.
+        The only saving is that signals of list backed containers are converted to an array and back once per group instead of once per filter.
+        Containers storing arrays, e.g., buffered EEGContainers and EpochArrays, gain nothing. Single filters are kept as they are.
+
+        :return: New pipeline with fused filters.
+        :rtype: PreprocessingPipeline
+        """
+        filters = []
+        group = []
+        for filter in self.filters + [None]:
+            if filter is not None and filter.to_sos() is not None:
+                group.append(filter)
+                continue
+
+            # End of a group of linear filters
+            if len(group) > 1:
+                filters.append(SOSCascadeFilter(*group))
+            else:
+                filters += group
+            group = []
+            if filter is not None:
+                filters.append(filter)
+        return PreprocessingPipeline(*filters)
+
     def apply(self,
               container: Union[EventContainer,
                                List[EventContainer],
                                EEGContainer,
-                               List[EEGContainer]]):
+                               List[EEGContainer]],
+              mode: ExecutionMode = ExecutionMode.Serial,
+              max_workers: Optional[int] = None,
+              chunk_size: Optional[int] = None):
         """Apply the pipeline to a container or a list of containers. The pipeline is applied in the order the filters were added.
 
+        Lists of containers can be processed in parallel. The list is split into chunks of consecutive containers, and each chunk
+        is processed by a worker of a thread or process pool. Results do not depend on the mode. With ExecutionMode.Thread, filters
+        run concurrently on the containers, which pays off, as scipy releases the GIL while filtering large arrays. With
+        ExecutionMode.Process, chunks are sent to worker processes and filtered data is copied back into the given containers.
+        Thus, containers and filters must be picklable, e.g., EEGContainers may not be streaming to a file.
+
         :param container: Event or list of containers to apply the pipeline to.
         :type container: Union[EventContainer, List[EventContainer], EEGContainer, List[EEGContainer]]
+        :param mode: Execution mode for lists of containers, defaults to ExecutionMode.Serial
+        :type mode: ExecutionMode, optional
+        :param max_workers: Number of workers of the pool. If None, the number of CPUs is used. Defaults to None
+        :type max_workers: Optional[int], optional
+        :param chunk_size: Number of containers processed by a worker at once. If None, containers are split into four chunks per worker. Defaults to None
+        :type chunk_size: Optional[int], optional
         """
         if not isinstance(container, list):
             container = [container]
-        for co in container:
+
+        if mode == ExecutionMode.Serial or len(container) < 2:
+            self._apply_chunk(container)
+            return
+
+        max_workers = max_workers or cpu_count() or 1
+        if not chunk_size:
+            chunk_size = -(-len(container) // (4 * max_workers))
+        chunks = [container[i:i + chunk_size]
+                  for i in range(0, len(container), chunk_size)]
+
+        if mode == ExecutionMode.Thread:
+            with ThreadPoolExecutor(max_workers) as executor:
+                list(executor.map(self._apply_chunk, chunks))
+        elif mode == ExecutionMode.Process:
+            with ProcessPoolExecutor(max_workers) as executor:
+                # map keeps the order of chunks, so results can be zipped
+                # with the given containers
+                for chunk, results in zip(
+                        chunks, executor.map(self._apply_chunk, chunks)):
+                    for co, result in zip(chunk, results):
+                        _copy_signals(result, co)
+        else:
+            raise Exception(f"Unsupported execution mode {mode}")
+
+    def _apply_chunk(
+            self, containers: List[Union[EventContainer, EEGContainer]]) -> List[Union[EventContainer, EEGContainer]]:
+        """Apply all filters to each container of a chunk in place.
+
+        :param containers: Containers to apply the pipeline to.
+        :type containers: List[Union[EventContainer, EEGContainer]]
+        :return: The given containers.
+        :rtype: List[Union[EventContainer, EEGContainer]]
+        """
+        for co in containers:
             for filter in self.filters:
                 filter.apply(co)
+        return containers
 
     def __str__(self) -> str:
         _sub = ", ".join([str(x) for x in self.filters])
         return f"PreprocessingPipeline({_sub})"
+
+
+def _copy_signals(source: Union[EventContainer, EEGContainer],
+                  target: Union[EventContainer, EEGContainer]):
+    """Copy data changed by filters from a container processed in another process back into the original container.
+
+    :param source: Processed container.
+    :type source: Union[EventContainer, EEGContainer]
+    :param target: Original container.
+    :type target: Union[EventContainer, EEGContainer]
+    """
+    target.channel_names = source.channel_names
+    target.sample_rate = source.sample_rate
+    target.timestamps = source.timestamps
+    target.signals = source.signals
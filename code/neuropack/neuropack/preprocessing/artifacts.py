@@ -0,0 +1,145 @@
+from enum import Enum
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..container import EpochArray, EventContainer
+
+
+class RejectionCriterion(Enum):
+    PeakToPeak = 1
+    AbsoluteThreshold = 2
+    Variance = 3
+    Gradient = 4
+
+
+def detect_artifacts(signals: NDArray,
+                     peak_to_peak: Optional[float] = None,
+                     absolute: Optional[float] = None,
+                     variance: Optional[float] = None,
+                     gradient: Optional[float] = None) -> Dict[RejectionCriterion, NDArray]:
+    """Evaluate artifact criteria on stacked epochs. Each criterion is a single reduction over the
+    channel and sample axes, so all epochs are checked at once. Criteria without threshold are skipped.
+
+    :param signals: Signals of shape [events x] channels x samples.
+    :type signals: NDArray
+    :param peak_to_peak: Maximum difference between largest and smallest value of a channel, defaults to None
+    :type peak_to_peak: Optional[float], optional
+    :param absolute: Maximum absolute value of a channel, defaults to None
+    :type absolute: Optional[float], optional
+    :param variance: Maximum variance of a channel, defaults to None
+    :type variance: Optional[float], optional
+    :param gradient: Maximum absolute difference between two consecutive samples, defaults to None
+    :type gradient: Optional[float], optional
+    :return: Dictionary with evaluated criteria as keys and boolean arrays of shape [events] as values, True for epochs exceeding the threshold.
+    :rtype: Dict[RejectionCriterion, NDArray]
+    """
+    signals = np.asarray(signals, dtype=np.float64)
+    axis = (-2, -1)
+    masks = {}
+
+    if peak_to_peak is not None:
+        masks[RejectionCriterion.PeakToPeak] = np.ptp(
+            signals, axis=-1).max(axis=-1) > peak_to_peak
+    if absolute is not None:
+        masks[RejectionCriterion.AbsoluteThreshold] = np.abs(
+            signals).max(axis=axis) > absolute
+    if variance is not None:
+        masks[RejectionCriterion.Variance] = signals.var(
+            axis=-1).max(axis=-1) > variance
+    if gradient is not None:
+        masks[RejectionCriterion.Gradient] = np.abs(
+            np.diff(signals, axis=-1)).max(axis=axis, initial=0) > gradient
+    return masks
+
+
+class ArtifactRejector():
+    __slots__ = "peak_to_peak", "absolute", "variance", "gradient", "channel_names"
+
+    def __init__(self,
+                 peak_to_peak: Optional[float] = None,
+                 absolute: Optional[float] = None,
+                 variance: Optional[float] = None,
+                 gradient: Optional[float] = None,
+                 channel_names: Optional[List[str]] = None) -> None:
+        """Artifact rejection for many epochs at once. An epoch is rejected, if any selected channel exceeds any of the
+        configured thresholds. Thresholds which are None are not checked. E.g., blink detection as done by
+        EventContainer.contains_blink corresponds to ArtifactRejector(absolute=100).
+
+        :param peak_to_peak: Maximum difference between largest and smallest value of a channel, defaults to None
+        :type peak_to_peak: Optional[float], optional
+        :param absolute: Maximum absolute value of a channel, defaults to None
+        :type absolute: Optional[float], optional
+        :param variance: Maximum variance of a channel, defaults to None
+        :type variance: Optional[float], optional
+        :param gradient: Maximum absolute difference between two consecutive samples, defaults to None
+        :type gradient: Optional[float], optional
+        :param channel_names: Channels to check. If None, all channels are checked. Defaults to None
+        :type channel_names: Optional[List[str]], optional
+        """
+        self.peak_to_peak = peak_to_peak
+        self.absolute = absolute
+        self.variance = variance
+        self.gradient = gradient
+        self.channel_names = channel_names
+
+    def criteria(self, epochs: Union[EpochArray, List[EventContainer]]) -> Dict[RejectionCriterion, NDArray]:
+        """Evaluate each configured criterion separately. Lists of EventContainers are stacked by length,
+        so epochs of different length can be mixed.
+
+        :param epochs: Epochs to check.
+        :type epochs: Union[EpochArray, List[EventContainer]]
+        :return: Dictionary with configured criteria as keys and boolean arrays as values, True for epochs exceeding the threshold.
+        :rtype: Dict[RejectionCriterion, NDArray]
+        """
+        if isinstance(epochs, EpochArray):
+            return self.__evaluate(epochs)
+
+        # Stack epochs of equal length, and scatter results back into original order
+        masks = {}
+        groups = {}
+        for i, ev in enumerate(epochs):
+            groups.setdefault(len(ev), []).append(i)
+        for indices in groups.values():
+            stacked = EpochArray.from_events([epochs[i] for i in indices])
+            for criterion, mask in self.__evaluate(stacked).items():
+                masks.setdefault(criterion, np.zeros(
+                    len(epochs), dtype=bool))[indices] = mask
+        return masks
+
+    def mask(self, epochs: Union[EpochArray, List[EventContainer]]) -> NDArray:
+        """Check which epochs contain artifacts.
+
+        :param epochs: Epochs to check.
+        :type epochs: Union[EpochArray, List[EventContainer]]
+        :return: Boolean array, True for each epoch exceeding any threshold.
+        :rtype: NDArray
+        """
+        rejected = np.zeros(len(epochs), dtype=bool)
+        for mask in self.criteria(epochs).values():
+            rejected |= mask
+        return rejected
+
+    def reject(self, epochs: Union[EpochArray, List[EventContainer]]) -> Union[EpochArray, List[EventContainer]]:
+        """Remove epochs containing artifacts. Operation is not performed in place.
+
+        :param epochs: Epochs to check.
+        :type epochs: Union[EpochArray, List[EventContainer]]
+        :return: Epochs without artifacts, of the same type as the given epochs.
+        :rtype: Union[EpochArray, List[EventContainer]]
+        """
+        rejected = self.mask(epochs)
+        if isinstance(epochs, EpochArray):
+            return epochs[~rejected]
+        return [ev for ev, r in zip(epochs, rejected) if not r]
+
+    def __evaluate(self, epochs: EpochArray) -> Dict[RejectionCriterion, NDArray]:
+        signals = epochs.signals
+        if self.channel_names:
+            signals = signals[:, epochs.channel_index(*self.channel_names)]
+        return detect_artifacts(signals, self.peak_to_peak,
+                                self.absolute, self.variance, self.gradient)
+
+    def __str__(self) -> str:
+        return f"ArtifactRejector(peak_to_peak={self.peak_to_peak}, absolute={self.absolute}, variance={self.variance}, gradient={self.gradient})"
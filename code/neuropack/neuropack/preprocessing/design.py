@@ -0,0 +1,113 @@
+from itertools import product
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.signal import butter, iirnotch
+
+
+class FilterDesignCache():
+    __slots__ = "_designs", "hits", "misses"
+
+    def __init__(self) -> None:
+        """Memoized filter design. Coefficients are computed once for each combination of filter type, cutoff, order, and
+        sample rate. Afterwards, each filter gets a copy of the cached coefficients, which is negligible compared to designing them.
+        """
+        self._designs = {}
+        self.hits = 0
+        self.misses = 0
+
+    def butter(self, order: int, cutoff: float, btype: str,
+               sample_rate: int) -> NDArray:
+        """Second-order sections of a digital Butterworth filter, see scipy.signal.butter.
+
+        :param order: Order of the filter.
+        :type order: int
+        :param cutoff: Cutoff frequency.
+        :type cutoff: float
+        :param btype: Type of the filter, e.g., "low" or "high".
+        :type btype: str
+        :param sample_rate: Sample rate of the data.
+        :type sample_rate: int
+        :return: Second-order sections.
+        :rtype: NDArray
+        """
+        key = (btype, float(cutoff), order, sample_rate)
+        return self.__get(key, lambda: (butter(
+            order, cutoff, btype, fs=sample_rate, analog=False, output="sos"),))[0]
+
+    def iirnotch(self, notch: float, quality_factor: float,
+                 sample_rate: int) -> Tuple[NDArray, NDArray]:
+        """Numerator and denominator of a notch filter, see scipy.signal.iirnotch.
+
+        :param notch: Frequency to remove.
+        :type notch: float
+        :param quality_factor: Quality factor of the filter.
+        :type quality_factor: float
+        :param sample_rate: Sample rate of the data.
+        :type sample_rate: int
+        :return: Tuple of numerator and denominator.
+        :rtype: Tuple[NDArray, NDArray]
+        """
+        key = ("notch", float(notch), float(quality_factor), sample_rate)
+        return self.__get(key, lambda: iirnotch(
+            notch, quality_factor, sample_rate))
+
+    def precompute(self,
+                   cutoffs: Iterable[float] = (),
+                   sample_rates: Iterable[int] = (256,),
+                   btypes: Iterable[str] = ("low", "high"),
+                   orders: Iterable[int] = (5,),
+                   notches: Iterable[float] = (),
+                   quality_factors: Iterable[float] = (30,)) -> None:
+        """Design all combinations of the given parameters up front, e.g., before a hyper-parameter sweep.
+
+        :param cutoffs: Cutoff frequencies of Butterworth filters, defaults to ()
+        :type cutoffs: Iterable[float], optional
+        :param sample_rates: Sample rates, defaults to (256,)
+        :type sample_rates: Iterable[int], optional
+        :param btypes: Types of Butterworth filters, defaults to ("low", "high")
+        :type btypes: Iterable[str], optional
+        :param orders: Orders of Butterworth filters, defaults to (5,)
+        :type orders: Iterable[int], optional
+        :param notches: Frequencies of notch filters, defaults to ()
+        :type notches: Iterable[float], optional
+        :param quality_factors: Quality factors of notch filters, defaults to (30,)
+        :type quality_factors: Iterable[float], optional
+        """
+        sample_rates = list(sample_rates)
+        for order, cutoff, btype, sample_rate in product(orders, cutoffs, btypes, sample_rates):
+            self.butter(order, cutoff, btype, sample_rate)
+        for notch, quality_factor, sample_rate in product(notches, quality_factors, sample_rates):
+            self.iirnotch(notch, quality_factor, sample_rate)
+
+    def info(self) -> Dict[str, int]:
+        """Statistics of the cache.
+
+        :return: Dictionary containing number of hits, misses, and cached designs.
+        :rtype: Dict[str, int]
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._designs)}
+
+    def clear(self) -> None:
+        """Remove all cached designs and reset statistics."""
+        self._designs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __get(self, key: tuple, design) -> tuple:
+        coefficients = self._designs.get(key)
+        if coefficients is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            coefficients = design()
+            self._designs[key] = coefficients
+        return tuple(np.array(c) for c in coefficients)
+
+    def __len__(self) -> int:
+        return len(self._designs)
+
+
+# Cache shared by all filters
+design_cache = FilterDesignCache()
@@ -1,16 +1,65 @@
-from abc import ABC, abstractclassmethod
-from typing import Union
+from abc import ABC
+from enum import Enum
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
-from scipy.signal import butter, detrend, filtfilt, iirnotch, sosfiltfilt
+from numpy.typing import NDArray
+from scipy.signal import detrend, filtfilt, sosfiltfilt, tf2sos
 
-from ..container import AbstractContainer, EventContainer
+from ..container import AbstractContainer, EpochArray, EventContainer
+from .design import design_cache
+
+
+def _transform(data: Union[AbstractContainer, EpochArray],
+               function: Callable[[NDArray], NDArray]) -> None:
+    """Replace signals of a container or an EpochArray by the result of function, which is called once with all signals
+    as channels x samples or epochs x channels x samples array. Signals are converted to lists only if the container stores lists.
+
+    :param data: Container to transform.
+    :type data: Union[AbstractContainer, EpochArray]
+    :param function: Function transforming signals along the last axis.
+    :type function: Callable[[NDArray], NDArray]
+    """
+    if isinstance(data, EpochArray):
+        data.signals = function(data.signals)
+        return
+
+    is_list = isinstance(data[0], list)
+    signals = np.asarray(data.signals, dtype=np.float64).reshape(
+        len(data.channel_names), len(data))
+    t = function(signals)
+    data.signals = [x.tolist() for x in t] if is_list else t
 
 
 class FilterBase(ABC):
-    @abstractclassmethod
-    def apply(self, data: EventContainer) -> None:
-        pass
+    def apply(self, data: Union[AbstractContainer, EpochArray]) -> None:
+        """Apply the filter to a container or an EpochArray. All channels, and all epochs of an EpochArray, are filtered with a single
+        call of filter_array. Signals are converted to lists only if the container stores lists. The filter is applied in-place.
+
+        :param data: Container to apply the filter to.
+        :type data: Union[AbstractContainer, EpochArray]
+        """
+        _transform(data, self.filter_array)
+
+    def filter_array(self, signals: NDArray) -> NDArray:
+        """Filter signals along the last axis, e.g., channels x samples or epochs x channels x samples.
+
+        :param signals: Signals to filter.
+        :type signals: NDArray
+        :raises Exception: Filter can only be applied to containers.
+        :return: Filtered signals of the same shape.
+        :rtype: NDArray
+        """
+        raise Exception(f"{str(self)} can't be applied to arrays")
+
+    def to_sos(self) -> Optional[NDArray]:
+        """Second-order sections of the filter, if it is a linear IIR filter applied forward and backward.
+        Such filters can be fused into a single SOSCascadeFilter, see PreprocessingPipeline.compile.
+
+        :return: Second-order sections of shape n x 6, or None if the filter can't be fused.
+        :rtype: Optional[NDArray]
+        """
+        return None
 
 
 class DetrendFilter(FilterBase):
@@ -18,18 +67,8 @@ class DetrendFilter(FilterBase):
         """Detrend filter. Removes linear trend from data. Uses scipy.signal.detrend. See https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.detrend.html for more information."""
         super().__init__()
 
-    def apply(self, data: AbstractContainer) -> None:
-        """Apply the filter to an AbstractContainer. The filter is applied to all channels in the AbstractContainer. The filter is applied in-place.
-
-        :param data: Container to apply the filter to.
-        :type data: AbstractContainer
-        """
-        for c in data.channel_names:
-            t = detrend(data[c])
-            if isinstance(data[c], list):
-                data[c] = t.tolist()
-            else:
-                data[c] = t
+    def filter_array(self, signals: NDArray) -> NDArray:
+        return detrend(signals, axis=-1)
 
     def __str__(self) -> str:
         return f"DetrendFilter()"
@@ -46,26 +85,13 @@ class HighpassFilter(FilterBase):
         """
         super().__init__()
         self._cutoff = cutoff
-        self.sos = butter(
-            5,
-            cutoff,
-            "high",
-            fs=sample_rate,
-            analog=False,
-            output="sos")
+        self.sos = design_cache.butter(5, cutoff, "high", sample_rate)
 
-    def apply(self, data: AbstractContainer) -> None:
-        """Apply the filter to an AbstractContainer. The filter is applied to all channels in the AbstractContainer. The filter is applied in-place.
+    def filter_array(self, signals: NDArray) -> NDArray:
+        return sosfiltfilt(self.sos, signals, axis=-1)
 
-        :param data: Container to apply the filter to.
-        :type data: AbstractContainer
-        """
-        for c in data.channel_names:
-            t = sosfiltfilt(self.sos, data[c])
-            if isinstance(data[c], list):
-                data[c] = t.tolist()
-            else:
-                data[c] = t
+    def to_sos(self) -> NDArray:
+        return self.sos
 
     def __str__(self) -> str:
         return f"HighpassFilter(cutoff={self._cutoff})"
@@ -82,26 +108,13 @@ class LowpassFilter(FilterBase):
         """
         super().__init__()
         self._cutoff = cutoff
-        self.sos = butter(
-            5,
-            cutoff,
-            "low",
-            fs=sample_rate,
-            analog=False,
-            output="sos")
+        self.sos = design_cache.butter(5, cutoff, "low", sample_rate)
 
-    def apply(self, data: AbstractContainer) -> None:
-        """Apply the filter to an AbstractContainer. The filter is applied to all channels in the AbstractContainer. The filter is applied in-place.
+    def filter_array(self, signals: NDArray) -> NDArray:
+        return sosfiltfilt(self.sos, signals, axis=-1)
 
-        :param data: Container to apply the filter to.
-        :type data: AbstractContainer
-        """
-        for c in data.channel_names:
-            t = sosfiltfilt(self.sos, data[c])
-            if isinstance(data[c], list):
-                data[c] = t.tolist()
-            else:
-                data[c] = t
+    def to_sos(self) -> NDArray:
+        return self.sos
 
     def __str__(self) -> str:
         return f"LowpassFilter(cutoff={self._cutoff})"
@@ -122,14 +135,11 @@ class BandpassFilter(FilterBase):
         self.low_pass = LowpassFilter(high, sample_rate)
         self.high_pass = HighpassFilter(low, sample_rate)
 
-    def apply(self, data: AbstractContainer) -> None:
-        """Apply the filter to an AbstractContainer. The filter is applied to all channels in the AbstractContainer. The filter is applied in-place.
+    def filter_array(self, signals: NDArray) -> NDArray:
+        return self.high_pass.filter_array(self.low_pass.filter_array(signals))
 
-        :param data: Container to apply the filter to.
-        :type data: AbstractContainer
-        """
-        self.low_pass.apply(data)
-        self.high_pass.apply(data)
+    def to_sos(self) -> NDArray:
+        return np.vstack([self.low_pass.sos, self.high_pass.sos])
 
     def __str__(self) -> str:
         return f"BandpassFilter({str(self.low_pass)}, {str(self.high_pass)})"
@@ -140,39 +150,130 @@ class NotchFilter(FilterBase):
         super().__init__()
         self._notch = notch
         self._quality_factor = quality_factor
-        self.b, self.a = iirnotch(notch, quality_factor, sample_rate)
+        self.b, self.a = design_cache.iirnotch(
+            notch, quality_factor, sample_rate)
 
-    def apply(self, data: AbstractContainer) -> None:
-        """Apply the filter to an AbstractContainer. The filter is applied to all channels in the AbstractContainer. The filter is applied in-place.
+    def filter_array(self, signals: NDArray) -> NDArray:
+        return filtfilt(self.b, self.a, signals, axis=-1)
 
-        :param data: Container to apply the filter to.
-        :type data: AbstractContainer
-        """
-        for c in data.channel_names:
-            t = filtfilt(self.b, self.a, data[c])
-            if isinstance(data[c], list):
-                data[c] = t.tolist()
-            else:
-                data[c] = t
+    def to_sos(self) -> NDArray:
+        return tf2sos(self.b, self.a)
 
     def __str__(self) -> str:
         return f"NotchFilter(notch={self._notch}, quality_factor={self._quality_factor})"
 
 
+class SOSCascadeFilter(FilterBase):
+    def __init__(self, *filters: List[FilterBase]) -> None:
+        """Cascade of linear IIR filters. Each filter runs its own zero-phase pass with its own padding and initial conditions,
+        so results equal applying the filters one after another over the whole signal, including its edges. The only difference
+        to separate filters is that signals of list backed containers are converted to an array and back once for the whole
+        cascade instead of once per filter. Containers storing arrays gain nothing.
+
+        Second-order sections of all filters are concatenated into sos. They are only kept for causal streaming, see
+        StreamingSOSFilter, and are never used by filter_array.
+
+        :param filters: Filters to fuse. Each filter must provide second-order sections, see FilterBase.to_sos.
+        :type filters: List[FilterBase]
+        :raises Exception: A filter can't be fused.
+        """
+        super().__init__()
+        if not filters:
+            raise Exception("Cascade requires at least one filter")
+        for f in filters:
+            if f.to_sos() is None:
+                raise Exception(f"{str(f)} can't be fused")
+
+        self.filters = list(filters)
+        self.sos = np.vstack([f.to_sos() for f in filters])
+
+    def filter_array(self, signals: NDArray) -> NDArray:
+        # A single sosfiltfilt over all sections would pad the signal once for
+        # the whole cascade, which changes results near the edges
+        for f in self.filters:
+            signals = f.filter_array(signals)
+        return signals
+
+    def to_sos(self) -> NDArray:
+        return self.sos
+
+    def __str__(self) -> str:
+        _sub = ", ".join([str(x) for x in self.filters])
+        return f"SOSCascadeFilter({_sub})"
+
+
+class BaselineMode(Enum):
+    Mean = 1
+    Median = 2
+
+
 class BaselineCorrectionFilter(FilterBase):
-    def apply(self, data: EventContainer) -> None:
-        """Apply the filter to an EventContainer. The filter is applied to all channels in the EventContainer. The filter is applied in-place. The baseline is calculated as the average of the data before the stimulus.
+    def __init__(self,
+                 window: Optional[Tuple[int, int]] = None,
+                 mode: BaselineMode = BaselineMode.Mean) -> None:
+        """Baseline correction filter. Subtracts the baseline of each channel, i.e., the average of the data before the stimulus.
+        Timestamps are expected relative to the stimulus, as for EventContainers extracted from an EEGContainer.
+
+        :param window: Baseline window in milliseconds relative to the stimulus, e.g., (-200, 0). Start is inclusive, end is exclusive. If None, all samples before the stimulus are used. Defaults to None
+        :type window: Optional[Tuple[int, int]], optional
+        :param mode: Average used as baseline. BaselineMode.Median is robust against outliers, e.g., blinks. Defaults to BaselineMode.Mean
+        :type mode: BaselineMode, optional
+        """
+        super().__init__()
+        self.window = window
+        self.mode = mode
+
+    def apply(self, data: Union[EventContainer, EpochArray]) -> None:
+        """Apply the filter to an EventContainer or an EpochArray. The filter is applied to all channels in the EventContainer. The filter is applied in-place.
+        For EpochArrays, the baseline window is resolved once from the timestamps of the first epoch and baselines of all epochs and channels are calculated at once.
 
         :param data: Container to apply the filter to.
-        :type data: EventContainer
+        :type data: Union[EventContainer, EpochArray]
+        """
+        timestamps = np.asarray(data.timestamps, dtype=np.float64)
+        if timestamps.ndim > 1:
+            timestamps = timestamps[0]
+        window = self.baseline_window(timestamps)
+        _transform(data, lambda x: self.correct_array(x, window))
+
+    def baseline_window(self, timestamps: NDArray) -> slice:
+        """Resolve the baseline window to sample indices.
+
+        :param timestamps: Timestamps relative to the stimulus in seconds, in ascending order.
+        :type timestamps: NDArray
+        :raises Exception: Baseline window contains no samples.
+        :return: Slice of samples in the baseline window.
+        :rtype: slice
+        """
+        start, stop = (-np.inf, 0) if self.window is None else (
+            self.window[0] / 1000, self.window[1] / 1000)
+        window = slice(int(np.searchsorted(timestamps, start, side="left")),
+                       int(np.searchsorted(timestamps, stop, side="left")))
+        if window.start >= window.stop:
+            raise Exception("Baseline window contains no samples")
+        return window
+
+    def correct_array(self, signals: NDArray, window: slice) -> NDArray:
+        """Subtract baselines from signals along the last axis, e.g., channels x samples or epochs x channels x samples.
+
+        :param signals: Signals to correct.
+        :type signals: NDArray
+        :param window: Samples in the baseline window, see baseline_window.
+        :type window: slice
+        :return: Corrected signals of the same shape.
+        :rtype: NDArray
         """
-        stim_i = np.where(data.timestamps == 0)[0][0]
-        for channel in data.channel_names:
-            avg = sum(data[channel][0:stim_i]) / stim_i
-            data[channel] -= avg
+        baseline = signals[..., window]
+        if self.mode == BaselineMode.Median:
+            baseline = np.median(baseline, axis=-1, keepdims=True)
+        else:
+            baseline = baseline.mean(axis=-1, keepdims=True)
+        return signals - baseline
 
     def __str__(self) -> str:
-        return f"BaselineCorrectionFilter()"
+        if self.window is None and self.mode == BaselineMode.Mean:
+            return f"BaselineCorrectionFilter()"
+        return f"BaselineCorrectionFilter(window={self.window}, mode={self.mode.name})"
 
 
 class ReductionFilter(FilterBase):
@@ -194,8 +295,11 @@ class ReductionFilter(FilterBase):
         :type data: AbstractContainer
         """
         new = data.average_sub_ch(*self.channel_selection)
+        signals = new.signals
+        if isinstance(data[0], list):
+            signals = [x.tolist() for x in signals]
         data.channel_names = new.channel_names
-        data.signals = new.signals
+        data.signals = signals
 
     def __str__(self) -> str:
         str_selection = str(self.channel_selection)
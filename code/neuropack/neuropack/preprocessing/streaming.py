@@ -0,0 +1,138 @@
+from abc import ABC, abstractmethod
+from typing import List, Union
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.signal import sosfilt, sosfilt_zi
+
+from ..devices.base import BCISignal
+from .filters import FilterBase
+
+
+class StreamingFilterBase(ABC):
+    @abstractmethod
+    def process(self, signals: NDArray) -> NDArray:
+        """Filter the next chunk of a stream. State is kept between calls, so chunks must be passed in order.
+
+        :param signals: Chunk of shape channels x samples.
+        :type signals: NDArray
+        :return: Filtered chunk of shape channels x samples.
+        :rtype: NDArray
+        """
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Reset state, e.g., before a new stream starts."""
+        pass
+
+
+class StreamingSOSFilter(StreamingFilterBase):
+    __slots__ = "filters", "sos", "_zi"
+
+    def __init__(self, *filters: List[FilterBase]) -> None:
+        """Causal counterpart of linear IIR filters, e.g., HighpassFilter, LowpassFilter, BandpassFilter, and NotchFilter.
+        Second-order sections of all filters are applied once in forward direction using scipy.signal.sosfilt. The filter state
+        is kept between chunks, so filtering a stream chunk by chunk equals filtering the whole stream at once. On the first chunk,
+        the state is initialized to the steady state for the first sample, to avoid a transient at the start of the stream.
+
+        In contrast to the zero-phase filters, the output is delayed depending on the filter's group delay. See
+        https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.sosfilt.html for more information.
+
+        :param filters: Filters to apply. Each filter must provide second-order sections, see FilterBase.to_sos.
+        :type filters: List[FilterBase]
+        :raises Exception: A filter can't be applied causally.
+        """
+        if not filters:
+            raise Exception("Streaming filter requires at least one filter")
+        for f in filters:
+            if f.to_sos() is None:
+                raise Exception(f"{str(f)} can't be applied to a stream")
+
+        self.filters = list(filters)
+        self.sos = np.vstack([f.to_sos() for f in filters])
+        self._zi = None
+
+    def process(self, signals: NDArray) -> NDArray:
+        signals = np.asarray(signals, dtype=np.float64)
+        if signals.shape[-1] == 0:
+            return signals
+
+        if self._zi is None:
+            # Steady state for the first sample of each channel. Shape is
+            # sections x channels x 2.
+            self._zi = sosfilt_zi(self.sos)[:, None, :] * \
+                signals[None, :, :1]
+
+        filtered, self._zi = sosfilt(
+            self.sos, signals, axis=-1, zi=self._zi)
+        return filtered
+
+    def reset(self) -> None:
+        self._zi = None
+
+    def __str__(self) -> str:
+        _sub = ", ".join([str(x) for x in self.filters])
+        return f"StreamingSOSFilter({_sub})"
+
+
+class StreamingPipeline():
+    __slots__ = "filters"
+
+    def __init__(self, *filters: List[Union[StreamingFilterBase, FilterBase]]) -> None:
+        """Pipeline of streaming filters, which preprocesses data while it is recorded, e.g., samples fetched from a device.
+        Linear IIR filters, which are passed directly, are converted into their causal counterpart. Adjacent ones are combined into
+        one StreamingSOSFilter.
+
+        :param filters: Filters to apply in the given order.
+        :type filters: List[Union[StreamingFilterBase, FilterBase]]
+        :raises Exception: A filter can't be applied to a stream.
+        """
+        self.filters = []
+        group = []
+        for filter in list(filters) + [None]:
+            if isinstance(filter, FilterBase):
+                group.append(filter)
+                continue
+
+            if group:
+                self.filters.append(StreamingSOSFilter(*group))
+                group = []
+            if filter is not None:
+                self.filters.append(filter)
+
+    def process(self, signals: NDArray) -> NDArray:
+        """Filter the next chunk of a stream.
+
+        :param signals: Chunk of shape channels x samples.
+        :type signals: NDArray
+        :return: Filtered chunk of shape channels x samples.
+        :rtype: NDArray
+        """
+        for filter in self.filters:
+            signals = filter.process(signals)
+        return signals
+
+    def process_samples(self, samples: List[BCISignal]) -> List[BCISignal]:
+        """Filter samples as fetched from a device. All samples are filtered as one chunk.
+
+        :param samples: Samples in order of recording.
+        :type samples: List[BCISignal]
+        :return: Filtered samples with unchanged timestamps.
+        :rtype: List[BCISignal]
+        """
+        if not samples:
+            return []
+
+        signals = np.array([x.signals for x in samples], dtype=np.float64).T
+        filtered = self.process(signals).T.tolist()
+        return [BCISignal(x.timestamp, s) for x, s in zip(samples, filtered)]
+
+    def reset(self) -> None:
+        """Reset state of all filters, e.g., before a new recording starts."""
+        for filter in self.filters:
+            filter.reset()
+
+    def __str__(self) -> str:
+        _sub = ", ".join([str(x) for x in self.filters])
+        return f"StreamingPipeline({_sub})"
@@ -1,35 +1,96 @@
 from copy import deepcopy
+from enum import Enum
 from typing import Any, List, Tuple, Union
 
 import numpy as np
 from numpy.typing import NDArray
 
 
-def osum(collection: Union[List[Any], Tuple[Any]]) -> Any:
+class SumMode(Enum):
+    """Enum for summation mode. Used to determine how collections are summed up by osum and oavg."""
+    Sequential = 1
+    Pairwise = 2
+    Kahan = 3
+
+
+def osum(collection: Union[List[Any], Tuple[Any]],
+         mode: SumMode = SumMode.Sequential) -> Any:
     """Allows sum operation over any collection.
     In contrast to build-in sum works with things
     other than numbers. For example, it can sum up lists.
 
+    Elements of the collection are never modified. Sequential mode creates one accumulator from the
+    first two elements and adds all further elements in place, so objects implementing __iadd__
+    (numpy arrays, EventContainers) are summed up without further allocations. Pairwise mode sums
+    up the collection as a balanced tree, which limits the accumulated rounding error to O(log n).
+    Kahan mode uses compensated summation and requires elements to support subtraction.
+
     :param collection: Collection to sum up.
     :type collection: Union[List[Any], Tuple[Any]]
+    :param mode: Summation mode, defaults to SumMode.Sequential
+    :type mode: SumMode, optional
     """
     if len(collection) == 0:
         return None
-    s = deepcopy(collection[0])
-    for o in collection[1:]:
-        s += o
-    return s
+    if len(collection) == 1:
+        return deepcopy(collection[0])
+
+    if mode == SumMode.Pairwise:
+        return _pairwise_sum(collection)
+    if mode == SumMode.Kahan:
+        return _kahan_sum(collection)
+    return _sequential_sum(collection)
 
 
-def oavg(collection: Union[List[Any], Tuple[Any]]) -> Any:
+def oavg(collection: Union[List[Any], Tuple[Any]],
+         mode: SumMode = SumMode.Sequential) -> Any:
     """Allows average operation over any collection.
 
     :param collection: Collection to average.
     :type collection: Union[List[Any], Tuple[Any]]
+    :param mode: Summation mode, see osum. Defaults to SumMode.Sequential
+    :type mode: SumMode, optional
     """
     if len(collection) == 0:
         return None
-    return osum(collection) / len(collection)
+    return osum(collection, mode) / len(collection)
+
+
+def _sequential_sum(collection: Union[List[Any], Tuple[Any]]) -> Any:
+    """Sums up a collection of at least two elements from left to right.
+    """
+    s = collection[0] + collection[1]
+    for o in collection[2:]:
+        s += o
+    return s
+
+
+def _pairwise_sum(collection: Union[List[Any], Tuple[Any]],
+                  block_size: int = 8) -> Any:
+    """Sums up a collection of at least two elements as a balanced tree. Blocks of up
+    to block_size elements are summed up sequentially.
+    """
+    if len(collection) <= block_size:
+        return _sequential_sum(collection)
+
+    mid = len(collection) // 2
+    s = _pairwise_sum(collection[:mid], block_size)
+    s += _pairwise_sum(collection[mid:], block_size)
+    return s
+
+
+def _kahan_sum(collection: Union[List[Any], Tuple[Any]]) -> Any:
+    """Sums up a collection of at least two elements using Kahan summation. The lost
+    low order part of each addition is carried in a compensation term.
+    """
+    s = deepcopy(collection[0])
+    compensation = None
+    for o in collection[1:]:
+        y = o if compensation is None else o - compensation
+        t = s + y
+        compensation = (t - s) - y
+        s = t
+    return s
 
 
 def normalize_npy(array: NDArray) -> NDArray:
@@ -0,0 +1,66 @@
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.fft import irfft, next_fast_len, rfft
+
+
+def autocorrelation(signals: NDArray, max_lag: int) -> NDArray:
+    """Biased autocorrelation of demeaned signals along the last axis, i.e., sums of lagged products divided by the number of samples.
+    All signals are transformed at once with a Fast Fourier Transformation.
+
+    :param signals: Signals of shape [events x channels x] samples.
+    :type signals: NDArray
+    :param max_lag: Largest lag to return.
+    :type max_lag: int
+    :return: Autocorrelation for lags 0 to max_lag, of shape [events x channels x] (max_lag + 1).
+    :rtype: NDArray
+    """
+    signals = np.asarray(signals, dtype=np.float64)
+    n = signals.shape[-1]
+    x = signals - signals.mean(axis=-1, keepdims=True)
+
+    # Zero padding to at least 2n - 1 avoids circular overlap
+    nfft = next_fast_len(2 * n - 1, real=True)
+    spectrum = rfft(x, n=nfft, axis=-1)
+    r = irfft(spectrum.real ** 2 + spectrum.imag ** 2, n=nfft, axis=-1)
+    return r[..., :max_lag + 1] / n
+
+
+def levinson_durbin(r: NDArray) -> Tuple[NDArray, NDArray]:
+    """Solve the Yule-Walker equations for all autocorrelation sequences at once using the Levinson-Durbin recursion.
+
+    :param r: Autocorrelation for lags 0 to order, of shape [events x channels x] (order + 1).
+    :type r: NDArray
+    :return: Tuple of AR coefficients of shape [events x channels x] order, and variance of the prediction error of shape [events x channels].
+    :rtype: Tuple[NDArray, NDArray]
+    """
+    order = r.shape[-1] - 1
+    rho = np.zeros(r.shape[:-1] + (order,), dtype=np.float64)
+    error = r[..., 0].copy()
+
+    for m in range(order):
+        # Reflection coefficient of step m
+        acc = r[..., m + 1] - \
+            np.einsum("...j,...j->...", rho[..., :m], r[..., m:0:-1])
+        k = acc / error
+
+        rho[..., :m] -= k[..., None] * rho[..., m - 1::-1][..., :m]
+        rho[..., m] = k
+        error *= 1 - k ** 2
+    return rho, error
+
+
+def yule_walker(signals: NDArray, order: int = 10) -> Tuple[NDArray, NDArray]:
+    """Estimate AR coefficients of all signals at once by solving the Yule-Walker equations. Results are equal to
+    statsmodels.regression.yule_walker with method="mle" for each signal.
+
+    :param signals: Signals of shape [events x channels x] samples.
+    :type signals: NDArray
+    :param order: Order of the AR model, defaults to 10
+    :type order: int, optional
+    :return: Tuple of AR coefficients of shape [events x channels x] order, and standard deviation of the prediction error of shape [events x channels].
+    :rtype: Tuple[NDArray, NDArray]
+    """
+    rho, error = levinson_durbin(autocorrelation(signals, order))
+    return rho, np.sqrt(error)
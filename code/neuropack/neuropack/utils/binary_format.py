@@ -0,0 +1,111 @@
+from json import dumps, loads
+from struct import calcsize, pack, unpack
+from typing import List, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+MAGIC = b"NPEEGREC"
+VERSION = 1
+ALIGNMENT = 64
+
+# Magic, version, header length
+_PREFIX = "<8sHI"
+
+
+def write_recording(file_name: str,
+                    channel_names: List[str],
+                    sample_rate: int,
+                    timestamps: Union[List[float], NDArray],
+                    signals: Union[List[List[float]], NDArray],
+                    event_indices: Union[List[int], NDArray]) -> None:
+    """Write a recording in binary format. The file starts with a fixed prefix (magic, version, header length),
+    followed by a json header containing channel names, sample rate, number of samples, and event indices.
+    After padding to a multiple of 64 bytes, data follows as one contiguous little endian float64 array of shape
+    (channels + 1) x samples. The first row contains the timestamps, the remaining rows the channels.
+
+    :param file_name: File name to write to.
+    :type file_name: str
+    :param channel_names: List of channel names.
+    :type channel_names: List[str]
+    :param sample_rate: Sample rate in Hz.
+    :type sample_rate: int
+    :param timestamps: Timestamps of all samples.
+    :type timestamps: Union[List[float], NDArray]
+    :param signals: Signals of shape channels x samples.
+    :type signals: Union[List[List[float]], NDArray]
+    :param event_indices: Indices of samples marked as events.
+    :type event_indices: Union[List[int], NDArray]
+    """
+    timestamps = np.asarray(timestamps, dtype="<f8")
+    signals = np.asarray(signals, dtype="<f8").reshape(
+        len(channel_names), len(timestamps))
+
+    header = dumps({
+        "channel_names": list(channel_names),
+        "sample_rate": sample_rate,
+        "num_samples": len(timestamps),
+        "event_indices": [int(x) for x in event_indices]
+    }).encode("utf-8")
+
+    # Pad header, so data starts at an aligned offset
+    offset = calcsize(_PREFIX) + len(header)
+    header += b" " * (-offset % ALIGNMENT)
+
+    with open(file_name, "wb") as f:
+        f.write(pack(_PREFIX, MAGIC, VERSION, len(header)))
+        f.write(header)
+        timestamps.tofile(f)
+        signals.tofile(f)
+
+
+def read_header(file_name: str) -> Tuple[dict, int]:
+    """Read header of a binary recording.
+
+    :param file_name: File name to read from.
+    :type file_name: str
+    :raises Exception: File is not a binary recording or of an unsupported version.
+    :return: Tuple of header dictionary and byte offset of data.
+    :rtype: Tuple[dict, int]
+    """
+    with open(file_name, "rb") as f:
+        prefix = f.read(calcsize(_PREFIX))
+        if len(prefix) != calcsize(_PREFIX):
+            raise Exception("File is not a binary recording")
+
+        magic, version, header_length = unpack(_PREFIX, prefix)
+        if magic != MAGIC:
+            raise Exception("File is not a binary recording")
+        if version != VERSION:
+            raise Exception(f"Unsupported recording version {version}")
+
+        header = loads(f.read(header_length).decode("utf-8"))
+    return header, calcsize(_PREFIX) + header_length
+
+
+def read_recording(file_name: str,
+                   mmap: bool = True) -> Tuple[dict, NDArray, NDArray]:
+    """Read a binary recording. If mmap is set, data is not read into memory but mapped with np.memmap in
+    copy-on-write mode. Thereby, only accessed parts of a recording are read from disk and changes to the
+    returned arrays are never written back to the file.
+
+    :param file_name: File name to read from.
+    :type file_name: str
+    :param mmap: Map data instead of reading it, defaults to True
+    :type mmap: bool, optional
+    :return: Tuple of header dictionary, timestamps, and signals of shape channels x samples.
+    :rtype: Tuple[dict, NDArray, NDArray]
+    """
+    header, offset = read_header(file_name)
+    shape = (len(header["channel_names"]) + 1, header["num_samples"])
+
+    if mmap and header["num_samples"] > 0:
+        data = np.memmap(file_name, dtype="<f8", mode="c",
+                         offset=offset, shape=shape)
+    else:
+        with open(file_name, "rb") as f:
+            f.seek(offset)
+            data = np.fromfile(f, dtype="<f8", count=shape[0] * shape[1])
+        data = data.reshape(shape)
+
+    return header, data[0], data[1:]
@@ -0,0 +1,257 @@
+from typing import List, Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class SignalBuffer():
+    __slots__ = "_data", "_timestamps", "_start", "_size", "_max_size", "_evicted"
+
+    def __init__(self,
+                 num_channels: int,
+                 capacity: int = 1024,
+                 max_size: Optional[int] = None) -> None:
+        """Growable storage for multichannel recordings. Signals are kept in one preallocated
+        float64 array of shape channels x capacity, timestamps in a matching vector. Appending
+        is amortized O(1), as capacity is doubled whenever the buffer runs full. Signals and
+        timestamps are exposed as views on the stored data, so no copies are created on access.
+
+        If max_size is set, the buffer keeps a sliding window of the newest max_size samples and
+        older samples are evicted. Storage is then bounded to twice the window. Retained samples
+        are moved to the front of new storage only when the end of the storage is reached, so appending
+        stays amortized O(1), signals and timestamps remain contiguous views, and previously returned
+        views are never overwritten.
+
+        :param num_channels: Number of channels to store.
+        :type num_channels: int
+        :param capacity: Number of samples to preallocate, defaults to 1024
+        :type capacity: int, optional
+        :param max_size: Maximum number of retained samples. If None, the buffer grows without bound. Defaults to None
+        :type max_size: Optional[int], optional
+        """
+        if max_size is not None:
+            if max_size < 1:
+                raise Exception("Maximum size must be positive")
+            capacity = 2 * max_size
+        capacity = max(capacity, 1)
+        self._data = np.zeros((num_channels, capacity), dtype=np.float64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self._max_size = max_size
+        self._evicted = 0
+
+    @classmethod
+    def from_arrays(cls, timestamps: NDArray, signals: NDArray):
+        """Create SignalBuffer around existing arrays without copying them, e.g., around memory mapped data.
+        The arrays are only copied once the buffer has to grow.
+
+        :param timestamps: Timestamps of all samples.
+        :type timestamps: NDArray
+        :param signals: Signals of shape channels x samples.
+        :type signals: NDArray
+        :return: SignalBuffer using the given arrays as storage.
+        :rtype: SignalBuffer
+        """
+        if signals.ndim != 2 or signals.shape[1] != len(timestamps):
+            raise Exception(
+                "Shape of signals does not match number of timestamps")
+
+        instance = cls.__new__(cls)
+        instance._timestamps = timestamps
+        instance._data = signals
+        instance._start = 0
+        instance._size = len(timestamps)
+        instance._max_size = None
+        instance._evicted = 0
+        return instance
+
+    def append(self, timestamp: float, signals: List[float]) -> None:
+        """Append a single sample to the buffer.
+
+        :param timestamp: Time stamp of the sample.
+        :type timestamp: float
+        :param signals: One value per channel.
+        :type signals: List[float]
+        """
+        self.__make_room(1)
+        end = self._start + self._size
+        self._data[:, end] = signals
+        self._timestamps[end] = timestamp
+        self._size += 1
+
+    def extend(self,
+               timestamps: Union[List[float], NDArray],
+               signals: Union[List[List[float]], NDArray]) -> None:
+        """Append a block of samples to the buffer.
+
+        :param timestamps: Time stamps of the samples.
+        :type timestamps: Union[List[float], NDArray]
+        :param signals: Samples of shape channels x len(timestamps).
+        :type signals: Union[List[List[float]], NDArray]
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        signals = np.asarray(signals, dtype=np.float64)
+        n = len(timestamps)
+        if signals.shape != (self._data.shape[0], n):
+            raise Exception(
+                "Shape of signals does not match number of channels and timestamps")
+
+        # Samples of the block which would be evicted right away are skipped
+        if self._max_size is not None and n > self._max_size:
+            self._evicted += n - self._max_size
+            timestamps = timestamps[n - self._max_size:]
+            signals = signals[:, n - self._max_size:]
+            n = self._max_size
+
+        self.__make_room(n)
+        end = self._start + self._size
+        self._data[:, end:end + n] = signals
+        self._timestamps[end:end + n] = timestamps
+        self._size += n
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the preallocated storage to hold at least capacity samples. Stored data is kept.
+
+        :param capacity: Number of samples the buffer should be able to hold.
+        :type capacity: int
+        """
+        if capacity <= self.capacity:
+            return
+
+        self.__move(np.zeros((self._data.shape[0], capacity), dtype=np.float64),
+                    np.zeros(capacity, dtype=np.float64))
+
+    def clear(self) -> None:
+        """Remove all samples from the buffer. Preallocated storage is kept.
+        """
+        self._start = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the buffer can hold before it has to grow."""
+        return self._data.shape[1]
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """Maximum number of retained samples, None if the buffer grows without bound."""
+        return self._max_size
+
+    @property
+    def evicted(self) -> int:
+        """Number of samples evicted from the sliding window so far."""
+        return self._evicted
+
+    @property
+    def num_channels(self) -> int:
+        """Number of channels stored in the buffer."""
+        return self._data.shape[0]
+
+    @property
+    def signals(self) -> NDArray:
+        """View on stored signals of shape channels x samples."""
+        return self._data[:, self._start:self._start + self._size]
+
+    @signals.setter
+    def signals(self, value: Union[List[List[float]], NDArray]) -> None:
+        """Replace stored signals. The number of channels is taken from the new data and
+        the buffer length is set to the number of samples in the new data.
+        """
+        data = np.array(value, dtype=np.float64, ndmin=2)
+        self.__replace(data, self.__fit(self.timestamps, data.shape[1]))
+
+    @property
+    def timestamps(self) -> NDArray:
+        """View on stored timestamps."""
+        return self._timestamps[self._start:self._start + self._size]
+
+    @timestamps.setter
+    def timestamps(self, value: Union[List[float], NDArray]) -> None:
+        """Replace stored timestamps. The buffer length is set to the number of new timestamps.
+        """
+        timestamps = np.array(value, dtype=np.float64, ndmin=1)
+        self.__replace(self.__fit(self.signals, len(timestamps)), timestamps)
+
+    def __make_room(self, n: int) -> None:
+        """Ensure n samples can be written behind the stored samples. If the buffer has a maximum size,
+        the oldest samples are evicted first, and retained samples are moved to the front of the storage
+        once its end is reached.
+
+        :param n: Number of samples to be written.
+        :type n: int
+        """
+        if self._max_size is not None:
+            overflow = self._size + n - self._max_size
+            if overflow > 0:
+                overflow = min(overflow, self._size)
+                self._start += overflow
+                self._size -= overflow
+                self._evicted += overflow
+
+        if self._start + self._size + n <= self.capacity:
+            return
+
+        if self._start > 0 and self._size + n <= self.capacity:
+            # Retained samples are moved into new storage, as views on the current
+            # storage, e.g., of copy-on-write EventContainers, must stay unchanged
+            self.__move(np.zeros_like(self._data), np.zeros_like(self._timestamps))
+        else:
+            self.reserve(max(self._size + n, 2 * self.capacity))
+
+    def __move(self, data: NDArray, timestamps: NDArray) -> None:
+        """Move stored samples to the front of the given storage and use it from now on.
+
+        :param data: Storage for signals.
+        :type data: NDArray
+        :param timestamps: Storage for timestamps.
+        :type timestamps: NDArray
+        """
+        end = self._start + self._size
+        data[:, :self._size] = self._data[:, self._start:end]
+        timestamps[:self._size] = self._timestamps[self._start:end]
+        self._data = data
+        self._timestamps = timestamps
+        self._start = 0
+
+    def __replace(self, data: NDArray, timestamps: NDArray) -> None:
+        """Use the given signals and timestamps as stored samples. If the buffer has a maximum size,
+        they are copied into storage of the full capacity, so appending stays amortized O(1).
+
+        :param data: Signals of shape channels x samples.
+        :type data: NDArray
+        :param timestamps: Timestamps of all samples.
+        :type timestamps: NDArray
+        """
+        self._start = 0
+        self._size = len(timestamps)
+        if self._max_size is None:
+            self._data = data
+            self._timestamps = timestamps
+            return
+
+        capacity = max(2 * self._max_size, self._size)
+        self._data = np.zeros((data.shape[0], capacity), dtype=np.float64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._data[:, :self._size] = data
+        self._timestamps[:self._size] = timestamps
+
+    def __fit(self, array: NDArray, capacity: int) -> NDArray:
+        """Returns array truncated or zero padded along its last axis to the given capacity.
+
+        :param array: Array to fit.
+        :type array: NDArray
+        :param capacity: Length of the last axis.
+        :type capacity: int
+        :return: Fitted array.
+        :rtype: NDArray
+        """
+        if array.shape[-1] == capacity:
+            return array
+        fitted = np.zeros(array.shape[:-1] + (capacity,), dtype=np.float64)
+        n = min(array.shape[-1], capacity)
+        fitted[..., :n] = array[..., :n]
+        return fitted
+
+    def __len__(self) -> int:
+        return self._size
@@ -33,6 +33,7 @@ class AuthLogger():
         self.data_dir = data_dir
         self._logging = False
         self._file_logging = False
+        self._binary_recordings = False
 
     def log_info(self, msg: str) -> None:
         """Add a new message of type [INFO] to log file.
@@ -76,7 +77,8 @@ class AuthLogger():
         """Saves EEGContainer instance alongside log file. Further adds a reference
         to saved instance to log file. Reference is of the form:
         <time_stamp> [DEBUG]: Saved EEGContainer to <file_name>
-        Instance is saved to the data directory.
+        Instance is saved to the data directory. Recordings are saved in csv format, or in binary
+        format if configured, see configure_file_logging.
 
         :param container: Recording container instance to be saved
         :type container: EEGContainer
@@ -87,9 +89,13 @@ class AuthLogger():
         if not self._file_logging:
             return
 
-        file_name = "eeg_container." + str(time()) + ".csv"
+        extension = ".npeeg" if self._binary_recordings else ".csv"
+        file_name = "eeg_container." + str(time()) + extension
         file_path = path.join(getcwd(), self.log_dir, self.data_dir, file_name)
-        container.save_signals(file_path)
+        if self._binary_recordings:
+            container.save_binary(file_path)
+        else:
+            container.save_signals(file_path)
 
         self.__log("DEBUG", f"Saved EEGContainer to \"{file_name}\"")
 
@@ -123,13 +129,19 @@ class AuthLogger():
             return
         self._logging = False
 
-    def configure_file_logging(self, option: bool):
+    def configure_file_logging(
+            self,
+            option: bool,
+            binary_recordings: bool = False):
         """Configure option to log files alongside event logging.
 
         :param option: True to enable file logging, False to disable
         :type option: bool
+        :param binary_recordings: True to save recordings in binary instead of csv format, defaults to False
+        :type binary_recordings: bool, optional
         """
         self._file_logging = option
+        self._binary_recordings = binary_recordings
 
     def __log(self, tag: str, msg: str):
         """Internal write function for log file. Makes sure the format is consistent.
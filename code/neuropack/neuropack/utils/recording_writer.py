@@ -0,0 +1,84 @@
+from typing import List, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class RecordingWriter():
+    __slots__ = "file_name", "event_marker", "_file", "_num_channels"
+
+    def __init__(
+            self,
+            file_name: str,
+            channel_names: List[str],
+            event_marker: str = "1",
+            append: bool = False) -> None:
+        """Writer for recordings in csv format. Samples are written in blocks, each block is formatted and written at once.
+        The format is the same as read by EEGContainer.load_signals:
+        <timestamp>, <channels>*n, <marker>
+
+        :param file_name: File name to write to.
+        :type file_name: str
+        :param channel_names: List of channel names. Used for the header row.
+        :type channel_names: List[str]
+        :param event_marker: Character to signify an event in saved data. Non-events always get marked with a 0. Defaults to "1".
+        :type event_marker: str, optional
+        :param append: If true, blocks are appended to an existing file and no header row is written, defaults to False
+        :type append: bool, optional
+        """
+        assert event_marker != "0"
+
+        self.file_name = file_name
+        self.event_marker = event_marker
+        self._num_channels = len(channel_names)
+        self._file = open(file_name, "a" if append else "w", newline="")
+
+        if not append:
+            self._file.write(
+                ",".join(["timestamps"] + list(channel_names) + ["Marker"]) + "\r\n")
+
+    def write_block(self,
+                    timestamps: Union[List[float], NDArray],
+                    signals: Union[List[List[float]], NDArray],
+                    events: NDArray) -> None:
+        """Write a block of samples.
+
+        :param timestamps: Timestamps of samples in block.
+        :type timestamps: Union[List[float], NDArray]
+        :param signals: Signals of shape channels x len(timestamps).
+        :type signals: Union[List[List[float]], NDArray]
+        :param events: Boolean mask, true for samples marked as event.
+        :type events: NDArray
+        """
+        if self._file is None:
+            raise Exception("Writer is already closed")
+
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        signals = np.asarray(signals, dtype=np.float64)
+        if signals.shape != (self._num_channels, len(timestamps)):
+            raise Exception(
+                "Shape of signals does not match number of channels and timestamps")
+
+        rows = np.vstack([timestamps[None, :], signals]).T.tolist()
+        markers = np.where(events, self.event_marker, "0").tolist()
+        self._file.write("".join(
+            [",".join(map(str, row)) + "," + marker + "\r\n" for row, marker in zip(rows, markers)]))
+
+    def flush(self) -> None:
+        """Flush written blocks to disk.
+        """
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close file. No further blocks can be written afterwards.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.fft import rfft, rfftfreq
+from scipy.signal import get_window
+
+
+@lru_cache(maxsize=16)
+def welch_window(window: str, segment_length: int) -> NDArray:
+    """Window applied to each segment, see scipy.signal.get_window. Results are cached and returned read-only.
+
+    :param window: Name of the window, e.g., "hann".
+    :type window: str
+    :param segment_length: Number of samples of each segment.
+    :type segment_length: int
+    :return: Window of length segment_length.
+    :rtype: NDArray
+    """
+    w = get_window(window, segment_length)
+    w.flags.writeable = False
+    return w
+
+
+def welch_step(segment_length: int, overlap: float) -> int:
+    """Number of samples between the starts of two consecutive segments.
+
+    :param segment_length: Number of samples of each segment.
+    :type segment_length: int
+    :param overlap: Overlap of consecutive segments as share of segment_length, in [0, 1).
+    :type overlap: float
+    :return: Step between segments, at least 1.
+    :rtype: int
+    """
+    if not 0 <= overlap < 1:
+        raise Exception("Overlap must be in [0, 1)")
+    return max(segment_length - int(segment_length * overlap), 1)
+
+
+def segment_periodograms(signals: NDArray, sample_rate: int, segment_length: int,
+                         step: int, window: str = "hann") -> NDArray:
+    """One-sided power spectral density of each complete segment along the last axis. Segments start at 0, step, 2 * step, ...
+    Each segment is demeaned and windowed before the transformation.
+
+    :param signals: Signals of shape [events x channels x] samples.
+    :type signals: NDArray
+    :param sample_rate: Sample rate of the signals.
+    :type sample_rate: int
+    :param segment_length: Number of samples of each segment.
+    :type segment_length: int
+    :param step: Number of samples between the starts of two consecutive segments.
+    :type step: int
+    :param window: Name of the window, defaults to "hann"
+    :type window: str, optional
+    :return: Periodograms of shape [events x channels x] segments x (segment_length // 2 + 1).
+    :rtype: NDArray
+    """
+    signals = np.asarray(signals, dtype=np.float64)
+    if signals.shape[-1] < segment_length:
+        return np.empty(signals.shape[:-1] + (0, segment_length // 2 + 1))
+
+    w = welch_window(window, segment_length)
+    segments = np.lib.stride_tricks.sliding_window_view(
+        signals, segment_length, axis=-1)[..., ::step, :]
+    segments = (segments - segments.mean(axis=-1, keepdims=True)) * w
+
+    spectrum = rfft(segments, axis=-1)
+    power = (spectrum.real ** 2 + spectrum.imag ** 2) / \
+        (sample_rate * (w ** 2).sum())
+
+    # One-sided spectrum contains the power of negative frequencies, except
+    # for DC and Nyquist frequency
+    if segment_length % 2:
+        power[..., 1:] *= 2
+    else:
+        power[..., 1:-1] *= 2
+    return power
+
+
+def welch(signals: NDArray, sample_rate: int, segment_length: int = 128,
+          overlap: float = 0.5, window: str = "hann") -> Tuple[NDArray, NDArray]:
+    """Power spectral density using Welch's method, i.e., the mean periodogram of overlapping segments. All signals are
+    transformed at once. Results are equal to scipy.signal.welch with the same parameters. Signals shorter than
+    segment_length are transformed as one segment.
+
+    :param signals: Signals of shape [events x channels x] samples.
+    :type signals: NDArray
+    :param sample_rate: Sample rate of the signals.
+    :type sample_rate: int
+    :param segment_length: Number of samples of each segment, defaults to 128
+    :type segment_length: int, optional
+    :param overlap: Overlap of consecutive segments as share of segment_length, defaults to 0.5
+    :type overlap: float, optional
+    :param window: Name of the window, defaults to "hann"
+    :type window: str, optional
+    :return: Tuple of power spectral density of shape [events x channels x] frequencies, and frequencies.
+    :rtype: Tuple[NDArray, NDArray]
+    """
+    signals = np.asarray(signals, dtype=np.float64)
+    segment_length = min(segment_length, signals.shape[-1])
+    step = welch_step(segment_length, overlap)
+
+    power = segment_periodograms(
+        signals, sample_rate, segment_length, step, window)
+    return power.mean(axis=-2), rfftfreq(segment_length, 1 / sample_rate)
@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from neuropack.container import EpochArray, EventContainer
+from neuropack.preprocessing import (ArtifactRejector, RejectionCriterion,
+                                     detect_artifacts)
+
+
+def create_events(num_events: int, length: int = 64) -> list:
+    rng = np.random.default_rng(7)
+    timestamps = np.arange(length) / 256
+    return [EventContainer(["C1", "C2", "C3"], 256, rng.normal(
+        size=(3, length)), timestamps) for _ in range(num_events)]
+
+
+class ArtifactRejectionTests(unittest.TestCase):
+    def test_criteria(self):
+        # arrange
+        signals = np.zeros((5, 2, 10))
+        signals[1, 0, 3] = 150          # absolute and peak to peak
+        signals[2, 1, :] = 60           # offset, only peak to peak with negative sample
+        signals[2, 1, 0] = -60
+        signals[3, 0, ::2] = 5          # variance and gradient
+        signals[4, 1, 5:] = 20          # single step, gradient only
+
+        # action
+        masks = detect_artifacts(
+            signals, peak_to_peak=100, absolute=100, variance=5, gradient=10)
+
+        # check
+        self.assertListEqual(masks[RejectionCriterion.AbsoluteThreshold].tolist(),
+                             [False, True, False, False, False])
+        self.assertListEqual(masks[RejectionCriterion.PeakToPeak].tolist(),
+                             [False, True, True, False, False])
+        self.assertListEqual(masks[RejectionCriterion.Variance].tolist(),
+                             [False, True, True, True, True])
+        self.assertListEqual(masks[RejectionCriterion.Gradient].tolist(),
+                             [False, True, True, False, True])
+
+    def test_unset_criteria_are_skipped(self):
+        # arrange
+        signals = np.zeros((3, 2, 10))
+
+        # action
+        masks = detect_artifacts(signals, absolute=100)
+
+        # check
+        self.assertListEqual(list(masks.keys()), [
+                             RejectionCriterion.AbsoluteThreshold])
+
+    def test_blink_equivalence(self):
+        # arrange
+        events = create_events(6)
+        events[2]["C2"] = events[2]["C2"] + 200
+        events[4]["C3"] = events[4]["C3"] - 200
+        rejector = ArtifactRejector(absolute=100)
+
+        # action
+        mask = rejector.mask(events)
+
+        # check
+        self.assertListEqual(mask.tolist(), [
+                             ev.contains_blink() for ev in events])
+        self.assertListEqual(
+            mask.tolist(), EpochArray.from_events(events).contains_blink().tolist())
+
+    def test_reject(self):
+        # arrange
+        events = create_events(4) + create_events(3, length=80)
+        events[1]["C1"] = events[1]["C1"] + 200
+        events[5]["C1"] = events[5]["C1"] + 200
+        events[6]["C2"] = events[6]["C2"] + 200
+        rejector = ArtifactRejector(absolute=100, channel_names=["C1"])
+
+        # action
+        kept = rejector.reject(events)
+        kept_epochs = rejector.reject(EpochArray.from_events(events[:4]))
+
+        # check
+        self.assertListEqual(kept, [events[i] for i in [0, 2, 3, 4, 6]])
+        self.assertEqual(len(kept_epochs), 3)
@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+from scipy.linalg import solve_toeplitz
+
+from neuropack.utils.autoregression import (autocorrelation, levinson_durbin,
+                                            yule_walker)
+
+
+class AutoregressionTests(unittest.TestCase):
+    def test_autocorrelation(self):
+        # arrange
+        rng = np.random.default_rng(0)
+        signals = rng.normal(size=(3, 2, 101)) + 5
+
+        # action
+        r = autocorrelation(signals, 12)
+
+        # check
+        self.assertEqual(r.shape, (3, 2, 13))
+        for x, r_x in zip(signals.reshape(-1, 101), r.reshape(-1, 13)):
+            x = x - x.mean()
+            expected = [np.dot(x[:101 - k], x[k:]) / 101 for k in range(13)]
+            self.assertTrue(np.allclose(r_x, expected))
+
+    def test_levinson_durbin(self):
+        # arrange
+        rng = np.random.default_rng(1)
+        r = autocorrelation(rng.normal(size=(6, 256)).cumsum(axis=-1), 10)
+
+        # action
+        rho, error = levinson_durbin(r)
+
+        # check
+        for r_x, rho_x, error_x in zip(r, rho, error):
+            expected = solve_toeplitz(r_x[:-1], r_x[1:])
+            self.assertTrue(np.allclose(rho_x, expected))
+            self.assertAlmostEqual(error_x, r_x[0] - np.dot(r_x[1:], expected))
+
+    def test_yule_walker_recovers_ar_process(self):
+        # arrange
+        rng = np.random.default_rng(2)
+        noise = rng.normal(size=(4, 20000))
+        signals = np.zeros_like(noise)
+        for t in range(2, noise.shape[-1]):
+            signals[:, t] = 0.6 * signals[:, t - 1] - \
+                0.3 * signals[:, t - 2] + noise[:, t]
+
+        # action
+        rho, sigma = yule_walker(signals, order=2)
+
+        # check
+        self.assertTrue(np.allclose(rho, [0.6, -0.3], atol=0.03))
+        self.assertTrue(np.allclose(sigma, 1, atol=0.03))
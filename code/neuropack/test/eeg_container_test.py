@@ -7,8 +7,10 @@ from random import randint
 
 import numpy as np
 
-from neuropack.container import EEGContainer
+from neuropack.container import EEGContainer, binary_to_csv, csv_to_binary
 from neuropack.devices.base import BCISignal
+from neuropack.preprocessing import (BaselineCorrectionFilter, HighpassFilter,
+                                    ReductionFilter)
 
 sys.path.append("../")
 
@@ -164,9 +166,9 @@ class EEGContainerTests(unittest.TestCase):
             length,
             "Number of recorded data points is not equal to original.")
 
-        self.assertListEqual(
+        self.assertTrue(np.array_equal(
             avg_recording.signals[0],
-            [2.0] * length,
+            [2.0] * length),
             "Average signal is not as expected.")
 
     def test_average_channels_identity(self):
@@ -222,13 +224,15 @@ class EEGContainerTests(unittest.TestCase):
                 avg_recording.signals[0]),
             length,
             "Number of recorded data points is not equal to original.")
-        self.assertListEqual(
+        self.assertTrue(np.array_equal(
             avg_recording.signals[0],
-            [3.0] * length,
+            [3.0] * length),
             "Average signal is not as expected.")
 
-        self.assertListEqual(avg_recording["".join(selected_channels)], [
-                             3.0] * length, "New channel could not be accessed.")
+        self.assertTrue(np.array_equal(
+            avg_recording["".join(selected_channels)],
+            [3.0] * length),
+            "New channel could not be accessed.")
 
     def test_average_sub_channel(self):
         # arrange
@@ -277,24 +281,24 @@ class EEGContainerTests(unittest.TestCase):
             avg_recording.channel_names[3],
             "Fourth channel was not named \"C1C2C3\".")
 
-        self.assertListEqual(
+        self.assertTrue(np.array_equal(
             avg_recording["C1C2"],
-            [3.] * length,
+            [3.] * length),
             "Channel \"C1C2\" was not as expected.")
 
-        self.assertListEqual(
+        self.assertTrue(np.array_equal(
             avg_recording["C1"],
-            [1.] * length,
+            [1.] * length),
             "Channel \"C1\" was not as expected.")
 
-        self.assertListEqual(
+        self.assertTrue(np.array_equal(
             avg_recording["C2"],
-            [5.] * length,
+            [5.] * length),
             "Channel \"C5\" was not as expected.")
 
-        self.assertListEqual(
+        self.assertTrue(np.array_equal(
             avg_recording["C1C2C3"],
-            [2.] * length,
+            [2.] * length),
             "Channel \"C1C2C3\" was not as expected.")
 
     def test_average_sub_channel_identity(self):
@@ -319,3 +323,399 @@ class EEGContainerTests(unittest.TestCase):
             recording,
             avg_recording,
             "Average of one channel is not the same as the original.")
+
+    def test_buffered_add_values(self):
+        """Check, that a buffered EEGContainer stores data like a list backed one and grows as needed.
+        """
+        # arrange
+        container = EEGContainer(["Ch1", "Ch2"], 256, buffered=True, capacity=2)
+        reference = EEGContainer(["Ch1", "Ch2"], 256)
+        self.assertGreaterEqual(container._buffer.capacity, 2)
+        self.assertEqual(EEGContainer(["Ch1"], 256, buffered=True, capacity=5000)._buffer.capacity, 5000)
+
+        # action
+        for i in range(100):
+            sample = BCISignal(i, [randint(0, 100), randint(0, 100)])
+            container.add_data(sample)
+            reference.add_data(sample)
+
+        # check
+        self.assertIsInstance(container.signals, np.ndarray)
+        self.assertEqual(container.signals.shape, (2, 100))
+        self.assertEqual(len(container), 100)
+        self.assertEqual(container, reference,
+                         "Buffered container differs from list backed container.")
+
+    def test_buffered_event_data(self):
+        """Check, that events of a buffered EEGContainer equal those of a list backed one.
+        """
+        # arrange
+        container = EEGContainer(["Ch1"], 250, buffered=True)
+        reference = EEGContainer(["Ch1"], 250)
+        signal = [math.sin(x) for x in range(250)]
+        signal[125] = 100
+        for i in range(250):
+            container.add_data(BCISignal(i * 4, [signal[i]]))
+            reference.add_data(BCISignal(i * 4, [signal[i]]))
+
+        # action
+        event = container.add_event(500, 250, 250)
+
+        # check
+        self.assertEqual(event, reference.add_event(500, 250, 250),
+                         "Event of buffered container differs from list backed container.")
+
+    def test_buffered_channel_view(self):
+        """Check, that channel access of a buffered EEGContainer returns a view on the buffer.
+        """
+        # arrange
+        container = EEGContainer(["Ch1", "Ch2"], 256, buffered=True)
+        for i in range(10):
+            container.add_data(BCISignal(i, [1, 2]))
+
+        # action
+        container["Ch2"][:] = 5
+        container["Ch1"] = np.zeros(10)
+
+        # check
+        self.assertTrue(np.array_equal(container.signals[1], [5.] * 10))
+        self.assertTrue(np.array_equal(container.signals[0], [0.] * 10))
+
+    def test_buffered_save_signals_csv(self):
+        """Check, that signals of a buffered EEGContainer can be saved and loaded in csv format.
+        """
+        # arrange
+        file_name = path.join(tempfile.gettempdir(), "test_buffered.csv")
+        container = EEGContainer(["Ch1", "Ch2"], 250, buffered=True)
+        for i in range(250):
+            container.add_data(BCISignal(i * 4, [math.sin(i), 5]))
+        container.add_event(500, 250, 250)
+
+        # action
+        container.save_signals(file_name)
+        container2 = EEGContainer.from_file(
+            ["Ch1", "Ch2"], 250, file_name, buffered=True)
+
+        # check
+        self.assertTrue(container2.buffered)
+        self.assertEqual(container, container2,
+                         "Loaded signals differ from stored ones.")
+
+    def test_get_all_events(self):
+        """Check, that batched epoch extraction yields the same events as extracting them one by one.
+        """
+        # arrange
+        container = EEGContainer(["Ch1", "Ch2"], 256)
+        for i in range(1000):
+            container.add_data(BCISignal(i / 256, [math.sin(i), math.cos(i)]))
+        event_times = [0.01, 0.5, 1.0, 1.2345, 2.0, 3.9]
+
+        # action
+        expected = [container.add_event(x, 200, 800) for x in event_times]
+        events = container.get_all_events(200, 800)
+
+        # check
+        self.assertEqual(len(events), len(expected))
+        for i in range(len(events)):
+            self.assertEqual(events[i], expected[i],
+                             f"Event {i} differs from single event extraction.")
+        self.assertLess(len(events[0]), len(events[1]),
+                        "First event should be cut off at start of recording.")
+        self.assertIs(events[1].signals.base, events[2].signals.base,
+                      "Complete events are expected to share one array.")
+
+    def test_load_signals_chunked(self):
+        """Check, that loading in small chunks yields the same data and ignores additional channels.
+        """
+        # arrange
+        file_name = path.join(tempfile.gettempdir(), "test_chunked.csv")
+        container = EEGContainer(["Ch1", "Ch2", "Ch3"], 256)
+        for i in range(1000):
+            container.add_data(BCISignal(i / 256, [math.sin(i), i, -i]))
+        for t in [0.5, 1.5, 2.5]:
+            container.add_event(t)
+        container.save_signals(file_name)
+
+        # action
+        full = EEGContainer(["Ch1", "Ch2", "Ch3"], 256)
+        full.load_signals(file_name)
+        chunked = EEGContainer(["Ch1", "Ch2", "Ch3"], 256)
+        chunked.load_signals(file_name, chunk_size=7)
+        reduced = EEGContainer(["Ch1", "Ch2"], 256)
+        reduced.load_signals(file_name, chunk_size=100)
+
+        # check
+        self.assertEqual(container, full)
+        self.assertEqual(container, chunked)
+        self.assertEqual(reduced.signals, container.signals[:2])
+        self.assertEqual(reduced.events, container.events)
+
+    def test_save_signals_binary(self):
+        """Check, that signals can be saved and loaded in binary format, with and without memory mapping.
+        """
+        # arrange
+        file_name = path.join(tempfile.gettempdir(), "test.npeeg")
+        container = EEGContainer(["Ch1", "Ch2"], 250)
+        for i in range(250):
+            container.add_data(BCISignal(i * 4, [math.sin(i), 5]))
+        container.add_event(500, 250, 250)
+        container.add_event(700, 250, 250)
+
+        # action
+        container.save_binary(file_name)
+        mapped = EEGContainer.from_binary(file_name)
+        loaded = EEGContainer.from_binary(file_name, mmap=False)
+
+        # check
+        self.assertIsInstance(mapped.signals.base, np.memmap)
+        self.assertEqual(container, mapped,
+                         "Memory mapped signals differ from stored ones.")
+        self.assertEqual(container, loaded,
+                         "Loaded signals differ from stored ones.")
+        self.assertEqual(container.get_all_events(100, 100),
+                         mapped.get_all_events(100, 100),
+                         "Events of memory mapped recording differ.")
+
+    def test_binary_copy_on_write(self):
+        """Check, that changes to a memory mapped EEGContainer are not written to file.
+        """
+        # arrange
+        file_name = path.join(tempfile.gettempdir(), "test_cow.npeeg")
+        container = EEGContainer(["Ch1"], 250)
+        for i in range(100):
+            container.add_data(BCISignal(i, [1]))
+        container.save_binary(file_name)
+
+        # action
+        mapped = EEGContainer.from_binary(file_name)
+        mapped["Ch1"] = np.zeros(100)
+        mapped.add_data(BCISignal(100, [2]))
+
+        # check
+        self.assertEqual(container, EEGContainer.from_binary(file_name))
+        self.assertEqual(len(mapped), 101)
+
+    def test_csv_binary_conversion(self):
+        """Check, that recordings can be converted between csv and binary format.
+        """
+        # arrange
+        csv_file = path.join(tempfile.gettempdir(), "test_convert.csv")
+        binary_file = path.join(tempfile.gettempdir(), "test_convert.npeeg")
+        csv_file2 = path.join(tempfile.gettempdir(), "test_convert2.csv")
+        container = EEGContainer(["Ch1", "Ch2"], 250)
+        for i in range(250):
+            container.add_data(BCISignal(i * 4, [math.sin(i), i]))
+        container.add_event(500)
+        container.save_signals(csv_file)
+
+        # action
+        csv_to_binary(csv_file, binary_file, ["Ch1", "Ch2"], 250)
+        binary_to_csv(binary_file, csv_file2)
+
+        # check
+        self.assertEqual(container, EEGContainer.from_binary(binary_file))
+        self.assertEqual(
+            container,
+            EEGContainer.from_file(["Ch1", "Ch2"], 250, csv_file2))
+
+    def test_streaming_signals_csv(self):
+        """Check, that signals streamed to file while recording equal signals saved afterwards.
+        """
+        # arrange
+        file_name = path.join(tempfile.gettempdir(), "test_streaming.csv")
+        container = EEGContainer(["Ch1", "Ch2"], 250, buffered=True)
+        for i in range(10):
+            container.add_data(BCISignal(i * 4, [math.sin(i), i]))
+
+        # action
+        container.start_streaming(file_name, block_size=16)
+        for i in range(10, 250):
+            container.add_data(BCISignal(i * 4, [math.sin(i), i]))
+            if i % 50 == 0:
+                container.add_event(i * 4)
+        container.stop_streaming()
+
+        # check
+        self.assertEqual(len(container.events), 4)
+        self.assertEqual(container, EEGContainer.from_file(
+            ["Ch1", "Ch2"], 250, file_name))
+
+    def test_save_signals_event_marker(self):
+        """Check, that custom event markers are written to and read from csv files.
+        """
+        # arrange
+        file_name = path.join(tempfile.gettempdir(), "test_marker.csv")
+        container = EEGContainer(["Ch1"], 250)
+        for i in range(100):
+            container.add_data(BCISignal(i * 4, [i]))
+        container.add_event(40)
+        container.add_event(200)
+
+        # action
+        container.save_signals(file_name, event_marker="T", block_size=10)
+
+        # check
+        self.assertEqual(container, EEGContainer.from_file(
+            ["Ch1"], 250, file_name, event_marker="T"))
+
+    def test_event_views(self):
+        """Check, that events can be views on a buffered EEGContainer and that writing to them does not change the recording.
+        """
+        # arrange
+        container = EEGContainer(["Ch1", "Ch2"], 250, buffered=True)
+        for i in range(250):
+            container.add_data(BCISignal(i * 4, [math.sin(i), i]))
+        recording = np.array(container.signals)
+
+        # action
+        event = container.add_event(500, 100, 100, view=True)
+        events = container.get_all_events(100, 100, view=True)
+        shared_before = event.shared
+        BaselineCorrectionFilter().apply(event)
+        HighpassFilter(1, 250).apply(events[0])
+
+        # check
+        self.assertTrue(shared_before, "Event was not created as view.")
+        self.assertFalse(event.shared, "Event was not copied on write.")
+        self.assertTrue(np.array_equal(container.signals, recording),
+                        "Recording was changed by filtering a view.")
+        self.assertAlmostEqual(float(np.mean(event["Ch2"][:25])), 0)
+
+    def test_event_views_equal_copies(self):
+        """Check, that event views contain the same data as copied events.
+        """
+        # arrange
+        container = EEGContainer(["Ch1", "Ch2"], 250, buffered=True)
+        for i in range(250):
+            container.add_data(BCISignal(i * 4, [math.sin(i), i]))
+        for t in [20, 500, 990]:
+            container.add_event(t)
+
+        # action
+        views = container.get_all_events(100, 100, view=True)
+        copies = container.get_all_events(100, 100)
+
+        # check
+        self.assertTrue(all(x.shared for x in views))
+        self.assertEqual(views, copies)
+
+    def test_reduction_filter_keeps_storage(self):
+        """Check, that channel reduction keeps list storage of list backed containers and buffers of buffered ones.
+        """
+        # arrange
+        containers = [EEGContainer(["C1", "C2", "C3"], 256),
+                      EEGContainer(["C1", "C2", "C3"], 256, buffered=True)]
+        for container in containers:
+            for i in range(20):
+                container.add_data(BCISignal(i, [1, 5, 0]))
+
+        # action
+        for container in containers:
+            ReductionFilter(("C1", "C2"), "C3").apply(container)
+            container.add_data(BCISignal(20, [3, 0]))
+
+        # check
+        self.assertIsInstance(containers[0].signals[0], list)
+        self.assertTrue(containers[1].buffered)
+        self.assertEqual(containers[0], containers[1])
+        self.assertTrue(np.array_equal(containers[1]["C1C2"], [3.] * 21))
+
+    def test_retention(self):
+        """Check, that a container with retention keeps only the newest data and evicts old events.
+        """
+        # arrange
+        container = EEGContainer(["Ch1", "Ch2"], 100, retention=1)
+        reference = EEGContainer(["Ch1", "Ch2"], 100, buffered=True)
+
+        # action
+        for i in range(1000):
+            for c in (container, reference):
+                c.add_data(BCISignal(i / 100, [math.sin(i), i]))
+            if i % 150 == 100:
+                event = container.add_event(i / 100 - 0.2)
+                expected = reference.add_event(i / 100 - 0.2)
+
+                # check
+                self.assertEqual(event, expected)
+
+        # check
+        self.assertEqual(len(container), 100)
+        self.assertEqual(container.evicted_samples, 900)
+        self.assertEqual(container.evicted_events, 6)
+        self.assertListEqual(container.events, [])
+        self.assertTrue(np.array_equal(container["Ch2"], range(900, 1000)))
+        with self.assertRaises(Exception):
+            container.add_event(8.5)
+
+    def test_retention_view(self):
+        """Check, that copy-on-write views stay unchanged, when the retained window is moved.
+        """
+        # arrange
+        container = EEGContainer(["Ch1"], 100, retention=1)
+        for i in range(150):
+            container.add_data(BCISignal(i / 100, [i]))
+        event = container.add_event(1.4, before=50, after=0, view=True)
+        expected = np.array(event.signals)
+
+        # action
+        for i in range(150, 500):
+            container.add_data(BCISignal(i / 100, [i]))
+
+        # check
+        self.assertTrue(event.shared)
+        self.assertTrue(np.array_equal(event.signals, expected))
+
+    def test_retention_unordered_events(self):
+        """Check, that events are evicted, even if they were not added in chronological order.
+        """
+        # arrange
+        container = EEGContainer(["Ch1"], 100, retention=1)
+        for i in range(200):
+            container.add_data(BCISignal(i / 100, [i]))
+        container.add_event(1.9)
+        container.add_event(1.2)
+
+        # action
+        for i in range(200, 250):
+            container.add_data(BCISignal(i / 100, [i]))
+
+        # check
+        self.assertListEqual(container.events, [1.9])
+        self.assertEqual(container.evicted_events, 1)
+
+    def test_retention_after_filter(self):
+        """Check, that filters keep the capacity of the retained window.
+        """
+        # arrange
+        container = EEGContainer(["Ch1", "Ch2"], 100, retention=1)
+        for i in range(100):
+            container.add_data(BCISignal(i / 100, [i, i]))
+
+        # action
+        ReductionFilter(("Ch1", "Ch2")).apply(container)
+        for i in range(100, 150):
+            container.add_data(BCISignal(i / 100, [i]))
+
+        # check
+        self.assertEqual(container._buffer.capacity, 200)
+        self.assertTrue(np.array_equal(container["Ch1Ch2"][:50], range(50, 100)))
+        self.assertTrue(np.array_equal(container["Ch1Ch2"][50:], range(100, 150)))
+
+    def test_retention_streaming(self):
+        """Check, that streaming writes all samples, even if they are evicted from the retained window.
+        """
+        # arrange
+        file_name = path.join(tempfile.gettempdir(), "test_retention.csv")
+        container = EEGContainer(["Ch1"], 100, retention=0.5)
+        reference = EEGContainer(["Ch1"], 100)
+
+        # action
+        container.start_streaming(file_name, block_size=64)
+        for i in range(300):
+            container.add_data(BCISignal(i, [i]))
+            reference.add_data(BCISignal(i, [i]))
+        container.stop_streaming()
+
+        # check
+        self.assertEqual(reference, EEGContainer.from_file(
+            ["Ch1"], 100, file_name))
@@ -0,0 +1,172 @@
+import unittest
+
+import numpy as np
+
+from neuropack.container import (EEGContainer, EpochArray, EventContainer,
+                                 batch_avg_snr)
+from neuropack.devices.base import BCISignal
+from neuropack.utils import oavg, osum
+
+
+def create_events(num_events: int, length: int = 64) -> list:
+    rng = np.random.default_rng(42)
+    timestamps = (np.arange(length) - length // 4) / 256
+    return [EventContainer(["C1", "C2", "C3"], 256, rng.normal(
+        size=(3, length)) * 10, timestamps) for _ in range(num_events)]
+
+
+class EpochArrayTests(unittest.TestCase):
+    def test_conversion(self):
+        # arrange
+        events = create_events(10)
+
+        # action
+        epochs = EpochArray.from_events(events)
+
+        # check
+        self.assertEqual(len(epochs), 10)
+        self.assertEqual(epochs.signals.shape, (10, 3, 64))
+        self.assertListEqual(epochs.to_events(), events,
+                             "Conversion to EventContainers is not lossless.")
+
+    def test_different_lengths(self):
+        # arrange
+        events = create_events(2) + create_events(1, 32)
+
+        # action and check
+        with self.assertRaises(Exception):
+            EpochArray.from_events(events)
+
+    def test_mean_sum(self):
+        # arrange
+        events = create_events(20)
+        epochs = EpochArray.from_events(events)
+
+        # action
+        avg = epochs.mean()
+        total = epochs.sum()
+
+        # check
+        expected_avg = oavg(events)
+        expected_sum = osum(events)
+        for ch in avg.channel_names:
+            self.assertTrue(np.allclose(avg[ch], expected_avg[ch]))
+            self.assertTrue(np.allclose(total[ch], expected_sum[ch]))
+        self.assertTrue(np.array_equal(avg.timestamps, events[0].timestamps))
+
+    def test_channel_selection(self):
+        # arrange
+        epochs = EpochArray.from_events(create_events(5))
+
+        # action
+        selected = epochs.select_channels("C3", "C1")
+
+        # check
+        self.assertListEqual(selected.channel_names, ["C3", "C1"])
+        self.assertTrue(np.array_equal(selected["C1"], epochs["C1"]))
+        self.assertTrue(np.array_equal(selected.signals[:, 0], epochs["C3"]))
+
+    def test_average_sub_ch(self):
+        # arrange
+        events = create_events(5)
+        epochs = EpochArray.from_events(events)
+        selection = [("C1", "C2"), "C3"]
+
+        # action
+        averaged = epochs.average_sub_ch(*selection)
+
+        # check
+        self.assertListEqual(averaged.channel_names, ["C1C2", "C3"])
+        for i, ev in enumerate(events):
+            self.assertEqual(averaged[i], ev.average_sub_ch(*selection))
+        self.assertListEqual(epochs.average_ch().channel_names, ["C1C2C3"])
+
+    def test_snr(self):
+        # arrange
+        events = create_events(8)
+        epochs = EpochArray.from_events(events)
+
+        # action
+        snr = epochs.snr((50, 150))
+        avg_snr = epochs.avg_snr(["C1", "C2"], (50, 150), use_absolutes=True)
+
+        # check
+        for i, ev in enumerate(events):
+            expected = ev.snr((50, 150))
+            for j, ch in enumerate(ev.channel_names):
+                self.assertAlmostEqual(snr[i, j], expected[ch])
+            self.assertAlmostEqual(avg_snr[i], ev.avg_snr(
+                ["C1", "C2"], (50, 150), use_absolutes=True))
+
+    def test_snr_shifted_timestamps(self):
+        # arrange
+        events = create_events(4)
+        for i, ev in enumerate(events):
+            ev.timestamps = ev.timestamps + i / 256
+        epochs = EpochArray.from_events(events)
+
+        # action
+        snr = epochs.snr((50, 150))
+
+        # check
+        for i, ev in enumerate(events):
+            self.assertTrue(np.allclose(
+                snr[i], list(ev.snr((50, 150)).values())))
+
+    def test_batch_avg_snr(self):
+        # arrange
+        events = create_events(3) + create_events(2, length=80) + create_events(1)
+
+        # action
+        snr = batch_avg_snr(events, ["C2", "C3"], (50, 150))
+
+        # check
+        self.assertEqual(len(snr), 6)
+        for i, ev in enumerate(events):
+            self.assertAlmostEqual(snr[i], ev.avg_snr(["C2", "C3"], (50, 150)))
+
+    def test_contains_blink(self):
+        # arrange
+        events = create_events(4)
+        events[2]["C2"][10] = 150
+        epochs = EpochArray.from_events(events)
+
+        # action
+        blinks = epochs.contains_blink()
+
+        # check
+        self.assertListEqual(blinks.tolist(), [False, False, True, False])
+        self.assertFalse(epochs.contains_blink("C1", "C3").any())
+        self.assertEqual(len(epochs[~blinks]), 3)
+
+    def test_get_epochs(self):
+        # arrange
+        container = EEGContainer(["C1", "C2"], 256)
+        for i in range(1000):
+            container.add_data(BCISignal(i / 256, [np.sin(i), np.cos(i)]))
+        for t in [0.1, 1.0, 2.0, 3.9]:
+            container.add_event(t)
+
+        # action
+        epochs = container.get_epochs(200, 400)
+
+        # check
+        expected = [x for x in container.get_all_events(200, 400)
+                    if len(x) == len(epochs.timestamps[0])]
+        self.assertEqual(len(epochs), 2)
+        self.assertListEqual(epochs.to_events(), expected)
+
+    def test_power_spectrum(self):
+        # arrange
+        events = create_events(4)
+        epochs = EpochArray.from_events(events)
+
+        # action
+        power, freqs = epochs.power_spectrum()
+
+        # check
+        self.assertEqual(power.shape, (4, 3, 32))
+        for i, ev in enumerate(events):
+            ps = ev.power_spectrum()
+            self.assertTrue(np.allclose(freqs, ps[-1]))
+            self.assertTrue(np.allclose(power[i], np.array(ps[:-1])))
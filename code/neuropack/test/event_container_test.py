@@ -3,7 +3,7 @@ import unittest
 import numpy as np
 
 from neuropack.container import EventContainer
-from neuropack.utils import osum
+from neuropack.utils import SumMode, osum
 
 
 class EventContainerTests(unittest.TestCase):
@@ -294,6 +294,43 @@ class EventContainerTests(unittest.TestCase):
             np.array([5] * length),
         ), "ev2 changed.")
 
+    def test_iadd(self):
+        """Check that in place addition of EventContainers behaves as expected.
+        """
+        # arrange
+        length = 20
+        ev1 = EventContainer(["C1", "C2"], 256, [[1] * length, [5] * length],
+                             [x for x in range(length)])
+        ev2 = EventContainer(["C2", "C1"], 256, [[2] * length, [0.5] * length],
+                             [x for x in range(length)])
+
+        # action
+        ev1 += ev2
+
+        # check
+        self.assertTrue(np.array_equal(ev1["C1"], np.array([1.5] * length)))
+        self.assertTrue(np.array_equal(ev1["C2"], np.array([7] * length)))
+        self.assertTrue(np.array_equal(ev2["C2"], np.array([2] * length)))
+
+    def test_osum_modes(self):
+        """Check that all summation modes yield the same EventContainer.
+        """
+        # arrange
+        rng = np.random.default_rng(0)
+        events = [EventContainer(["C1", "C2"], 256, rng.normal(size=(2, 32)),
+                                 np.arange(32)) for _ in range(50)]
+        copies = [EventContainer(["C1", "C2"], 256, np.copy(ev.signals),
+                                 np.arange(32)) for ev in events]
+
+        # action
+        sums = [osum(events, mode) for mode in SumMode]
+
+        # check
+        for s in sums:
+            for ch in ["C1", "C2"]:
+                self.assertTrue(np.allclose(s[ch], sums[0][ch]))
+        self.assertListEqual(events, copies, "Summed up events changed.")
+
     def test_numerical_index_access_test(self):
         """Check, that numerical index can be used to access signals.
         """
@@ -343,3 +380,94 @@ class EventContainerTests(unittest.TestCase):
         self.assertTrue(
             exception_raised,
             "No exception was raised despite numerical index out of bound.")
+
+    def test_multi_channel_index(self):
+        """Check, that several channels can be accessed at once.
+        """
+        # arrange
+        event = EventContainer(["C1", "C2", "C3"], 256,
+                               [[1] * 10, [2] * 10, [3] * 10], list(range(10)))
+
+        # action
+        selected = event[["C3", "C1"]]
+        mixed = event[("C2", 2)]
+
+        # check
+        self.assertEqual(selected.shape, (2, 10))
+        self.assertTrue(np.array_equal(selected[0], [3] * 10))
+        self.assertTrue(np.array_equal(selected[1], [1] * 10))
+        self.assertTrue(np.array_equal(mixed, [[2] * 10, [3] * 10]))
+        with self.assertRaises(Exception):
+            event[["C1", "C4"]]
+
+    def test_channel_index_invalidation(self):
+        """Check, that renaming channels updates channel lookups.
+        """
+        # arrange
+        event = EventContainer(["C1", "C2"], 256,
+                               [[1] * 10, [2] * 10], list(range(10)))
+        event["C2"]
+
+        # action
+        event.channel_names = ["C2", "C1"]
+
+        # check
+        self.assertTrue(np.array_equal(event["C2"], [1] * 10))
+        self.assertListEqual(event.channel_index("C1", "C2"), [1, 0])
+
+    def test_power_spectrum(self):
+        # arrange
+        rng = np.random.default_rng(0)
+        signals = rng.normal(size=(2, 101))
+        event = EventContainer(["C1", "C2"], 100, signals, list(range(101)))
+
+        # action
+        ps = event.power_spectrum()
+
+        # check
+        N = 101
+        expected_freqs = np.fft.fftfreq(N, 1 / 100)[:N // 2]
+        self.assertEqual(len(ps), 3)
+        self.assertTrue(np.allclose(ps[-1], expected_freqs))
+        for i in range(2):
+            expected = 2.0 / N * np.abs(np.fft.fft(signals[i])[:N // 2])
+            self.assertTrue(np.allclose(ps[i], expected))
+
+    def test_power_spectrum_memoize(self):
+        # arrange
+        event = EventContainer(["C1", "C2"], 100, [
+                               [1.0, 2, 3, 4], [4.0, 3, 2, 1]], [1, 2, 3, 4])
+
+        # action
+        first = event.power_spectrum(memoize=True)
+        second = event.power_spectrum(memoize=True)
+        event["C1"] = [2, 4, 6, 8]
+        third = event.power_spectrum(memoize=True)
+
+        # check
+        self.assertIs(first[0], second[0])
+        self.assertIsNot(first[0], third[0])
+        self.assertTrue(np.allclose(third[0], 2 * first[0]))
+        self.assertFalse(first[0].flags.writeable)
+
+    def test_snr(self):
+        # arrange
+        rng = np.random.default_rng(1)
+        timestamps = (np.arange(100) - 20) / 100
+        signals = rng.normal(size=(3, 100))
+        event = EventContainer(["C1", "C2", "C3"], 100, signals, timestamps)
+
+        # action
+        snr = event.snr((250, 400))
+        abs_snr = event.snr((250, 400), use_absolutes=True)
+        avg_snr = event.avg_snr(["C1", "C3"], (250, 400))
+
+        # check
+        start = int(np.abs(timestamps - 0.25).argmin())
+        stop = int(np.abs(timestamps - 0.4).argmin())
+        for i, ch in enumerate(["C1", "C2", "C3"]):
+            std = np.std(signals[i])
+            self.assertAlmostEqual(snr[ch], np.max(signals[i][start:stop]) / std)
+            self.assertAlmostEqual(
+                abs_snr[ch], np.max(np.abs(signals[i][start:stop])) / std)
+        self.assertAlmostEqual(avg_snr, np.mean([snr["C1"], snr["C3"]]))
@@ -0,0 +1,235 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from scipy.signal import welch
+
+from neuropack.benchmarking import (BenchmarkContainer, extract_features,
+                                    generate_synthetic_dataset)
+from neuropack.container import EpochArray, frequency_axis
+from neuropack.devices.base import BCISignal
+from neuropack.feature_extraction import (AdaptedPACModel, AverageModel,
+                                          BandpowerModel, CachedFeatureModel,
+                                          PACModel, PowerBands,
+                                          WelchBandpowerModel)
+from neuropack.utils import oavg
+
+
+def create_epochs(num_epochs: int = 6) -> list:
+    participant = generate_synthetic_dataset(1, 2 * num_epochs)[0]
+    return participant.template_epochs
+
+
+class FeatureExtractionTests(unittest.TestCase):
+    def test_batch_equals_single(self):
+        # arrange
+        events = create_epochs()
+        epochs = EpochArray.from_events(events)
+        models = [AverageModel(), AverageModel("TP9", "AF8"), BandpowerModel(),
+                  PACModel(), AdaptedPACModel(), AdaptedPACModel(4),
+                  WelchBandpowerModel(), WelchBandpowerModel(segment_length=64, overlap=0.75)]
+
+        for model in models:
+            # action
+            batch = model.extract_features_batch(epochs)
+            batch_list = model.extract_features_batch(events)
+
+            # check
+            expected = np.stack([model.extract_features(ev) for ev in events])
+            self.assertEqual(batch.shape, expected.shape, str(model))
+            self.assertTrue(np.allclose(batch, expected), str(model))
+            self.assertTrue(np.allclose(batch_list, expected), str(model))
+
+    def test_batch_different_lengths(self):
+        # arrange
+        shorter = generate_synthetic_dataset(1, 2, epoch_length=(100, 400))[0]
+        events = create_epochs(2) + shorter.template_epochs
+        model = BandpowerModel()
+
+        # action
+        batch = model.extract_features_batch(events)
+
+        # check
+        self.assertEqual(len(batch), 3)
+        for i, ev in enumerate(events):
+            self.assertTrue(np.allclose(batch[i], model.extract_features(ev)))
+
+    def test_extract_features_tuples(self):
+        # arrange
+        events = create_epochs(5)
+        participant = BenchmarkContainer("0", [], events)
+        model = BandpowerModel()
+
+        # action
+        samples = extract_features([participant], model, tuple_size=2, block_size=3)
+
+        # check
+        self.assertEqual(len(samples), 10)
+        self.assertTrue(np.allclose(
+            samples[0], model.extract_features(oavg(events[:2]))))
+        self.assertTrue(np.allclose(
+            samples[-1], model.extract_features(oavg(events[3:]))))
+
+    def test_extract_features_too_few_epochs(self):
+        # arrange
+        events = create_epochs(3)
+        participants = [BenchmarkContainer("0", [], []),
+                        BenchmarkContainer("1", [], events[:1]),
+                        BenchmarkContainer("2", [], events)]
+        model = BandpowerModel()
+
+        # action
+        samples = extract_features(participants, model, tuple_size=2)
+
+        # check
+        self.assertEqual(len(samples), 3)
+        self.assertListEqual(extract_features(participants[:2], model), [])
+
+    def test_band_powers_equal_masks(self):
+        # arrange
+        rng = np.random.default_rng(8)
+        freqs = frequency_axis(512, 256)
+        power = rng.random((3, 4, len(freqs)))
+        bands = PowerBands([("low", 0, 10), ("alpha", 10, 13)], include_lowest=True)
+
+        # action
+        result = bands.band_powers(power, freqs)
+
+        # check
+        low = power[..., (freqs >= 0) & (freqs <= 10)].mean(axis=-1)
+        alpha = power[..., (freqs > 10) & (freqs <= 13)].mean(axis=-1)
+        self.assertEqual(result.shape, (3, 4, 2))
+        self.assertTrue(np.allclose(result, np.stack([low, alpha], axis=-1)))
+        self.assertListEqual(bands.names, ["low", "alpha"])
+
+    def test_band_kernel_cached(self):
+        # arrange
+        bands = PowerBands([("alpha", 10, 13), ("empty", 200, 300)])
+
+        # action
+        kernel = bands.kernel(frequency_axis(256, 256))
+
+        # check
+        self.assertIs(bands.kernel(frequency_axis(256, 256)), kernel)
+        self.assertIsNot(bands.kernel(frequency_axis(512, 256)), kernel)
+        self.assertTrue(np.allclose(kernel[:, 0].sum(), 1))
+        self.assertTrue(np.isnan(kernel[:, 1]).all())
+
+    def test_custom_bands(self):
+        # arrange
+        events = create_epochs(2)
+        model = BandpowerModel([("theta", 4, 8), ("alpha", 8, 13), ("beta", 13, 30)])
+
+        # action
+        features = model.extract_features_batch(events)
+
+        # check
+        self.assertEqual(features.shape, (2, 3 * len(events[0].channel_names)))
+        self.assertEqual(str(BandpowerModel()), "BandpowerModel()")
+        self.assertNotEqual(str(model), "BandpowerModel()")
+
+    def test_cache_hits(self):
+        # arrange
+        events = create_epochs(4)
+        model = CachedFeatureModel(PACModel())
+        expected = PACModel().extract_features_batch(events)
+
+        # action
+        first = model.extract_features_batch(events)
+        second = model.extract_features_batch(EpochArray.from_events(events))
+        single = model.extract_features(events[0])
+
+        # check
+        self.assertTrue(np.allclose(first, expected))
+        self.assertTrue(np.allclose(second, expected))
+        self.assertTrue(np.allclose(single, expected[0]))
+        self.assertDictEqual(model.info(), {"hits": 5, "disk_hits": 0, "misses": 4,
+                                            "hit_rate": 5 / 9, "size": 4})
+
+    def test_cache_lru_eviction(self):
+        # arrange
+        events = create_epochs(3)
+        model = CachedFeatureModel(BandpowerModel(), max_size=2)
+
+        # action
+        model.extract_features_batch(events)
+        model.extract_features(events[2])
+        model.extract_features(events[0])
+
+        # check
+        self.assertEqual(model.info()["size"], 2)
+        self.assertEqual(model.hits, 1)
+        self.assertEqual(model.misses, 4)
+
+    def test_cache_model_configuration(self):
+        # arrange
+        event = create_epochs(1)[0]
+        with tempfile.TemporaryDirectory() as directory:
+            model = CachedFeatureModel(AverageModel(), directory=directory)
+            channels = CachedFeatureModel(AverageModel("TP9", "AF8"), directory=directory)
+            model.extract_features(event)
+
+            # action
+            result = channels.extract_features(event)
+
+            # check
+            self.assertTrue(np.allclose(
+                result, AverageModel("TP9", "AF8").extract_features(event)))
+            self.assertEqual(channels.misses, 1)
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+    def test_cache_disk(self):
+        # arrange
+        events = create_epochs(2)
+        with tempfile.TemporaryDirectory() as directory:
+            CachedFeatureModel(BandpowerModel(), directory=directory).extract_features_batch(events)
+            model = CachedFeatureModel(BandpowerModel(), directory=directory)
+
+            # action
+            result = model.extract_features_batch(events)
+
+            # check
+            self.assertTrue(np.allclose(
+                result, BandpowerModel().extract_features_batch(events)))
+            self.assertEqual(model.disk_hits, 2)
+            self.assertEqual(model.misses, 0)
+            model.clear(disk=True)
+            self.assertListEqual(os.listdir(directory), [])
+
+    def test_welch_equals_scipy(self):
+        # arrange
+        event = create_epochs(1)[0]
+        model = WelchBandpowerModel(segment_length=64)
+
+        # action
+        features = model.extract_features(event)
+
+        # check
+        freqs, power = welch(np.array(event.signals), event.sample_rate,
+                             nperseg=64, noverlap=32)
+        alpha = power[:, (freqs > 10) & (freqs <= 13)].mean(axis=-1)
+        beta = power[:, (freqs > 13) & (freqs <= 30)].mean(axis=-1)
+        self.assertEqual(len(features), 2 * len(event.channel_names))
+        self.assertTrue(np.allclose(features, np.stack([alpha, beta], axis=-1).reshape(-1)))
+
+    def test_welch_accumulator(self):
+        # arrange
+        event = create_epochs(1)[0]
+        signals = np.array(event.signals)
+        model = WelchBandpowerModel(segment_length=64, overlap=0.25)
+        accumulator = model.accumulator(len(event.channel_names), event.sample_rate)
+        samples = [BCISignal(t, s) for t, s in zip(event.timestamps, signals.T.tolist())]
+
+        # action
+        with self.assertRaises(Exception):
+            accumulator.features()
+        for i in range(0, len(samples), 13):
+            accumulator.add_samples(samples[i:i + 13])
+
+        # check
+        self.assertEqual(accumulator.num_segments, (len(event) - 64) // 48 + 1)
+        self.assertTrue(np.allclose(accumulator.features(), model.extract_features(event)))
+        accumulator.reset()
+        accumulator.add(signals)
+        self.assertTrue(np.allclose(accumulator.features(), model.extract_features(event)))
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+from scipy.signal import butter, iirnotch
+
+from neuropack.preprocessing import (BandpassFilter, FilterDesignCache,
+                                     HighpassFilter, NotchFilter, design_cache)
+
+
+class FilterDesignCacheTests(unittest.TestCase):
+    def test_hits_and_misses(self):
+        # arrange
+        cache = FilterDesignCache()
+
+        # action
+        first = cache.butter(5, 1, "high", 256)
+        second = cache.butter(5, 1.0, "high", 256)
+        cache.butter(5, 1, "low", 256)
+        b, a = cache.iirnotch(50, 30, 256)
+
+        # check
+        self.assertDictEqual(cache.info(), {"hits": 1, "misses": 3, "size": 3})
+        self.assertTrue(np.array_equal(first, second))
+        self.assertIsNot(first, second)
+        self.assertTrue(np.array_equal(
+            first, butter(5, 1, "high", fs=256, output="sos")))
+        self.assertTrue(np.array_equal(b, iirnotch(50, 30, 256)[0]))
+        self.assertTrue(np.array_equal(a, iirnotch(50, 30, 256)[1]))
+
+    def test_precompute(self):
+        # arrange
+        cache = FilterDesignCache()
+
+        # action
+        cache.precompute(cutoffs=[1, 2, 30], sample_rates=[256, 512], notches=[50, 60])
+        cache.butter(5, 2, "low", 512)
+        cache.iirnotch(60, 30, 256)
+
+        # check
+        self.assertEqual(len(cache), 3 * 2 * 2 + 2 * 2)
+        self.assertEqual(cache.misses, len(cache))
+        self.assertEqual(cache.hits, 2)
+
+    def test_filters_use_shared_cache(self):
+        # arrange
+        design_cache.clear()
+
+        # action
+        for _ in range(10):
+            HighpassFilter(1, 256)
+            BandpassFilter(1, 30, 256)
+            NotchFilter(50, 256)
+
+        # check
+        self.assertEqual(design_cache.misses, 3)
+        self.assertEqual(design_cache.hits, 37)
@@ -0,0 +1,219 @@
+import tempfile
+import unittest
+from os import path
+
+import numpy as np
+from scipy.signal import detrend, filtfilt, sosfiltfilt
+
+from neuropack.benchmarking import generate_synthetic_dataset, load_dataset
+from neuropack.container import EEGContainer, EpochArray, EventContainer
+from neuropack.devices.base import BCISignal
+from neuropack.preprocessing import (BandpassFilter,
+                                     BaselineCorrectionFilter, BaselineMode,
+                                     DetrendFilter, ExecutionMode,
+                                     HighpassFilter,
+                                     LowpassFilter, NotchFilter,
+                                     PreprocessingPipeline, ReductionFilter,
+                                     SOSCascadeFilter)
+
+
+def create_epochs() -> list:
+    participants = generate_synthetic_dataset(3, 6)
+    return [ev for p in participants for ev in p.template_epochs +
+            p.authentication_epochs]
+
+
+def create_pipeline() -> PreprocessingPipeline:
+    return PreprocessingPipeline(
+        DetrendFilter(),
+        BandpassFilter(1, 30, 256),
+        ReductionFilter(("TP9", "TP10"), "AF7"))
+
+
+class PreprocessingPipelineTests(unittest.TestCase):
+    def test_parallel_equals_serial(self):
+        # arrange
+        expected = create_epochs()
+        create_pipeline().apply(expected)
+
+        for mode in (ExecutionMode.Thread, ExecutionMode.Process):
+            epochs = create_epochs()
+
+            # action
+            create_pipeline().apply(epochs, mode=mode, max_workers=2, chunk_size=4)
+
+            # check
+            self.assertListEqual(epochs, expected, f"Results differ for {mode}")
+            self.assertListEqual(epochs[0].channel_names, ["TP9TP10", "AF7"])
+
+    def test_single_container(self):
+        # arrange
+        expected = create_epochs()[0]
+        create_pipeline().apply(expected)
+        epoch = create_epochs()[0]
+
+        # action
+        create_pipeline().apply(epoch, mode=ExecutionMode.Process)
+
+        # check
+        self.assertEqual(epoch, expected)
+
+    def test_compile(self):
+        # arrange
+        pipeline = PreprocessingPipeline(
+            HighpassFilter(1, 256),
+            NotchFilter(50, 256),
+            DetrendFilter(),
+            BandpassFilter(1, 30, 256),
+            LowpassFilter(30, 256),
+            DetrendFilter(),
+            BandpassFilter(1, 30, 256))
+
+        # action
+        compiled = pipeline.compile()
+
+        # check
+        self.assertEqual(len(compiled.filters), 5)
+        self.assertIsInstance(compiled.filters[0], SOSCascadeFilter)
+        self.assertIsInstance(compiled.filters[1], DetrendFilter)
+        self.assertIsInstance(compiled.filters[2], SOSCascadeFilter)
+        self.assertEqual(len(compiled.filters[2].sos), 3 * 3)
+        self.assertIs(compiled.filters[4], pipeline.filters[6])
+
+    def test_fused_equals_sequential(self):
+        # arrange
+        rng = np.random.default_rng(3)
+        pipeline = PreprocessingPipeline(
+            HighpassFilter(1, 256), NotchFilter(50, 256), BandpassFilter(1, 30, 256))
+
+        for length in (257, 2560, 25600):
+            signals = rng.normal(scale=10, size=(3, length)).cumsum(axis=-1)
+            containers = []
+            for buffered in (False, True, False):
+                container = EEGContainer(["C1", "C2", "C3"], 256, buffered=buffered)
+                container.timestamps = np.arange(length) / 256
+                container.signals = signals.tolist() if not buffered else signals
+                containers.append(container)
+            epochs = EpochArray(["C1", "C2", "C3"], 256,
+                                np.stack([signals, -signals]), np.arange(length) / 256)
+
+            # action
+            pipeline.apply(containers[0])
+            pipeline.compile().apply(containers[1:])
+            pipeline.compile().filters[0].apply(epochs)
+
+            # check
+            expected = np.array(containers[0].signals)
+            for container in containers[1:]:
+                self.assertTrue(np.allclose(np.array(container.signals), expected))
+            self.assertTrue(np.allclose(epochs.signals[0], expected))
+            self.assertTrue(np.allclose(epochs.signals[1], -expected))
+            self.assertIsInstance(containers[2].signals[0], list)
+
+    def test_filter_array_equals_per_channel(self):
+        # arrange
+        rng = np.random.default_rng(4)
+        signals = rng.normal(scale=10, size=(5, 3, 300))
+        highpass = HighpassFilter(1, 256)
+        lowpass = LowpassFilter(30, 256)
+        bandpass = BandpassFilter(1, 30, 256)
+        notch = NotchFilter(50, 256)
+        references = [
+            (DetrendFilter(), detrend),
+            (highpass, lambda x: sosfiltfilt(highpass.sos, x)),
+            (lowpass, lambda x: sosfiltfilt(lowpass.sos, x)),
+            (bandpass, lambda x: sosfiltfilt(bandpass.high_pass.sos,
+                                             sosfiltfilt(bandpass.low_pass.sos, x))),
+            (notch, lambda x: filtfilt(notch.b, notch.a, x))]
+
+        for filter, reference in references:
+            # action
+            result = filter.filter_array(signals)
+
+            # check
+            for epoch in range(5):
+                event = EventContainer(["C1", "C2", "C3"], 256, [
+                                       x.tolist() for x in signals[epoch]], list(range(300)))
+                filter.apply(event)
+                for channel in range(3):
+                    expected = reference(signals[epoch, channel])
+                    self.assertTrue(np.allclose(result[epoch, channel], expected), str(filter))
+                    self.assertTrue(np.allclose(event.signals[channel], expected), str(filter))
+
+    def test_apply_epoch_array(self):
+        # arrange
+        epochs = EpochArray.from_events(create_epochs())
+        expected = epochs.to_events()
+        pipeline = PreprocessingPipeline(
+            DetrendFilter(), BandpassFilter(1, 30, 256))
+
+        # action
+        pipeline.apply(epochs)
+        pipeline.apply(expected)
+
+        # check
+        self.assertIsInstance(expected[0].signals, np.ndarray)
+        for i, ev in enumerate(expected):
+            self.assertTrue(np.allclose(epochs.signals[i], ev.signals))
+
+    def test_baseline_correction(self):
+        # arrange
+        events = create_epochs()
+        epochs = EpochArray.from_events(events)
+        stim_i = int(np.where(events[0].timestamps == 0)[0][0])
+
+        # action
+        BaselineCorrectionFilter().apply(epochs)
+        for ev in events:
+            BaselineCorrectionFilter().apply(ev)
+
+        # check
+        for i, ev in enumerate(events):
+            self.assertTrue(np.allclose(epochs.signals[i], ev.signals))
+            self.assertTrue(np.allclose(
+                np.mean(np.array(ev.signals)[:, :stim_i], axis=1), 0))
+
+    def test_baseline_window_median(self):
+        # arrange
+        timestamps = (np.arange(100) - 50) / 100
+        signals = np.tile(np.arange(100, dtype=np.float64), (2, 1))
+        signals[1, 35] = 1000
+        event = EventContainer(["C1", "C2"], 100, signals, timestamps)
+        filter = BaselineCorrectionFilter((-200, -100), BaselineMode.Median)
+
+        # action
+        window = filter.baseline_window(timestamps)
+        filter.apply(event)
+
+        # check
+        self.assertEqual(window, slice(30, 40))
+        self.assertTrue(np.allclose(event["C1"], np.arange(100) - 34.5))
+        self.assertTrue(np.allclose(event["C2"][:35], np.arange(35) - 35))
+        with self.assertRaises(Exception):
+            BaselineCorrectionFilter((100, 100)).apply(event)
+
+    def test_load_dataset_modes(self):
+        # arrange
+        rng = np.random.default_rng(9)
+        files = []
+        for i in range(3):
+            container = EEGContainer(["TP9", "AF7", "AF8", "TP10"], 256)
+            for j in range(2560):
+                container.add_data(BCISignal(j / 256, rng.normal(scale=10, size=4).tolist()))
+            for event in range(1, 9):
+                container.add_event(event)
+            files.append(path.join(tempfile.gettempdir(), f"test_load_dataset_{i}.csv"))
+            container.save_signals(files[-1])
+
+        results = []
+        for mode in (ExecutionMode.Serial, ExecutionMode.Thread):
+            # action
+            results.append(load_dataset("0", files[0], files[1:],
+                                        preprossessing=create_pipeline(), execution_mode=mode))
+
+        # check
+        serial, thread = results
+        self.assertEqual(len(serial.authentication_epochs), 16)
+        self.assertListEqual(serial.template_epochs, thread.template_epochs)
+        self.assertListEqual(serial.authentication_epochs, thread.authentication_epochs)
+        self.assertListEqual(serial.template_epochs[0].channel_names, ["TP9TP10", "AF7"])
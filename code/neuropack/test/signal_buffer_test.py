@@ -0,0 +1,126 @@
+import unittest
+
+import numpy as np
+
+from neuropack.utils.buffer import SignalBuffer
+
+
+class SignalBufferTests(unittest.TestCase):
+    def test_append_grows(self):
+        # arrange
+        buffer = SignalBuffer(3, capacity=4)
+
+        # action
+        for i in range(10):
+            buffer.append(i, [i, 2 * i, 3 * i])
+
+        # check
+        self.assertEqual(len(buffer), 10)
+        self.assertGreaterEqual(buffer.capacity, 10)
+        self.assertTrue(np.array_equal(buffer.timestamps, np.arange(10)))
+        self.assertTrue(np.array_equal(buffer.signals[2], 3 * np.arange(10)))
+
+    def test_extend(self):
+        # arrange
+        buffer = SignalBuffer(2, capacity=4)
+        buffer.append(0, [1, 1])
+
+        # action
+        buffer.extend([1, 2, 3, 4, 5], np.ones((2, 5)) * 2)
+
+        # check
+        self.assertEqual(buffer.signals.shape, (2, 6))
+        self.assertTrue(np.array_equal(buffer.signals[0], [1, 2, 2, 2, 2, 2]))
+
+    def test_extend_wrong_shape(self):
+        # arrange
+        buffer = SignalBuffer(2)
+
+        # action and check
+        with self.assertRaises(Exception):
+            buffer.extend([1, 2], np.ones((3, 2)))
+
+    def test_views(self):
+        # arrange
+        buffer = SignalBuffer(2)
+        buffer.extend([0, 1, 2], np.zeros((2, 3)))
+
+        # action
+        buffer.signals[0] += 1
+
+        # check
+        self.assertTrue(np.array_equal(buffer.signals[0], [1, 1, 1]))
+
+    def test_replace_signals(self):
+        # arrange
+        buffer = SignalBuffer(4)
+        buffer.extend([0, 1, 2], np.zeros((4, 3)))
+
+        # action
+        buffer.signals = [[1, 2, 3]]
+
+        # check
+        self.assertEqual(buffer.num_channels, 1)
+        self.assertEqual(len(buffer), 3)
+        self.assertTrue(np.array_equal(buffer.timestamps, [0, 1, 2]))
+
+    def test_sliding_window(self):
+        # arrange
+        buffer = SignalBuffer(2, max_size=5)
+
+        # action
+        for i in range(23):
+            buffer.append(i, [i, -i])
+
+        # check
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.evicted, 18)
+        self.assertEqual(buffer.capacity, 10)
+        self.assertTrue(np.array_equal(buffer.timestamps, range(18, 23)))
+        self.assertTrue(np.array_equal(buffer.signals[1], -np.arange(18, 23)))
+
+    def test_sliding_window_extend(self):
+        # arrange
+        buffer = SignalBuffer(1, max_size=4)
+        buffer.extend([0, 1, 2], [[0, 1, 2]])
+
+        # action
+        buffer.extend([3, 4], [[3, 4]])
+        buffer.extend(range(5, 15), [range(5, 15)])
+
+        # check
+        self.assertEqual(buffer.evicted, 11)
+        self.assertEqual(buffer.capacity, 8)
+        self.assertTrue(np.array_equal(buffer.timestamps, [11, 12, 13, 14]))
+        self.assertTrue(np.array_equal(buffer.signals[0], [11, 12, 13, 14]))
+
+    def test_sliding_window_keeps_views(self):
+        # arrange
+        buffer = SignalBuffer(1, max_size=5)
+        for i in range(8):
+            buffer.append(i, [i])
+        view = buffer.signals[0, 1:4]
+
+        # action
+        for i in range(8, 30):
+            buffer.append(i, [i])
+
+        # check
+        self.assertTrue(np.array_equal(view, [4, 5, 6]))
+        self.assertTrue(np.array_equal(buffer.signals[0], range(25, 30)))
+
+    def test_sliding_window_setter_keeps_capacity(self):
+        # arrange
+        buffer = SignalBuffer(2, max_size=5)
+        for i in range(5):
+            buffer.append(i, [i, -i])
+
+        # action
+        buffer.signals = buffer.signals * 2
+        buffer.timestamps = buffer.timestamps + 1
+        buffer.append(6, [12, -12])
+
+        # check
+        self.assertEqual(buffer.capacity, 10)
+        self.assertTrue(np.array_equal(buffer.timestamps, range(2, 7)))
+        self.assertTrue(np.array_equal(buffer.signals[0], [2, 4, 6, 8, 12]))
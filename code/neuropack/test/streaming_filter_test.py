@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+from scipy.signal import sosfilt, sosfilt_zi
+
+from neuropack.devices.base import BCISignal
+from neuropack.preprocessing import (BandpassFilter, HighpassFilter,
+                                     NotchFilter, ReductionFilter,
+                                     StreamingPipeline, StreamingSOSFilter)
+
+
+class StreamingFilterTests(unittest.TestCase):
+    def test_chunks_equal_whole_stream(self):
+        # arrange
+        rng = np.random.default_rng(5)
+        signals = rng.normal(scale=10, size=(4, 2000)) + 100
+        whole = StreamingSOSFilter(BandpassFilter(1, 30, 256), NotchFilter(50, 256))
+        chunked = StreamingSOSFilter(BandpassFilter(1, 30, 256), NotchFilter(50, 256))
+
+        # action
+        expected = whole.process(signals)
+        result = np.hstack([chunked.process(signals[:, i:i + 37])
+                           for i in range(0, 2000, 37)])
+
+        # check
+        self.assertTrue(np.allclose(result, expected))
+
+    def test_steady_state_initialization(self):
+        # arrange
+        filter = HighpassFilter(1, 256)
+        streaming = StreamingSOSFilter(filter)
+        signals = np.full((2, 100), 50.0)
+
+        # action
+        result = streaming.process(signals)
+
+        # check
+        zi = sosfilt_zi(filter.sos)[:, None, :] * signals[None, :, :1]
+        expected, _ = sosfilt(filter.sos, signals, axis=-1, zi=zi)
+        self.assertTrue(np.allclose(result, expected))
+        self.assertTrue(np.allclose(result, 0))
+
+    def test_reset(self):
+        # arrange
+        rng = np.random.default_rng(6)
+        signals = rng.normal(size=(2, 300))
+        streaming = StreamingSOSFilter(HighpassFilter(1, 256))
+        first = streaming.process(signals)
+
+        # action
+        streaming.reset()
+        second = streaming.process(signals)
+
+        # check
+        self.assertTrue(np.array_equal(first, second))
+
+    def test_pipeline_samples(self):
+        # arrange
+        rng = np.random.default_rng(7)
+        signals = rng.normal(size=(3, 50))
+        samples = [BCISignal(i / 256, signals[:, i].tolist()) for i in range(50)]
+        pipeline = StreamingPipeline(HighpassFilter(1, 256), NotchFilter(50, 256))
+        reference = StreamingSOSFilter(HighpassFilter(1, 256), NotchFilter(50, 256))
+
+        # action
+        result = pipeline.process_samples(samples[:20]) + \
+            pipeline.process_samples(samples[20:])
+
+        # check
+        self.assertEqual(len(pipeline.filters), 1)
+        self.assertListEqual([x.timestamp for x in result],
+                             [x.timestamp for x in samples])
+        self.assertTrue(np.allclose(
+            np.array([x.signals for x in result]).T, reference.process(signals)))
+
+    def test_unsupported_filter(self):
+        # action / check
+        with self.assertRaises(Exception):
+            StreamingPipeline(ReductionFilter(("C1", "C2")))
@@ -2,7 +2,7 @@ import unittest
 
 import numpy as np
 
-from neuropack.utils import normalize_npy, osum
+from neuropack.utils import SumMode, normalize_npy, oavg, osum
 
 
 class UtilTests(unittest.TestCase):
@@ -20,6 +20,51 @@ class UtilTests(unittest.TestCase):
         self.assertListEqual(
             np.array([3, 4, 5, 6]).tolist(), calc_sum.tolist())
 
+    def test_osum_modes(self):
+        # arrange
+        array = [np.array([i, 2 * i, 3 * i]) for i in range(100)]
+
+        # action
+        sums = [osum(array, mode) for mode in SumMode]
+
+        # check
+        for s in sums:
+            self.assertListEqual(s.tolist(), [4950, 9900, 14850])
+
+    def test_osum_does_not_modify(self):
+        # arrange
+        array = [np.array([1., 2.]), np.array([3., 4.]), np.array([5., 6.])]
+
+        # action
+        for mode in SumMode:
+            osum(array, mode)
+
+        # check
+        self.assertListEqual(array[0].tolist(), [1., 2.])
+        self.assertListEqual(array[1].tolist(), [3., 4.])
+
+    def test_osum_kahan_precision(self):
+        # arrange
+        array = [1.0] + [1e-16] * 10000
+
+        # action
+        sequential = osum(array)
+        kahan = osum(array, SumMode.Kahan)
+
+        # check
+        self.assertEqual(sequential, 1.0)
+        self.assertAlmostEqual(kahan, 1.0 + 1e-12, places=15)
+
+    def test_oavg_pairwise(self):
+        # arrange
+        array = [np.full(4, i, dtype=float) for i in range(33)]
+
+        # action
+        avg = oavg(array, SumMode.Pairwise)
+
+        # check
+        self.assertListEqual(avg.tolist(), [16.] * 4)
+
     def test_normalize_npy_1(self):
         # arrange
         array = np.array([1, 2, 3, 4])